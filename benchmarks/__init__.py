@@ -0,0 +1,11 @@
+#!/bin/python3
+# -*- coding: utf-8 -*-
+
+"""
+ This file is part of the TangoMan PyHelper package.
+
+ (c) "Matthias Morin" <mat@tangoman.io>
+
+ This source file is subject to the MIT license that is bundled
+ with this source code in the file LICENSE.
+"""
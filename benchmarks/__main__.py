@@ -0,0 +1,83 @@
+#!/bin/python3
+# -*- coding: utf-8 -*-
+
+"""
+ This file is part of the TangoMan PyHelper package.
+
+ (c) "Matthias Morin" <mat@tangoman.io>
+
+ This source file is subject to the MIT license that is bundled
+ with this source code in the file LICENSE.
+"""
+
+from argparse import ArgumentParser
+from datetime import datetime, timezone
+from importlib import import_module
+from json import dumps
+from platform import (platform, python_implementation)
+from sys import (stderr, version)
+from tempfile import TemporaryDirectory
+
+from benchmarks.helpers import measure
+
+MODULES = (
+    'bench_csv',
+    'bench_json',
+    'bench_sqlite',
+    'bench_serializer',
+    'bench_abstract_dto',
+    'bench_abstract_collection',
+    'bench_folder_manager',
+)
+
+
+def main() -> None:
+    """Run benchmark cases at every size, print results as json"""
+    parser = ArgumentParser(prog='python3 -m benchmarks', description='Run pyhelper benchmarks')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000, 100000], help='data sizes')
+    parser.add_argument('--repeat', type=int, default=3, help='runs per case (best time is kept)')
+    parser.add_argument('--filter', default='', help='only run cases whose name starts with given prefix')
+    parser.add_argument('--output', default='', help='write json results to given file instead of stdout')
+    args = parser.parse_args()
+
+    results = []
+    for module in MODULES:
+        cases = import_module('benchmarks.' + module).cases
+        for size in args.sizes:
+            with TemporaryDirectory() as folder:
+                for name, function, setup in cases(size, folder):
+                    if not name.startswith(args.filter):
+                        continue
+                    result = measure(function, args.repeat, setup)
+                    result = {
+                        'name': name,
+                        'size': size,
+                        'seconds': result['seconds'],
+                        'items_per_second': size / result['seconds'] if result['seconds'] else None,
+                        'peak_memory': result['peak_memory'],
+                    }
+                    results.append(result)
+                    # progress goes to stderr so stdout only holds json report
+                    print(f"{name:<40} {size:>9} {result['seconds']:>10.4f}s {result['peak_memory']:>12}B",
+                          file=stderr)
+
+    report = {
+        'date': datetime.now(timezone.utc).isoformat(),
+        'python': version,
+        'implementation': python_implementation(),
+        'platform': platform(),
+        'repeat': args.repeat,
+        'results': results,
+    }
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as file:
+            file.write(dumps(report, indent=2))
+    else:
+        print(dumps(report, indent=2))
+
+
+##################################################
+
+
+if __name__ == '__main__':
+    main()
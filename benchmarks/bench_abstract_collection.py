@@ -0,0 +1,27 @@
+#!/bin/python3
+# -*- coding: utf-8 -*-
+
+"""
+ This file is part of the TangoMan PyHelper package.
+
+ (c) "Matthias Morin" <mat@tangoman.io>
+
+ This source file is subject to the MIT license that is bundled
+ with this source code in the file LICENSE.
+"""
+
+from typing import Iterator, Tuple
+
+from benchmarks.helpers import records, Record
+from pyhelper.abstract_collection import AbstractCollection
+
+
+def cases(size: int, folder: str) -> Iterator[Tuple]:
+    """Yield (name, function, setup) benchmark cases"""
+    objects = [Record(item) for item in records(size)]
+    yield 'abstract_collection.add', lambda: AbstractCollection(objects, 'id'), None
+    yield 'abstract_collection.add.indexed', lambda: AbstractCollection(
+        objects, 'id', {'email': 'hash', 'name': 'sorted'}), None
+    collection = AbstractCollection(objects, 'id', {'email': 'hash'})
+    emails = [object_.email for object_ in objects]
+    yield 'abstract_collection.find', lambda: [collection.find(email=email) for email in emails], None
@@ -0,0 +1,26 @@
+#!/bin/python3
+# -*- coding: utf-8 -*-
+
+"""
+ This file is part of the TangoMan PyHelper package.
+
+ (c) "Matthias Morin" <mat@tangoman.io>
+
+ This source file is subject to the MIT license that is bundled
+ with this source code in the file LICENSE.
+"""
+
+from typing import Iterator, Tuple
+
+from benchmarks.helpers import records, Record, SlottedRecord
+
+
+def cases(size: int, folder: str) -> Iterator[Tuple]:
+    """Yield (name, function, setup) benchmark cases"""
+    data = records(size)
+    for name, class_ in (('abstract_dto', Record), ('abstract_dto.slotted', SlottedRecord)):
+        objects = [class_(item) for item in data]
+        others = [class_(item) for item in data]
+        yield name + '.init', lambda class_=class_: [class_(item) for item in data], None
+        yield name + '.hash', lambda objects=objects: [hash(object_) for object_ in objects], None
+        yield name + '.eq', lambda objects=objects, others=others: [a == b for a, b in zip(objects, others)], None
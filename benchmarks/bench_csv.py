@@ -0,0 +1,31 @@
+#!/bin/python3
+# -*- coding: utf-8 -*-
+
+"""
+ This file is part of the TangoMan PyHelper package.
+
+ (c) "Matthias Morin" <mat@tangoman.io>
+
+ This source file is subject to the MIT license that is bundled
+ with this source code in the file LICENSE.
+"""
+
+from os.path import join
+from typing import Iterator, Tuple
+
+from benchmarks.helpers import records
+from pyhelper import CSV
+
+
+def cases(size: int, folder: str) -> Iterator[Tuple]:
+    """Yield (name, function, setup) benchmark cases"""
+    data = [{key: str(value) for key, value in item.items()} for item in records(size)]
+    file_path = join(folder, 'records.csv')
+    yield 'csv.write', lambda: CSV.write(data, file_path), None
+    CSV.write(data, file_path)
+    yield 'csv.read', lambda: CSV.read(file_path), None
+    yield 'csv.iter_rows', lambda: sum(1 for _ in CSV.iter_rows(file_path)), None
+    yield 'csv.read.schema', lambda: CSV.read(file_path, {'id': 'INTEGER'}), None
+    yield 'csv.read_columns', lambda: CSV.read_columns(file_path, {'id': 'INTEGER'}), None
+    yield 'csv.read_parallel', lambda: sum(len(chunk) for chunk in CSV.read_parallel(file_path)), None
+    yield 'csv.scan.projection', lambda: sum(1 for _ in CSV.scan(file_path, ['email'], {'name': 'name1'})), None
@@ -0,0 +1,30 @@
+#!/bin/python3
+# -*- coding: utf-8 -*-
+
+"""
+ This file is part of the TangoMan PyHelper package.
+
+ (c) "Matthias Morin" <mat@tangoman.io>
+
+ This source file is subject to the MIT license that is bundled
+ with this source code in the file LICENSE.
+"""
+
+from os import makedirs
+from os.path import join
+from typing import Iterator, Tuple
+
+from pyhelper import FolderManager
+
+
+def cases(size: int, folder: str) -> Iterator[Tuple]:
+    """Yield (name, function, setup) benchmark cases"""
+    root = join(folder, 'tree')
+    # synthetic tree: ten files per folder, ten folders per level
+    for index in range(size):
+        path = join(root, *(str(index // 10 ** depth % 10) for depth in range(len(str(size)) - 1, 0, -1)))
+        makedirs(path, exist_ok=True)
+        open(join(path, f'{index}.{"md" if index % 2 else "txt"}'), 'w').close()
+    folder_manager = FolderManager(root)
+    yield 'folder_manager.files', lambda: folder_manager.files(recursive=True), None
+    yield 'folder_manager.walk', lambda: sum(1 for _ in folder_manager.walk('.md')), None
@@ -0,0 +1,30 @@
+#!/bin/python3
+# -*- coding: utf-8 -*-
+
+"""
+ This file is part of the TangoMan PyHelper package.
+
+ (c) "Matthias Morin" <mat@tangoman.io>
+
+ This source file is subject to the MIT license that is bundled
+ with this source code in the file LICENSE.
+"""
+
+from os.path import join
+from typing import Iterator, Tuple
+
+from benchmarks.helpers import records
+from pyhelper import Json
+
+
+def cases(size: int, folder: str) -> Iterator[Tuple]:
+    """Yield (name, function, setup) benchmark cases"""
+    data = records(size)
+    file_path = join(folder, 'records.json')
+    lines_path = join(folder, 'records.jsonl')
+    yield 'json.write', lambda: Json.write(data, file_path), None
+    Json.write(data, file_path)
+    yield 'json.read', lambda: Json.read(file_path), None
+    yield 'json.write_lines', lambda: Json.write_lines(data, lines_path), None
+    Json.write_lines(data, lines_path)
+    yield 'json.iter_lines', lambda: sum(1 for _ in Json.iter_lines(lines_path)), None
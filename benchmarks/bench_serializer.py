@@ -0,0 +1,50 @@
+#!/bin/python3
+# -*- coding: utf-8 -*-
+
+"""
+ This file is part of the TangoMan PyHelper package.
+
+ (c) "Matthias Morin" <mat@tangoman.io>
+
+ This source file is subject to the MIT license that is bundled
+ with this source code in the file LICENSE.
+"""
+
+from typing import Iterator, Tuple
+
+from benchmarks.helpers import records, Record
+from pyhelper import Serializer
+
+
+def cases(size: int, folder: str) -> Iterator[Tuple]:
+    """Yield (name, function, setup) benchmark cases"""
+    data = records(size)
+    objects = [Record(item) for item in data]
+
+    def normalize():
+        for object_ in objects:
+            Serializer(object_).normalize()
+
+    def denormalize():
+        for object_, item in zip(objects, data):
+            Serializer(object_).denormalize(item)
+
+    def normalize_compiled():
+        for object_ in objects:
+            Serializer(object_, compiled=True).normalize()
+
+    def denormalize_compiled():
+        for object_, item in zip(objects, data):
+            Serializer(object_, compiled=True).denormalize(item)
+
+    yield 'serializer.normalize', normalize, None
+    yield 'serializer.denormalize', denormalize, None
+    yield 'serializer.normalize.compiled', normalize_compiled, None
+    yield 'serializer.denormalize.compiled', denormalize_compiled, None
+    yield 'serializer.serialize_many', lambda: Serializer.serialize_many(objects), None
+    string = Serializer.serialize_many(objects)
+    yield 'serializer.deserialize_many', lambda: Serializer.deserialize_many(string, Record), None
+    yield 'serializer.serialize_many.msgpack', lambda: Serializer.serialize_many(objects, format='msgpack'), None
+    packed = Serializer.serialize_many(objects, format='msgpack')
+    yield 'serializer.deserialize_many.msgpack', \
+        lambda: Serializer.deserialize_many(packed, Record, format='msgpack'), None
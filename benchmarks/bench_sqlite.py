@@ -0,0 +1,52 @@
+#!/bin/python3
+# -*- coding: utf-8 -*-
+
+"""
+ This file is part of the TangoMan PyHelper package.
+
+ (c) "Matthias Morin" <mat@tangoman.io>
+
+ This source file is subject to the MIT license that is bundled
+ with this source code in the file LICENSE.
+"""
+
+from typing import Iterator, Tuple
+
+from benchmarks.helpers import records
+from pyhelper import Sqlite
+
+SCHEMA = {
+    'id': 'INTEGER NOT NULL PRIMARY KEY',
+    'name': 'TEXT',
+    'email': 'TEXT'
+}
+
+
+def cases(size: int, folder: str) -> Iterator[Tuple]:
+    """Yield (name, function, setup) benchmark cases"""
+    data = records(size)
+    state = {}
+
+    def setup():
+        if state.get('db') is not None:
+            state['db'].close()
+        state['db'] = Sqlite()
+        state['db'].create('records', SCHEMA)
+
+    def insert():
+        for item in data:
+            state['db'].insert('records', item)
+
+    def find():
+        for index in range(size):
+            state['db'].find('records', {'id': index})
+
+    yield 'sqlite.insert', insert, setup
+    yield 'sqlite.insert_many', lambda: state['db'].insert_many('records', data), setup
+    setup()
+    state['db'].insert_many('records', data)
+    yield 'sqlite.find', find, None
+    yield 'sqlite.upsert_many', lambda: state['db'].upsert_many('records', data, 'id'), None
+    yield 'sqlite.delete_many', lambda: state['db'].delete_many('records', 'id', range(size)), \
+        lambda: (setup(), state['db'].insert_many('records', data))
+    state['db'].close()
@@ -0,0 +1,126 @@
+#!/bin/python3
+# -*- coding: utf-8 -*-
+
+"""
+ This file is part of the TangoMan PyHelper package.
+
+ (c) "Matthias Morin" <mat@tangoman.io>
+
+ This source file is subject to the MIT license that is bundled
+ with this source code in the file LICENSE.
+"""
+
+from gc import collect
+from time import perf_counter
+from tracemalloc import (start, stop, get_traced_memory, is_tracing)
+from typing import Callable, Optional
+
+from pyhelper.abstract_dto import AbstractDTO, DTOMeta
+
+
+def measure(function: Callable, repeat: int = 3, setup: Optional[Callable] = None) -> dict:
+    """Return best wall time over "repeat" runs and peak traced memory of one extra run
+    NOTE: setup (when given) runs before every run and is excluded from measures
+    """
+    best = None
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        collect()
+        begin = perf_counter()
+        function()
+        elapsed = perf_counter() - begin
+        if best is None or elapsed < best:
+            best = elapsed
+    # tracemalloc slows allocations down: peak memory is measured on a separate run
+    if setup is not None:
+        setup()
+    collect()
+    tracing = is_tracing()
+    if not tracing:
+        start()
+    function()
+    current, peak = get_traced_memory()
+    if not tracing:
+        stop()
+    return {'seconds': best, 'peak_memory': peak}
+
+
+##################################################
+
+
+def records(size: int) -> list:
+    """Return synthetic records"""
+    return [{'id': index, 'name': f'name{index}', 'email': f'user{index}@example.com'} for index in range(size)]
+
+
+##################################################
+
+
+class Record(AbstractDTO):
+    """Dynamic DTO fixture"""
+
+    def __init__(self, dictionary: dict = None) -> None:
+        self._id = None
+        self._name = None
+        self._email = None
+        super().__init__(dictionary)
+
+    @property
+    def id(self):
+        return self._id
+
+    @id.setter
+    def id(self, id_):
+        self._id = id_
+
+    @property
+    def name(self):
+        return self._name
+
+    @name.setter
+    def name(self, name_):
+        self._name = name_
+
+    @property
+    def email(self):
+        return self._email
+
+    @email.setter
+    def email(self, email_):
+        self._email = email_
+
+
+class SlottedRecord(AbstractDTO, metaclass=DTOMeta):
+    """Compiled DTO fixture"""
+    __fields__ = ('id', 'name', 'email')
+
+    def __init__(self, dictionary: dict = None) -> None:
+        self._id = None
+        self._name = None
+        self._email = None
+        super().__init__(dictionary)
+
+    @property
+    def id(self):
+        return self._id
+
+    @id.setter
+    def id(self, id_):
+        self._id = id_
+
+    @property
+    def name(self):
+        return self._name
+
+    @name.setter
+    def name(self, name_):
+        self._name = name_
+
+    @property
+    def email(self):
+        return self._email
+
+    @email.setter
+    def email(self, email_):
+        self._email = email_
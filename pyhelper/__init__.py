@@ -8,10 +8,15 @@
 """
 
 from pyhelper.annotations import Annotations
+from pyhelper.async_session import AsyncSession
+from pyhelper.compression import Compression
 from pyhelper.csv import CSV
+from pyhelper.csv_writer import CSVWriter
 from pyhelper.folder_manager import FolderManager
 from pyhelper.json import Json
+from pyhelper.message_pack import MessagePack
 from pyhelper.renamer import Renamer
 from pyhelper.serializer import Serializer
 from pyhelper.session import Session
 from pyhelper.sqlite import Sqlite
+from pyhelper.sqlite_pool import SqlitePool
@@ -10,6 +10,7 @@
  with this source code in the file LICENSE.
 """
 
+from bisect import (bisect_left, bisect_right, insort)
 from typing import Any
 
 
@@ -21,14 +22,17 @@ class AbstractCollection:
 
     - add: Append item to collection or update existing item
     - update: Merge values from current item with updated values when not empty
+    - find: Return items matching every given field value, using secondary indexes when available
+    - range: Return items with field value between bounds (inclusive), using sorted index when available
+    - reindex: Rebuild secondary indexes (required after items were modified outside the collection)
 
     Constructor
     -----------
-    - __init__: Build collection from list and set index
+    - __init__: Build collection from list and set index (and optional secondary indexes)
     NOTE: Remember to pass on "dictionary" parameter with "super()" syntax when required
     ```
     def __init__(self, items: list = None) -> None:
-        super().__init__(items, 'unique_field')
+        super().__init__(items, 'unique_field', {'email': 'hash', 'created_at': 'sorted'})
     ```
 
     Dunders
@@ -37,18 +41,39 @@ class AbstractCollection:
     - __len__:  Return property count
     """
 
+    INDEX_TYPES = (
+        'hash',
+        'sorted'
+    )
+
     ##################################################
     # Constructor
     ##################################################
 
-    def __init__(self, items: list = None, index: str = None) -> None:
+    def __init__(self, items: list = None, index: str = None, indexes: dict = None) -> None:
         """Build collection from list and set index"""
         if not isinstance(items, list):
             raise TypeError(f'{self.__class__.__name__} items must be set to list, {type(items)} given')
         if not isinstance(index, str):
             raise TypeError(f'{self.__class__.__name__} index must be set to str, {type(index)} given')
+        if indexes is None:
+            indexes = {}
+        if not isinstance(indexes, dict):
+            raise TypeError(f'{self.__class__.__name__} indexes must be set to dict, {type(indexes)} given')
+        for field, type_ in indexes.items():
+            if not isinstance(field, str):
+                raise TypeError(f'{self.__class__.__name__} indexes field must be set to str, {type(field)} given')
+            if type_ not in self.INDEX_TYPES:
+                raise ValueError(f'{self.__class__.__name__} indexes type must be one of {self.INDEX_TYPES}')
         self._index = index
         self._items = {}
+        # secondary indexes: {field: {value: set of primary keys}}
+        self._indexes = {field: {} for field in indexes}
+        # indexed values per item: {primary key: {field: value}} (unindexed from this record, not from live item)
+        self._indexed = {}
+        # sorted indexes: {field: sorted distinct values}, kept sorted on add/remove,
+        # set to None by "reindex" (sorted again on next "range")
+        self._sorted = {field: [] for field, type_ in indexes.items() if type_ == 'sorted'}
         for item in items:
             self.add(item)
 
@@ -73,6 +98,7 @@ class AbstractCollection:
             raise KeyError(f'{item.__class__.__name__} has no attribute "{self._index}"')
         if self._items.get(index_) is None:
             self._items[index_] = item
+            self._index_item(index_, item)
         else:
             self.update(item)
 
@@ -85,9 +111,10 @@ class AbstractCollection:
         except KeyError:
             raise KeyError(f'{item.__class__.__name__} has no attribute "{self._index}"')
         try:
-            del (self._items[index_])
+            self._items.pop(index_)
         except KeyError:
             raise KeyError(f'{self.__class__.__name__}.remove "{index_}" not found')
+        self._unindex_item(index_)
 
     ##################################################
 
@@ -106,6 +133,116 @@ class AbstractCollection:
                 if value is None:
                     item.__setattr__(key, current_item.__getattribute__(key))
             self._items[index_] = item
+        # re-index when indexed values changed (including current item modified in place)
+        if self._indexes and self._indexed.get(index_) != self._indexed_values(item):
+            self._unindex_item(index_)
+            self._index_item(index_, item)
+
+    ##################################################
+    # query methods
+    ##################################################
+
+    def find(self, **criteria: Any) -> list:
+        """Return items matching every given field value, intersecting secondary indexes when available"""
+        if not criteria:
+            return list(self._items.values())
+        if self._index in criteria:
+            item = self._items.get(criteria[self._index])
+            candidates = [] if item is None else [item]
+        else:
+            keys = None
+            # intersect smallest index buckets first
+            buckets = sorted((self._indexes[field].get(value, set()) for field, value in criteria.items()
+                              if field in self._indexes), key=len)
+            for bucket in buckets:
+                keys = set(bucket) if keys is None else keys.intersection(bucket)
+                if not keys:
+                    return []
+            candidates = self._items.values() if keys is None else [self._items[key] for key in keys]
+        return [item for item in candidates
+                if all(item.__getattribute__(field) == value for field, value in criteria.items())]
+
+    ##################################################
+
+    def range(self, field: str, lo: Any = None, hi: Any = None) -> list:
+        """Return items with field value between lo and hi (inclusive, None for unbounded) ordered by value"""
+        if not isinstance(field, str):
+            raise TypeError(f'{self.__class__.__name__}.range field must be set to str, {type(field)} given')
+        if field not in self._sorted:
+            # no sorted index: linear scan
+            matches = []
+            for item in self._items.values():
+                value = item.__getattribute__(field)
+                if value is not None and (lo is None or value >= lo) and (hi is None or value <= hi):
+                    matches.append((value, item))
+            matches.sort(key=lambda match: match[0])
+            return [item for value, item in matches]
+        values = self._sorted[field]
+        if values is None:
+            values = self._sorted[field] = sorted(value for value in self._indexes[field] if value is not None)
+        start = 0 if lo is None else bisect_left(values, lo)
+        stop = len(values) if hi is None else bisect_right(values, hi)
+        index = self._indexes[field]
+        return [self._items[key] for value in values[start:stop] for key in index[value]]
+
+    ##################################################
+
+    def reindex(self) -> None:
+        """Rebuild secondary indexes from current items"""
+        for field in self._indexes:
+            self._indexes[field] = {}
+        for field in self._sorted:
+            self._sorted[field] = None
+        self._indexed = {}
+        for index_, item in self._items.items():
+            self._index_item(index_, item)
+
+    ##################################################
+
+    def _indexed_values(self, item: Any) -> dict:
+        """Return item current values of indexed fields"""
+        return {field: item.__getattribute__(field) for field in self._indexes}
+
+    ##################################################
+
+    def _index_item(self, index_: Any, item: Any) -> None:
+        """Add item primary key to secondary indexes, and record indexed values"""
+        if not self._indexes:
+            return
+        record = self._indexed[index_] = self._indexed_values(item)
+        for field, value in record.items():
+            index = self._indexes[field]
+            keys = index.get(value)
+            if keys is None:
+                index[value] = {index_}
+                # new distinct value: insert into sorted index
+                values = self._sorted.get(field)
+                if values is not None and value is not None:
+                    insort(values, value)
+            else:
+                keys.add(index_)
+
+    ##################################################
+
+    def _unindex_item(self, index_: Any) -> None:
+        """Remove primary key from secondary indexes, using recorded values"""
+        record = self._indexed.pop(index_, None)
+        if record is None:
+            return
+        for field, value in record.items():
+            index = self._indexes[field]
+            keys = index.get(value)
+            if keys is None:
+                continue
+            keys.discard(index_)
+            if not keys:
+                del index[value]
+                # last item with this value: remove from sorted index
+                values = self._sorted.get(field)
+                if values is not None and value is not None:
+                    position = bisect_left(values, value)
+                    if position < len(values) and values[position] == value:
+                        del values[position]
 
     ##################################################
 
@@ -11,8 +11,104 @@
 """
 
 from json import (dumps)
+from operator import attrgetter
 from typing import Any
 
+from pyhelper.annotations import Annotations
+
+
+class DTOMeta(type):
+    """
+    DTO Metaclass
+    =============
+
+    Compile AbstractDTO subclasses declaring their fields once with "__fields__":
+    - __slots__:      "_<field>" backing attributes (no per instance __dict__)
+    - __properties__: declared fields, sorted like "dir()" would
+    - __bool__, __eq__, __hash__, __iter__, __len__: read fields through a precompiled getter
+    NOTE: fields must be public properties, setters (and their validation) are kept as is
+    NOTE: every base class but "object" must declare "__slots__" (otherwise instances get a __dict__)
+    ```
+    class FooBar(AbstractDTO, metaclass=DTOMeta):
+        __fields__ = ('foo', 'bar')
+
+        def __init__(self, dictionary: dict = None) -> None:
+            self._foo = None
+            self._bar = None
+            super().__init__(dictionary)
+    ```
+    """
+
+    def __new__(mcs, name: str, bases: tuple, namespace: dict) -> type:
+        fields = namespace.get('__fields__')
+        if fields is None:
+            return super().__new__(mcs, name, bases, namespace)
+        if isinstance(fields, str) or not all(isinstance(field, str) for field in fields):
+            raise TypeError(f'{name}.__fields__ must be set to a tuple of strings')
+        for base in bases:
+            for class_ in base.__mro__:
+                if class_ is not object and '__slots__' not in class_.__dict__:
+                    raise TypeError(f'{name} base {class_.__name__} must declare __slots__')
+        inherited = set()
+        for base in bases:
+            inherited.update(getattr(base, '__fields__', ()))
+        fields = tuple(sorted(set(fields).union(inherited)))
+        if '__slots__' not in namespace:
+            namespace['__slots__'] = tuple('_' + field for field in fields if field not in inherited)
+        namespace['__fields__'] = fields
+        class_ = super().__new__(mcs, name, bases, namespace)
+        for field in fields:
+            if not isinstance(getattr(class_, field, None), property):
+                raise AttributeError(f'{name}.__fields__ "{field}" must be a property')
+        mcs._compile(class_, fields, namespace)
+        return class_
+
+    ##################################################
+
+    @staticmethod
+    def _compile(class_: type, fields: tuple, namespace: dict) -> None:
+        """Install dunders reading declared fields (unless defined in class body)"""
+        if len(fields) == 1:
+            getter_ = attrgetter(fields[0])
+
+            def values(self):
+                return getter_(self),
+        else:
+            values = attrgetter(*fields)
+
+        def __properties__(self) -> list:
+            return list(fields)
+
+        def __bool__(self) -> bool:
+            for value in values(self):
+                if value is None:
+                    return False
+            return True
+
+        def __eq__(self, other: Any) -> bool:
+            return isinstance(other, type(self)) and values(self) == values(other)
+
+        def __hash__(self) -> int:
+            return hash(values(self))
+
+        def __iter__(self) -> Any:
+            return zip(fields, values(self))
+
+        def __len__(self) -> int:
+            return len(fields)
+
+        compiled = {
+            '__properties__': property(__properties__, doc='Return object public properties name'),
+            '__bool__': __bool__,
+            '__eq__': __eq__,
+            '__hash__': __hash__,
+            '__iter__': __iter__,
+            '__len__': __len__,
+        }
+        for name, member in compiled.items():
+            if name not in namespace:
+                setattr(class_, name, member)
+
 
 class AbstractDTO:
     """
@@ -34,6 +130,10 @@ class AbstractDTO:
     -----------------
     - __properties__: Return object public properties
 
+    Compiled DTO
+    ------------
+    Declare "__fields__" with "metaclass=DTOMeta" to get slots and precompiled dunders (see: DTOMeta)
+
     Constructor
     -----------
     - __init__: Hydrate object when given dictionary
@@ -46,6 +146,8 @@ class AbstractDTO:
     ```
     """
 
+    __slots__ = ()
+
     ##################################################
     # Constructor
     ##################################################
@@ -58,8 +160,9 @@ class AbstractDTO:
             if dictionary == {}:
                 raise ValueError(f'{self.__class__.__name__}.__init__: dictionary cannot be empty')
             # dictionary keys must match object properties
+            properties = self.__properties__
             for property_ in dictionary.keys():
-                if property_ not in self.__properties__:
+                if property_ not in properties:
                     raise AttributeError(f'{self.__class__.__name__} has no attribute {property_}')
             # setting given attributes from dictionary (using appropriate setters)
             for key_, value_ in dictionary.items():
@@ -72,7 +175,7 @@ class AbstractDTO:
     @property
     def __properties__(self) -> list:
         """Return object public properties name"""
-        return [name for name in dir(self) if not name.startswith('_') and not callable(self.__getattribute__(name))]
+        return Annotations(self).get_properties
 
     ##################################################
     # Dunders / Built in Functions
@@ -11,8 +11,10 @@
  with this source code in the file LICENSE.
 """
 
+from inspect import getattr_static
 from platform import python_version
-from typing import Any
+from typing import Any, Optional
+from weakref import WeakKeyDictionary
 
 if python_version()[0:3] < '3.7':
     print('\033[93m[!] Make sure you have Python 3.7+ installed, quitting.\n\n \033[0m')
@@ -27,8 +29,15 @@ class Annotations:
     - get_methods:     Return object public and protected methods name
     - get_static:      Return all class members statically
     - get_annotations: Return class members annotations
+    - clear_cache:     Drop cached introspection tables
+
+    NOTE: class members are introspected once per class and cached (keyed by type),
+    only public attributes set on the instance itself are looked up on every call
     """
 
+    # introspection tables per class: {type: {'properties': tuple, 'methods': tuple, ...}}
+    _CACHE = WeakKeyDictionary()
+
     ##################################################
     # Constructor
     ##################################################
@@ -43,8 +52,11 @@ class Annotations:
     @property
     def get_properties(self) -> list:
         """Return object public properties name"""
-        return [name for name in dir(self._object) if
-                not name.startswith('_') and not callable(self._object.__getattribute__(name))]
+        properties = self._table()['properties']
+        extra = self._instance_members(callable_=False)
+        if extra:
+            return sorted(set(properties).union(extra))
+        return list(properties)
 
     ##################################################
     # Get Methods
@@ -53,8 +65,11 @@ class Annotations:
     @property
     def get_methods(self) -> list:
         """Return object public and protected methods name"""
-        return [name for name in dir(self._object) if
-                not name.startswith('__') and callable(self._object.__getattribute__(name))]
+        methods = self._table()['methods']
+        extra = self._instance_members(callable_=True)
+        if extra:
+            return sorted(set(methods).union(extra))
+        return list(methods)
 
     ##################################################
     # Get Static
@@ -63,6 +78,89 @@ class Annotations:
     @property
     def get_static(self) -> dict:
         """Return object members statically"""
+        if not self._instance_members():
+            table = self._table()
+            if table.get('static') is None:
+                table['static'] = self._static()
+            return dict(table['static'])
+        return self._static()
+
+    ##################################################
+    # Get Annotations
+    ##################################################
+
+    @property
+    def get_annotations(self) -> dict:
+        """Return object members annotations"""
+        if not self._instance_members():
+            table = self._table()
+            if table.get('annotations') is None:
+                table['annotations'] = self._annotations()
+            return dict(table['annotations'])
+        return self._annotations()
+
+    ##################################################
+    # Cache
+    ##################################################
+
+    @classmethod
+    def clear_cache(cls, class_: Optional[type] = None) -> None:
+        """Drop cached introspection tables for given class (or every class), and serializer plans built on them"""
+        # imported here: serializer depends on annotations
+        from pyhelper.serializer import Serializer
+        if class_ is None:
+            cls._CACHE.clear()
+        else:
+            cls._CACHE.pop(class_, None)
+        Serializer.clear_cache(class_)
+
+    ##################################################
+
+    def _table(self) -> dict:
+        """Return cached class members table, build it on first access"""
+        class_ = type(self._object)
+        try:
+            return self._CACHE[class_]
+        except KeyError:
+            pass
+        properties = []
+        methods = []
+        for name in dir(class_):
+            if name.startswith('__'):
+                continue
+            member = getattr_static(class_, name)
+            if isinstance(member, property):
+                is_callable = False
+            elif isinstance(member, (staticmethod, classmethod)):
+                is_callable = True
+            else:
+                is_callable = callable(member)
+            if is_callable:
+                methods.append(name)
+            elif not name.startswith('_'):
+                properties.append(name)
+        table = {'properties': tuple(properties), 'methods': tuple(methods), 'static': None, 'annotations': None}
+        self._CACHE[class_] = table
+        return table
+
+    ##################################################
+
+    def _instance_members(self, callable_: Optional[bool] = None) -> list:
+        """Return public attributes set on the instance itself (not cached)"""
+        try:
+            attributes = vars(self._object)
+        except TypeError:
+            return []
+        if callable_ is None:
+            return [name for name in attributes if not name.startswith('_')]
+        if callable_:
+            return [name for name, value in attributes.items() if not name.startswith('__') and callable(value)]
+        return [name for name, value in attributes.items() if not name.startswith('_') and not callable(value)]
+
+    ##################################################
+
+    def _static(self) -> dict:
+        """Build object members dictionary statically"""
         members = {}
         for property_ in self.get_properties:
             members[property_] = type.__getattribute__(type(self._object), property_)
@@ -71,12 +169,9 @@ class Annotations:
         return members
 
     ##################################################
-    # Get Annotations
-    ##################################################
 
-    @property
-    def get_annotations(self) -> dict:
-        """Return object members annotations"""
+    def _annotations(self) -> dict:
+        """Build object members annotations dictionary"""
         annotations = {}
         for property_ in self.get_properties:
             annotations[property_] = {
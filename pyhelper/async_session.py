@@ -0,0 +1,177 @@
+#!/bin/python3
+# -*- coding: utf-8 -*-
+
+"""
+ This file is part of the TangoMan PyHelper package.
+
+ (c) "Matthias Morin" <mat@tangoman.io>
+
+ This source file is subject to the MIT license that is bundled
+ with this source code in the file LICENSE.
+"""
+
+from asyncio import (Semaphore, TimeoutError, ensure_future, wait, FIRST_COMPLETED)
+from collections import deque
+from itertools import islice
+from random import choice
+from typing import AsyncIterator, Iterable, Optional, Tuple
+
+from aiohttp import (ClientError, ClientResponse, ClientSession, ClientTimeout, TCPConnector)
+from aiohttp_socks import ProxyConnector
+
+from pyhelper.session import Session
+
+
+class AsyncSession:
+    """
+    Create an asyncio session and send requests spoofing UserAgent with optional Tor network
+    NOTE: use as an async context manager (or call "close") to release connections
+    ```
+    async with AsyncSession(concurrency=500) as session:
+        async for uri, response in session.send_requests(uris):
+            print(uri, response.status)
+    ```
+    """
+
+    USER_AGENTS = Session.USER_AGENTS
+
+    ##################################################
+    # Constructor
+    ##################################################
+
+    def __init__(self, tor: bool = False, concurrency: int = 100):
+        if not isinstance(tor, bool):
+            raise TypeError('tor must be set to a boolean')
+        if isinstance(concurrency, bool) or not isinstance(concurrency, int):
+            raise TypeError('concurrency must be set to a integer')
+        if concurrency < 1:
+            raise ValueError('concurrency must be positive integer')
+        self.tor = tor
+        self.concurrency = concurrency
+        self.session = None
+        self._semaphore = None
+
+    ##################################################
+
+    async def __aenter__(self) -> 'AsyncSession':
+        await self.open()
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.close()
+
+    ##################################################
+
+    async def open(self) -> None:
+        """
+        open: create underlying aiohttp session (must be called from a running event loop)
+        """
+        if self.session is not None and not self.session.closed:
+            return
+        if self.tor:
+            connector = ProxyConnector.from_url('socks5://localhost:9050', rdns=True, limit=self.concurrency)
+        else:
+            connector = TCPConnector(limit=self.concurrency)
+        self.session = ClientSession(connector=connector)
+        self._semaphore = Semaphore(self.concurrency)
+
+    ##################################################
+
+    async def close(self) -> None:
+        """
+        close
+        """
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+
+    ##################################################
+
+    def get_random_user_agent(self):
+        """
+        get_random_user_agent
+        """
+        return choice(self.USER_AGENTS)
+
+    ##################################################
+
+    async def send_request(self, uri, user_agents: list = [], timeout: int = 5,
+                           allow_redirects: bool = True) -> Optional[ClientResponse]:
+        """
+        send_request: return response with body already read (None on network error)
+        """
+        if uri != '' and not isinstance(uri, str):
+            raise TypeError('uri must be set to a string')
+        if not isinstance(user_agents, list):
+            raise TypeError('user_agents must be set to a list')
+        if isinstance(timeout, bool) or not isinstance(timeout, int):
+            raise TypeError('timeout must be set to a integer')
+        if not isinstance(allow_redirects, bool):
+            raise TypeError('allow_redirects must be set to a boolean')
+        if not uri:
+            raise ValueError('uri cannot be empty')
+        if not user_agents:
+            user_agents = self.USER_AGENTS
+        if timeout < 0:
+            raise ValueError('timeout must be positive integer')
+        await self.open()
+        headers = {'User-Agent': choice(user_agents)}
+        response = None
+        async with self._semaphore:
+            try:
+                async with self.session.get(uri, headers=headers, timeout=ClientTimeout(total=timeout),
+                                            allow_redirects=allow_redirects) as response:
+                    # read body before connection is released so "text()" and "json()" remain available
+                    await response.read()
+            except (ClientError, TimeoutError):
+                response = None
+        return response
+
+    ##################################################
+
+    async def send_requests(self, uris: Iterable[str], ordered: bool = False, user_agents: list = [],
+                            timeout: int = 5, allow_redirects: bool = True) -> AsyncIterator[Tuple]:
+        """
+        send_requests: yield (uri, response) tuples in completion order (or input order when ordered)
+        NOTE: at most "concurrency * 2" requests are scheduled at once so uris can be a lazy iterable
+        """
+        if isinstance(uris, (str, bytes)) or not isinstance(uris, Iterable):
+            raise TypeError('uris must be set to an iterable of strings')
+        if not isinstance(ordered, bool):
+            raise TypeError('ordered must be set to a boolean')
+        await self.open()
+        uris = iter(uris)
+        tasks = {}
+
+        def schedule(uri):
+            task = ensure_future(self.send_request(uri, user_agents, timeout, allow_redirects))
+            tasks[task] = uri
+            return task
+
+        try:
+            if ordered:
+                pending = deque(schedule(uri) for uri in islice(uris, self.concurrency * 2))
+                while pending:
+                    task = pending.popleft()
+                    response = await task
+                    yield tasks.pop(task), response
+                    for uri in islice(uris, 1):
+                        pending.append(schedule(uri))
+            else:
+                pending = set(schedule(uri) for uri in islice(uris, self.concurrency * 2))
+                while pending:
+                    done, pending = await wait(pending, return_when=FIRST_COMPLETED)
+                    for task in done:
+                        yield tasks.pop(task), task.result()
+                    pending.update(schedule(uri) for uri in islice(uris, len(done)))
+        finally:
+            # cancel scheduled requests when consumer stops early
+            for task in tasks:
+                task.cancel()
+
+
+##################################################
+
+
+if __name__ == '__main__':
+    pass
@@ -0,0 +1,243 @@
+#!/bin/python3
+# -*- coding: utf-8 -*-
+
+"""
+ This file is part of the TangoMan PyHelper package.
+
+ (c) "Matthias Morin" <mat@tangoman.io>
+
+ This source file is subject to the MIT license that is bundled
+ with this source code in the file LICENSE.
+"""
+
+import bz2
+import gzip
+import lzma
+import re
+from contextlib import contextmanager
+from io import TextIOWrapper
+from os import (O_CREAT, O_EXCL, O_RDONLY, O_WRONLY, chmod, close, fsync, open as os_open, replace, stat, unlink)
+from os.path import (abspath, basename, dirname, isfile, join)
+from secrets import token_hex
+from typing import IO, Iterator, Optional, Tuple
+
+try:
+    import zstandard
+except ImportError:
+    # optional: only required by ".zst" files
+    zstandard = None
+
+
+class Compression:
+    """
+    Open plain or compressed text files with streaming codecs (gzip, bz2, xz, zstd)
+    Codec is detected from magic bytes when file exists, from extension otherwise
+    NOTE: zstd requires "zstandard" package
+    https://docs.python.org/3/library/archiving.html
+    ```
+    with Compression.open('rows.csv.gz', 'w', level=6) as file:
+        file.write('id,name\\n')
+    ```
+
+    Atomic writes
+    -------------
+    "atomic_open" writes to a temporary file in target folder, then fsync and rename it over target,
+    so readers only ever see the previous or the complete new file
+    """
+
+    EXTENSIONS = {
+        '.gz': 'gzip',
+        '.bz2': 'bz2',
+        '.xz': 'xz',
+        '.zst': 'zstd',
+    }
+
+    # file header patterns (bz2: "BZh" + block size + block magic, or end of stream magic for empty streams)
+    MAGIC_BYTES = {
+        re.compile(rb'\x1f\x8b'): 'gzip',
+        re.compile(rb'BZh[1-9](?:1AY&SY|\x17rE8P\x90)'): 'bz2',
+        re.compile(rb'\xfd7zXZ\x00'): 'xz',
+        re.compile(rb'\x28\xb5\x2f\xfd'): 'zstd',
+    }
+
+    ##################################################
+
+    @staticmethod
+    def detect(file_path: str) -> Optional[str]:
+        """
+        detect: return codec name (None for plain files)
+        """
+        if not isinstance(file_path, str):
+            raise TypeError('file_path must be set to a string')
+        if not file_path:
+            raise ValueError('file_path cannot be empty')
+        if isfile(file_path):
+            with open(file_path, 'rb') as file:
+                head = file.read(10)
+            for magic, codec in Compression.MAGIC_BYTES.items():
+                if magic.match(head):
+                    return codec
+            return None
+        for extension, codec in Compression.EXTENSIONS.items():
+            if file_path.endswith(extension):
+                return codec
+        return None
+
+    ##################################################
+
+    @staticmethod
+    def open(file_path: str, mode: str = 'r', level: Optional[int] = None, threads: Optional[int] = None,
+             newline: Optional[str] = None, codec: Optional[str] = None, buffering: int = -1) -> IO:
+        """
+        open: return utf-8 text stream, (de)compressing on the fly
+        NOTE: "level" is the codec compression level (preset for xz), "threads" is only used by zstd,
+              "buffering" is only used by plain files
+        """
+        if not isinstance(file_path, str):
+            raise TypeError('file_path must be set to a string')
+        if mode not in ('r', 'w', 'a'):
+            raise ValueError('mode must be one of "r", "w", "a"')
+        if level is not None and (isinstance(level, bool) or not isinstance(level, int)):
+            raise TypeError('level must be set to an integer')
+        if threads is not None and (isinstance(threads, bool) or not isinstance(threads, int)):
+            raise TypeError('threads must be set to an integer')
+        if codec is not None and codec not in Compression.EXTENSIONS.values():
+            raise ValueError(f'codec must be one of {tuple(Compression.EXTENSIONS.values())}')
+        if not file_path:
+            raise ValueError('file_path cannot be empty')
+        if codec is None:
+            if mode == 'w':
+                # target will be overwritten: trust extension
+                codec = next((value for key, value in Compression.EXTENSIONS.items() if file_path.endswith(key)), None)
+            else:
+                codec = Compression.detect(file_path)
+        text_mode = mode + 't'
+        if codec is None:
+            return open(file_path, mode, buffering=buffering, encoding='utf-8', newline=newline)
+        if codec == 'gzip':
+            return gzip.open(file_path, text_mode, compresslevel=9 if level is None else level,
+                             encoding='utf-8', newline=newline)
+        if codec == 'bz2':
+            return bz2.open(file_path, text_mode, compresslevel=9 if level is None else level,
+                            encoding='utf-8', newline=newline)
+        if codec == 'xz':
+            return lzma.open(file_path, text_mode, preset=None if mode == 'r' else level,
+                             encoding='utf-8', newline=newline)
+        if zstandard is None:
+            raise ImportError('zstandard package is required to open zstd files')
+        compressor = None
+        if mode != 'r':
+            compressor = zstandard.ZstdCompressor(level=3 if level is None else level, threads=threads or 0)
+        return zstandard.open(file_path, text_mode, cctx=compressor, encoding='utf-8', newline=newline)
+
+    ##################################################
+
+    @staticmethod
+    @contextmanager
+    def atomic_open(file_path: str, level: Optional[int] = None, threads: Optional[int] = None,
+                    newline: Optional[str] = None, codec: Optional[str] = None,
+                    buffering: int = -1) -> Iterator[IO]:
+        """
+        atomic_open: yield utf-8 text stream replacing file_path on success (temporary file is removed on error)
+        NOTE: "buffering" sets raw file buffer size, compressed by file extension unless codec is given
+        """
+        if not isinstance(file_path, str):
+            raise TypeError('file_path must be set to a string')
+        if level is not None and (isinstance(level, bool) or not isinstance(level, int)):
+            raise TypeError('level must be set to an integer')
+        if threads is not None and (isinstance(threads, bool) or not isinstance(threads, int)):
+            raise TypeError('threads must be set to an integer')
+        if codec is not None and codec not in Compression.EXTENSIONS.values():
+            raise ValueError(f'codec must be one of {tuple(Compression.EXTENSIONS.values())}')
+        if not file_path:
+            raise ValueError('file_path cannot be empty')
+        if codec is None:
+            codec = next((value for key, value in Compression.EXTENSIONS.items() if file_path.endswith(key)), None)
+        if codec == 'zstd' and zstandard is None:
+            raise ImportError('zstandard package is required to open zstd files')
+        file_path = abspath(file_path)
+        descriptor, temp_path = Compression._temp_file(file_path)
+        try:
+            raw = open(descriptor, 'wb', buffering=buffering)
+        except BaseException:
+            close(descriptor)
+            unlink(temp_path)
+            raise
+        try:
+            with raw:
+                # keep target permissions (new files get default permissions from process umask)
+                if isfile(file_path):
+                    chmod(temp_path, stat(file_path).st_mode & 0o7777)
+                with TextIOWrapper(Compression._writer(raw, codec, level, threads), encoding='utf-8',
+                                   newline=newline) as stream:
+                    yield stream
+                raw.flush()
+                fsync(raw.fileno())
+            replace(temp_path, file_path)
+        except BaseException:
+            unlink(temp_path)
+            raise
+        # persist rename (not supported on every platform)
+        try:
+            folder = os_open(dirname(file_path), O_RDONLY)
+        except OSError:
+            return
+        try:
+            fsync(folder)
+        except OSError:
+            pass
+        finally:
+            close(folder)
+
+    ##################################################
+
+    @staticmethod
+    def _temp_file(file_path: str) -> Tuple[int, str]:
+        """Create temporary file next to file_path, return (descriptor, path)
+        NOTE: created with mode 0o666 so process umask applies (umask is never changed, as it is process wide)
+        """
+        while True:
+            temp_path = join(dirname(file_path), f'.{basename(file_path)}.{token_hex(8)}.tmp')
+            try:
+                return os_open(temp_path, O_WRONLY | O_CREAT | O_EXCL, 0o666), temp_path
+            except FileExistsError:
+                continue
+
+    ##################################################
+
+    @staticmethod
+    def _writer(raw: IO, codec: Optional[str], level: Optional[int], threads: Optional[int]) -> IO:
+        """Return binary stream compressing into raw file (left open on close)"""
+        if codec is None:
+            return _Unclosed(raw)
+        if codec == 'gzip':
+            return gzip.GzipFile(fileobj=raw, mode='wb', compresslevel=9 if level is None else level)
+        if codec == 'bz2':
+            return bz2.BZ2File(raw, 'wb', compresslevel=9 if level is None else level)
+        if codec == 'xz':
+            return lzma.LZMAFile(raw, 'wb', preset=level)
+        compressor = zstandard.ZstdCompressor(level=3 if level is None else level, threads=threads or 0)
+        return compressor.stream_writer(raw, closefd=False)
+
+
+class _Unclosed:
+    """Binary stream proxy ignoring "close", so raw file can be synced after text wrapper is closed"""
+
+    def __init__(self, raw: IO) -> None:
+        self._raw = raw
+        self.closed = False
+
+    def __getattr__(self, name: str):
+        return getattr(self._raw, name)
+
+    def close(self) -> None:
+        if not self.closed:
+            self._raw.flush()
+            self.closed = True
+
+
+##################################################
+
+
+if __name__ == '__main__':
+    pass
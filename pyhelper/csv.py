@@ -10,25 +10,59 @@
  with this source code in the file LICENSE.
 """
 
+from collections import deque
+from concurrent.futures import (ProcessPoolExecutor, wait, FIRST_COMPLETED)
 from csv import (reader, DictWriter)
-from os.path import isfile
-from typing import List
+from io import StringIO
+from itertools import islice
+from mmap import (mmap, ACCESS_READ)
+from os import cpu_count
+from os.path import (getsize, isfile)
+from typing import Iterator, List, Optional, Tuple
+
+from pyhelper.compression import Compression
+from pyhelper.sqlite import Sqlite
+
+try:
+    import numpy
+except ImportError:
+    # optional: only required by "read_columns(arrays=True)"
+    numpy = None
 
 
 class CSV:
     """
     Read/write from/to csv files
-    NOTE: csv file MUST have header row and every item will be casted as a string
+    NOTE: csv file MUST have header row and every item will be casted as a string unless a schema is given
+    Compressed files (.gz, .bz2, .xz, .zst) are (de)compressed on the fly (see: Compression)
     https://docs.python.org/3/library/csv.html
     https://docs.python.org/3/library/os.path.html#os.path.isfile
+
+    Schema
+    ------
+    Map column names to Sqlite datatypes (e.g. {'id': 'INTEGER', 'price': 'REAL'}, attributes are ignored),
+    missing columns stay TEXT and empty INTEGER/REAL/BLOB fields are read as None.
+    Columns are converted in bulk, by chunks of CHUNK_SIZE rows.
     """
 
+    # rows converted at once when a schema is given
+    CHUNK_SIZE = 10000
+
+    # bytes parsed by each "read_parallel" task
+    RANGE_SIZE = 64 * 1024 * 1024
+
+    # bytes read at once while scanning for record boundaries
+    BLOCK_SIZE = 1024 * 1024
+
+    # default write buffer size (bytes)
+    BUFFER_SIZE = 1024 * 1024
+
     ##################################################
 
     @staticmethod
-    def read(file_path: str) -> list:
+    def read(file_path: str, schema: Optional[dict] = None) -> list:
         """
-        read
+        read: return rows as dictionaries, typed by schema when given
         """
         if not isinstance(file_path, str):
             raise TypeError('file_path must be set to a string')
@@ -36,38 +70,440 @@ class CSV:
             raise ValueError('file_path cannot be empty')
         if not isfile(file_path):
             raise OSError('file doe not exist')
-        fieldnames = []
+        if schema is not None:
+            schema = CSV._schema(schema)
         data = []
+        # NOTE: errors (e.g. non numeric INTEGER field) must reach caller, never return partial data
+        for item in CSV._rows(file_path) if schema is None else CSV._typed_rows(file_path, schema):
+            data.append(item)
+        return data
+
+    ##################################################
+
+    @staticmethod
+    def iter_rows(file_path: str, chunksize: Optional[int] = None, schema: Optional[dict] = None) -> Iterator:
+        """
+        iter_rows: lazily yield rows as dictionaries (or lists of `chunksize` rows), typed by schema when given
+        """
+        if not isinstance(file_path, str):
+            raise TypeError('file_path must be set to a string')
+        if chunksize is not None and (isinstance(chunksize, bool) or not isinstance(chunksize, int)):
+            raise TypeError('chunksize must be set to an integer')
+        if not file_path:
+            raise ValueError('file_path cannot be empty')
+        if chunksize is not None and chunksize < 1:
+            raise ValueError('chunksize must be positive integer')
+        if not isfile(file_path):
+            raise OSError('file doe not exist')
+        rows = CSV._rows(file_path) if schema is None else CSV._typed_rows(file_path, CSV._schema(schema))
+        if chunksize is None:
+            return rows
+        return CSV._chunks(rows, chunksize)
+
+    ##################################################
+
+    @staticmethod
+    def read_columns(file_path: str, schema: Optional[dict] = None, arrays: bool = False) -> dict:
+        """
+        read_columns: return column oriented data {column: list of values} typed by schema when given,
+        or {column: numpy array} when arrays is True (numpy required, empty INTEGER fields become REAL nan)
+        """
+        if not isinstance(file_path, str):
+            raise TypeError('file_path must be set to a string')
+        if not isinstance(arrays, bool):
+            raise TypeError('arrays must be set to a boolean')
+        if not file_path:
+            raise ValueError('file_path cannot be empty')
+        if not isfile(file_path):
+            raise OSError('file doe not exist')
+        if arrays and numpy is None:
+            raise ImportError('numpy must be installed to read columns as arrays')
+        schema = {} if schema is None else CSV._schema(schema)
+        data = {}
+        for fieldnames, columns in CSV._column_chunks(file_path):
+            if not data:
+                data = {name: [] for name in fieldnames}
+            for name, column in zip(fieldnames, columns):
+                data[name].extend(CSV._convert(column, schema.get(name, 'TEXT')))
+        if arrays:
+            return {name: CSV._array(values, schema.get(name, 'TEXT')) for name, values in data.items()}
+        return data
+
+    ##################################################
+
+    @staticmethod
+    def read_parallel(file_path: str, workers: Optional[int] = None, ordered: bool = True,
+                      schema: Optional[dict] = None, range_size: int = RANGE_SIZE) -> Iterator[List[dict]]:
+        """
+        read_parallel: parse byte ranges aligned on record boundaries in a process pool,
+        yield each range rows (as a list of dictionaries) in file order, or in completion order when not ordered
+        NOTE: boundaries are found with a quote aware scan, so quoted fields may contain newlines
+        """
+        if not isinstance(file_path, str):
+            raise TypeError('file_path must be set to a string')
+        if workers is not None and (isinstance(workers, bool) or not isinstance(workers, int)):
+            raise TypeError('workers must be set to an integer')
+        if not isinstance(ordered, bool):
+            raise TypeError('ordered must be set to a boolean')
+        if isinstance(range_size, bool) or not isinstance(range_size, int):
+            raise TypeError('range_size must be set to an integer')
+        if not file_path:
+            raise ValueError('file_path cannot be empty')
+        if workers is not None and workers < 1:
+            raise ValueError('workers must be positive integer')
+        if range_size < 1:
+            raise ValueError('range_size must be positive integer')
+        if not isfile(file_path):
+            raise OSError('file doe not exist')
+        if Compression.detect(file_path) is not None:
+            raise ValueError('compressed file cannot be split into byte ranges, use "iter_rows" instead')
+        schema = None if schema is None else CSV._schema(schema)
+        return CSV._read_parallel(file_path, workers, ordered, schema, range_size)
+
+    ##################################################
+
+    @staticmethod
+    def _read_parallel(file_path: str, workers: Optional[int], ordered: bool, schema: Optional[dict],
+                       range_size: int) -> Iterator[List[dict]]:
+        """Submit ranges to process pool, keeping at most two pending ranges per worker"""
+        ranges = CSV._ranges(file_path, range_size)
+        start, end = next(ranges, (0, 0))
+        with open(file_path, 'rb') as csv_file:
+            header = csv_file.read(end - start).decode('utf-8')
+        fieldnames = next(reader(StringIO(header, newline='')), [])
+        if not fieldnames:
+            return
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            def submit(range_):
+                return executor.submit(CSV._parse_range, file_path, range_[0], range_[1], fieldnames, schema)
+
+            backlog = (workers or cpu_count() or 1) * 2
+            if ordered:
+                pending = deque(submit(range_) for range_ in islice(ranges, backlog))
+                while pending:
+                    future = pending.popleft()
+                    for range_ in islice(ranges, 1):
+                        pending.append(submit(range_))
+                    yield future.result()
+            else:
+                pending = set(submit(range_) for range_ in islice(ranges, backlog))
+                while pending:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    pending.update(submit(range_) for range_ in islice(ranges, len(done)))
+                    for future in done:
+                        yield future.result()
+
+    ##################################################
+
+    @staticmethod
+    def _ranges(file_path: str, range_size: int) -> Iterator[Tuple[int, int]]:
+        """Yield header range then (start, end) byte ranges of about range_size bytes ending on record boundaries
+        NOTE: a newline is a record boundary when preceded by an even number of quotes (escaped quotes are doubled)
+        """
+        size = getsize(file_path)
+        with open(file_path, 'rb') as csv_file:
+            position = 0
+            start = 0
+            target = 0
+            while position < size:
+                # skip to target, counting quotes, then stop after next newline outside quotes
+                parity = 0
+                while position < target:
+                    block = csv_file.read(min(CSV.BLOCK_SIZE, target - position))
+                    parity ^= block.count(b'"') & 1
+                    position += len(block)
+                end = size
+                while position < size:
+                    block = csv_file.read(CSV.BLOCK_SIZE)
+                    index = 0
+                    while True:
+                        newline = block.find(b'\n', index)
+                        if newline == -1:
+                            parity ^= block.count(b'"', index) & 1
+                            break
+                        parity ^= block.count(b'"', index, newline) & 1
+                        index = newline + 1
+                        if not parity:
+                            end = position + index
+                            break
+                    if end != size:
+                        break
+                    position += len(block)
+                position = end
+                csv_file.seek(position)
+                yield start, end
+                start = end
+                target = min(end + range_size, size)
+
+    ##################################################
+
+    @staticmethod
+    def _parse_range(file_path: str, start: int, end: int, fieldnames: list, schema: Optional[dict]) -> List[dict]:
+        """Parse rows from byte range (process pool task)"""
+        with open(file_path, 'rb') as csv_file:
+            csv_file.seek(start)
+            text = csv_file.read(end - start).decode('utf-8')
+        rows = list(reader(StringIO(text, newline='')))
+        if schema is None:
+            return [dict(zip(fieldnames, row)) for row in rows]
+        if not rows:
+            return []
+        return CSV._typed_dicts(fieldnames, CSV._columns(rows, len(fieldnames)), schema)
+
+    ##################################################
+
+    @staticmethod
+    def scan(file_path: str, columns: Optional[List[str]] = None, where: Optional[dict] = None) -> Iterator[dict]:
+        """
+        scan: lazily yield rows from a memory mapped file, decoding only requested columns
+        NOTE: "where" filters ({column: string}) are compared against raw bytes, so rejected rows are never decoded
+        ```
+        for row in CSV.scan('users.csv', columns=['id', 'email'], where={'country': 'FR'}):
+            print(row['email'])
+        ```
+        """
+        if not isinstance(file_path, str):
+            raise TypeError('file_path must be set to a string')
+        if columns is not None:
+            if not isinstance(columns, list) or not all(isinstance(column, str) for column in columns):
+                raise TypeError('columns must be set to a list of strings')
+            if not columns:
+                raise ValueError('columns cannot be empty')
+        if where is not None:
+            if not isinstance(where, dict) or not all(isinstance(value, str) for value in where.values()):
+                raise TypeError('where must be set to a dictionary of strings')
+        if not file_path:
+            raise ValueError('file_path cannot be empty')
+        if not isfile(file_path):
+            raise OSError('file doe not exist')
+        if Compression.detect(file_path) is not None:
+            raise ValueError('compressed file cannot be memory mapped, use "iter_rows" instead')
+        return CSV._scan(file_path, columns, where or {})
+
+    ##################################################
+
+    @staticmethod
+    def _scan(file_path: str, columns: Optional[List[str]], where: dict) -> Iterator[dict]:
+        """Yield projected rows matching filters"""
+        if not getsize(file_path):
+            return
+        with open(file_path, 'rb') as csv_file, mmap(csv_file.fileno(), 0, access=ACCESS_READ) as buffer:
+            records = CSV._records(buffer)
+            try:
+                yield from CSV._select(records, columns, where)
+            finally:
+                # release memoryview before mmap is closed
+                records.close()
+
+    ##################################################
+
+    @staticmethod
+    def _select(records: Iterator[Tuple[bytes, bool]], columns: Optional[List[str]], where: dict) -> Iterator[dict]:
+        """Yield projected records matching filters (first record is header)"""
+        header, _ = next(records, (None, False))
+        if header is None:
+            return
+        fieldnames = CSV._fields(header)
+        for name in (columns or []) + list(where):
+            if name not in fieldnames:
+                raise KeyError(f'column "{name}" not found')
+        names = fieldnames if columns is None else columns
+        projection = [(name, fieldnames.index(name)) for name in names]
+        filters = [(fieldnames.index(name), value, value.encode('utf-8')) for name, value in where.items()]
+        for record, quoted in records:
+            if quoted:
+                # quoted fields: decode whole record with csv module
+                fields = CSV._fields(record)
+                if any(index >= len(fields) or fields[index] != value for index, value, _ in filters):
+                    continue
+                yield {name: fields[index] if index < len(fields) else '' for name, index in projection}
+                continue
+            fields = record.split(b',')
+            if any(index >= len(fields) or fields[index] != raw for index, _, raw in filters):
+                continue
+            yield {name: fields[index].decode('utf-8') if index < len(fields) else '' for name, index in projection}
+
+    ##################################################
+
+    @staticmethod
+    def _records(buffer: mmap) -> Iterator[Tuple[bytes, bool]]:
+        """Yield (raw record without line terminator, has quotes) from buffer, skipping blank lines
+        NOTE: a newline ends a record when preceded by an even number of quotes (escaped quotes are doubled),
+              quote parity is carried across embedded newlines so every byte is searched once,
+              and each record is copied once, when yielded
+        """
+        size = len(buffer)
+        start = 0
+        with memoryview(buffer) as view:
+            while start < size:
+                position = start
+                parity = 0
+                quoted = False
+                while True:
+                    newline = buffer.find(b'\n', position)
+                    if newline == -1:
+                        newline = size
+                    # count quotes of new segment only
+                    quote = buffer.find(b'"', position, newline)
+                    while quote != -1:
+                        quoted = True
+                        parity ^= 1
+                        quote = buffer.find(b'"', quote + 1, newline)
+                    if not parity or newline == size:
+                        break
+                    # newline within quoted field
+                    position = newline + 1
+                end = newline
+                if end > start and buffer[end - 1] == 13:
+                    end -= 1
+                if end > start:
+                    yield bytes(view[start:end]), quoted
+                start = newline + 1
+
+    ##################################################
+
+    @staticmethod
+    def _fields(record: bytes) -> List[str]:
+        """Decode and parse a single raw record"""
+        return next(reader(StringIO(record.decode('utf-8'), newline='')), [])
+
+    ##################################################
+
+    @staticmethod
+    def _schema(schema: dict) -> dict:
+        """Validate schema and return {column: datatype}"""
+        if not isinstance(schema, dict):
+            raise TypeError('schema must be set to a dictionary')
+        datatypes = {}
+        for column, datatype in schema.items():
+            if not isinstance(column, str) or not isinstance(datatype, str):
+                raise TypeError('schema must map column names to datatype strings')
+            # keep datatype only (e.g. "INTEGER NOT NULL")
+            words = datatype.split()
+            datatype = words[0].upper() if words else ''
+            if datatype not in Sqlite.DATATYPES:
+                raise ValueError(f'schema datatype must be one of {Sqlite.DATATYPES}')
+            datatypes[column] = datatype
+        return datatypes
+
+    ##################################################
+
+    @staticmethod
+    def _column_chunks(file_path: str) -> Iterator[Tuple[list, list]]:
+        """Yield header and columns of every CHUNK_SIZE rows (short rows padded, long rows truncated)
+        NOTE: header only files yield empty columns once
+        """
+        with Compression.open(file_path, newline='') as csv_file:
+            rows = reader(csv_file)
+            fieldnames = next(rows, [])
+            width = len(fieldnames)
+            if not width:
+                return
+            chunk = list(islice(rows, CSV.CHUNK_SIZE))
+            while True:
+                yield fieldnames, CSV._columns(chunk, width)
+                chunk = list(islice(rows, CSV.CHUNK_SIZE))
+                if not chunk:
+                    return
+
+    ##################################################
+
+    @staticmethod
+    def _columns(chunk: List[list], width: int) -> list:
+        """Transpose rows into columns (short rows padded, long rows truncated)"""
+        for index, row in enumerate(chunk):
+            if len(row) != width:
+                chunk[index] = (row + [''] * width)[:width]
+        return list(zip(*chunk)) if chunk else [()] * width
+
+    ##################################################
+
+    @staticmethod
+    def _typed_rows(file_path: str, schema: dict) -> Iterator[dict]:
+        """Yield every row after header as a dictionary, converting columns by chunks"""
+        for fieldnames, columns in CSV._column_chunks(file_path):
+            yield from CSV._typed_dicts(fieldnames, columns, schema)
+
+    ##################################################
+
+    @staticmethod
+    def _typed_dicts(fieldnames: list, columns: list, schema: dict) -> List[dict]:
+        """Convert columns and return rows as dictionaries"""
+        columns = [CSV._convert(column, schema.get(name, 'TEXT')) for name, column in zip(fieldnames, columns)]
+        return [dict(zip(fieldnames, values)) for values in zip(*columns)]
+
+    ##################################################
+
+    @staticmethod
+    def _convert(column: tuple, datatype: str) -> list:
+        """Convert whole column at once (falls back to per value conversion when column holds empty fields)"""
+        if datatype == 'TEXT':
+            return list(column)
+        if datatype == 'BLOB':
+            return [value.encode('utf-8') if value != '' else None for value in column]
+        function = int if datatype == 'INTEGER' else float
         try:
-            with open(file_path, 'r', encoding='utf-8', newline='') as csv_file:
-                flag = True
-                for row in reader(csv_file):
-                    if flag:
-                        fieldnames = row
-                        flag = False
-                    else:
-                        index = 0
-                        item = {}
-                        for temp in row:
-                            item[fieldnames[index]] = temp
-                            index += 1
-                        data.append(item)
-        except Exception as e:
-            raise e
-        finally:
-            return data
+            return list(map(function, column))
+        except ValueError:
+            return [function(value) if value != '' else None for value in column]
+
+    ##################################################
+
+    @staticmethod
+    def _array(values: list, datatype: str):
+        """Return values as numpy array"""
+        if datatype in ('INTEGER', 'REAL'):
+            if None in values:
+                return numpy.array([numpy.nan if value is None else value for value in values], dtype=numpy.float64)
+            return numpy.array(values, dtype=numpy.int64 if datatype == 'INTEGER' else numpy.float64)
+        return numpy.array(values, dtype=object)
+
+    ##################################################
+
+    @staticmethod
+    def _rows(file_path: str) -> Iterator[dict]:
+        """Yield every row after header as a dictionary"""
+        with Compression.open(file_path, newline='') as csv_file:
+            rows = reader(csv_file)
+            fieldnames = next(rows, [])
+            for row in rows:
+                index = 0
+                item = {}
+                for temp in row:
+                    item[fieldnames[index]] = temp
+                    index += 1
+                yield item
+
+    ##################################################
+
+    @staticmethod
+    def _chunks(rows: Iterator[dict], chunksize: int) -> Iterator[List[dict]]:
+        """Group rows into lists of `chunksize` items"""
+        while True:
+            chunk = list(islice(rows, chunksize))
+            if not chunk:
+                return
+            yield chunk
 
     ##################################################
 
     @staticmethod
-    def write(data: List[dict], file_path: str) -> None:
+    def write(data: List[dict], file_path: str, level: Optional[int] = None, threads: Optional[int] = None,
+              atomic: bool = False, buffer_size: int = BUFFER_SIZE) -> None:
         """
-        write
+        write: compressed by file extension with given codec level (and zstd threads)
+        NOTE: when atomic, rows are written to a temporary file renamed over file_path once synced (see: Compression)
         """
         if not isinstance(file_path, str):
             raise TypeError('file_path must be set to a string')
+        if not isinstance(atomic, bool):
+            raise TypeError('atomic must be set to a boolean')
+        if isinstance(buffer_size, bool) or not isinstance(buffer_size, int):
+            raise TypeError('buffer_size must be set to an integer')
         if not file_path:
             raise ValueError('file_path cannot be empty')
+        if buffer_size < 1:
+            raise ValueError('buffer_size must be positive integer')
         if not isinstance(data, list):
             raise TypeError('data must be set to a list')
         if data == []:
@@ -77,7 +513,11 @@ class CSV:
         if len(data[0]) == 0:
             raise ValueError('data cannot contain empty dictionaries')
         try:
-            with open(file_path, 'w', encoding='utf-8', newline='') as csv_file:
+            if atomic:
+                stream = Compression.atomic_open(file_path, level, threads, newline='', buffering=buffer_size)
+            else:
+                stream = Compression.open(file_path, 'w', level, threads, newline='', buffering=buffer_size)
+            with stream as csv_file:
                 writer = DictWriter(csv_file, fieldnames=data[0].keys())
                 writer.writeheader()
                 writer.writerows(data)
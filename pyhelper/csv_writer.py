@@ -0,0 +1,164 @@
+#!/bin/python3
+# -*- coding: utf-8 -*-
+
+"""
+ This file is part of the TangoMan PyHelper package.
+
+ (c) "Matthias Morin" <mat@tangoman.io>
+
+ This source file is subject to the MIT license that is bundled
+ with this source code in the file LICENSE.
+"""
+
+from csv import (reader, DictWriter)
+from os.path import (getsize, isfile)
+from typing import Iterable, List, Optional
+
+from pyhelper.compression import Compression
+from pyhelper.csv import CSV
+
+
+class CSVWriter:
+    """
+    Write csv rows incrementally, without holding data in memory
+    Header is given or inferred from first row keys, and read from existing file when appending
+    NOTE: use as a context manager (or call "close") to flush remaining rows
+    ```
+    with CSVWriter('users.csv.gz', flush_interval=10000) as writer:
+        for row in sqlite.iter_find('users', {'country': 'FR'}):
+            writer.write(row)
+    ```
+    """
+
+    # rows written between two flushes
+    FLUSH_INTERVAL = 1000
+
+    ##################################################
+    # Constructor
+    ##################################################
+
+    def __init__(self, file_path: str, fieldnames: Optional[List[str]] = None, append: bool = False,
+                 flush_interval: int = FLUSH_INTERVAL, level: Optional[int] = None, threads: Optional[int] = None,
+                 buffer_size: int = CSV.BUFFER_SIZE):
+        if not isinstance(file_path, str):
+            raise TypeError('file_path must be set to a string')
+        if fieldnames is not None:
+            if not isinstance(fieldnames, list) or not all(isinstance(name, str) for name in fieldnames):
+                raise TypeError('fieldnames must be set to a list of strings')
+            if not fieldnames:
+                raise ValueError('fieldnames cannot be empty')
+        if not isinstance(append, bool):
+            raise TypeError('append must be set to a boolean')
+        if isinstance(flush_interval, bool) or not isinstance(flush_interval, int):
+            raise TypeError('flush_interval must be set to an integer')
+        if isinstance(buffer_size, bool) or not isinstance(buffer_size, int):
+            raise TypeError('buffer_size must be set to an integer')
+        if not file_path:
+            raise ValueError('file_path cannot be empty')
+        if flush_interval < 1:
+            raise ValueError('flush_interval must be positive integer')
+        if buffer_size < 1:
+            raise ValueError('buffer_size must be positive integer')
+        self.file_path = file_path
+        self.fieldnames = fieldnames
+        self.append = append
+        self.flush_interval = flush_interval
+        self.level = level
+        self.threads = threads
+        self.buffer_size = buffer_size
+        self.count = 0
+        self._file = None
+        self._writer = None
+        self._pending = 0
+        self._closed = False
+
+    ##################################################
+
+    def __enter__(self) -> 'CSVWriter':
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    ##################################################
+
+    def write(self, row: dict) -> None:
+        """
+        write: write a single row (header is written before first row)
+        """
+        if not isinstance(row, dict):
+            raise TypeError('row must be set to a dictionary')
+        if self._closed:
+            raise ValueError('writer is closed')
+        if self._writer is None:
+            self._open(row)
+        self._writer.writerow(row)
+        self.count += 1
+        self._pending += 1
+        if self._pending >= self.flush_interval:
+            self.flush()
+
+    ##################################################
+
+    def write_many(self, rows: Iterable[dict]) -> int:
+        """
+        write_many: write rows from any iterable, return written row count
+        """
+        if isinstance(rows, (str, bytes, dict)) or not isinstance(rows, Iterable):
+            raise TypeError('rows must be set to an iterable of dictionaries')
+        if self._closed:
+            raise ValueError('writer is closed')
+        count = self.count
+        for row in rows:
+            self.write(row)
+        return self.count - count
+
+    ##################################################
+
+    def flush(self) -> None:
+        """
+        flush
+        """
+        if self._file is not None:
+            self._file.flush()
+        self._pending = 0
+
+    ##################################################
+
+    def close(self) -> None:
+        """
+        close: further writes raise ValueError (reopening would truncate file)
+        """
+        self._closed = True
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+            self._writer = None
+        self._pending = 0
+
+    ##################################################
+
+    def _open(self, row: dict) -> None:
+        """Open file and write header unless appending to a file which already has one"""
+        header = None
+        if self.append and isfile(self.file_path) and getsize(self.file_path):
+            with Compression.open(self.file_path, newline='') as csv_file:
+                header = next(reader(csv_file), None)
+        if header and self.fieldnames is not None and header != self.fieldnames:
+            raise ValueError('fieldnames must match existing file header')
+        fieldnames = header or self.fieldnames or list(row.keys())
+        if not fieldnames:
+            raise ValueError('row cannot be empty')
+        self.fieldnames = fieldnames
+        self._file = Compression.open(self.file_path, 'a' if self.append else 'w', self.level, self.threads,
+                                      newline='', buffering=self.buffer_size)
+        self._writer = DictWriter(self._file, fieldnames=fieldnames)
+        if not header:
+            self._writer.writeheader()
+
+
+##################################################
+
+
+if __name__ == '__main__':
+    pass
@@ -10,14 +10,18 @@
  with this source code in the file LICENSE.
 """
 
-from os import listdir
-from os.path import join, exists, abspath
-from typing import Optional, Iterable
+from fnmatch import fnmatch
+from os import scandir, stat
+from os.path import exists, abspath
+from typing import Optional, Iterable, Iterator, Tuple, Union
 
 
 class FolderManager:
     """
     FolderManager
+
+    - files: List full file paths contained in folder filtered by extension (optional)
+    - walk:  Lazily yield file paths recursively filtered by extension(s) and/or glob pattern(s)
     """
 
     ##################################################
@@ -73,29 +77,123 @@ class FolderManager:
     # files Setter / Getter
     ##################################################
 
-    def files(self, extension: str = None) -> Optional[list]:
+    def files(self, extension: str = None, recursive: bool = False) -> Optional[list]:
         """List full file paths contained in folder filtered by extension (optional)"""
         if self._folder is None:
             raise ValueError(f"{self.__class__.__name__}.folder not found")
+        if not isinstance(recursive, bool):
+            raise TypeError(f'{self.__class__.__name__}.recursive must be set to bool, {type(recursive)} given')
         if extension is not None:
             self.extension = extension
-        if self.extension:
-            return [join(self._folder, file) for file in listdir(self._folder) if file.endswith(self.extension)]
-        else:
-            return [join(self._folder, file) for file in listdir(self._folder)]
+        if recursive:
+            return list(self.walk())
+        return list(self._entries())
+
+    ##################################################
+
+    def walk(self, extension: Union[str, Tuple[str, ...]] = None, pattern: Union[str, Tuple[str, ...]] = None,
+             max_depth: Optional[int] = None, follow_symlinks: bool = False) -> Iterator[str]:
+        """Lazily yield full file paths from folder and its subfolders, using cached DirEntry stat info
+        - extension: one or several extensions (default: current extension)
+        - pattern:   one or several glob patterns matched against file name (e.g. "foo*.md")
+        - max_depth: 0 lists folder only, None walks whole tree
+        """
+        if self._folder is None:
+            raise ValueError(f"{self.__class__.__name__}.folder not found")
+        if extension is None:
+            extension = self.extension
+        extensions = self._filters(extension, 'extension')
+        patterns = self._filters(pattern, 'pattern')
+        if max_depth is not None and (isinstance(max_depth, bool) or not isinstance(max_depth, int)):
+            raise TypeError(f'{self.__class__.__name__}.max_depth must be set to int, {type(max_depth)} given')
+        if max_depth is not None and max_depth < 0:
+            raise ValueError(f'{self.__class__.__name__}.max_depth must be positive integer')
+        if not isinstance(follow_symlinks, bool):
+            raise TypeError(
+                f'{self.__class__.__name__}.follow_symlinks must be set to bool, {type(follow_symlinks)} given')
+        return self._walk(extensions, patterns, max_depth, follow_symlinks)
+
+    ##################################################
+
+    def _walk(self, extensions: Optional[tuple], patterns: Optional[tuple], max_depth: Optional[int],
+              follow_symlinks: bool) -> Iterator[str]:
+        """Walk tree iteratively (no recursion limit), one open directory handle at a time
+        NOTE: when following symlinks, directories already visited (same device and inode) are skipped to avoid loops
+        """
+        stack = [(self._folder, 0)]
+        visited = None
+        if follow_symlinks:
+            root = stat(self._folder)
+            visited = {(root.st_dev, root.st_ino)}
+        while stack:
+            folder, depth = stack.pop()
+            try:
+                with scandir(folder) as entries:
+                    for entry in entries:
+                        try:
+                            is_dir = entry.is_dir(follow_symlinks=follow_symlinks)
+                        except OSError:
+                            continue
+                        if is_dir:
+                            if max_depth is not None and depth >= max_depth:
+                                continue
+                            if visited is not None:
+                                try:
+                                    info = entry.stat()
+                                except OSError:
+                                    continue
+                                if (info.st_dev, info.st_ino) in visited:
+                                    continue
+                                visited.add((info.st_dev, info.st_ino))
+                            stack.append((entry.path, depth + 1))
+                            continue
+                        if extensions is not None and not entry.name.endswith(extensions):
+                            continue
+                        if patterns is not None and not any(fnmatch(entry.name, pattern) for pattern in patterns):
+                            continue
+                        yield entry.path
+            except PermissionError:
+                continue
+
+    ##################################################
+
+    def _entries(self) -> Iterator[str]:
+        """Yield full paths contained in folder filtered by extension (optional)"""
+        with scandir(self._folder) as entries:
+            for entry in entries:
+                if self.extension is None or entry.name.endswith(self.extension):
+                    yield entry.path
+
+    ##################################################
+
+    def _filters(self, filters: Union[str, Tuple[str, ...], None], name: str) -> Optional[tuple]:
+        """Return filters as a tuple of non-empty strings"""
+        if filters is None:
+            return None
+        if isinstance(filters, str):
+            filters = (filters,)
+        if not isinstance(filters, (tuple, list)) or not all(isinstance(filter_, str) for filter_ in filters):
+            raise TypeError(
+                f'{self.__class__.__name__}.{name} must be set to str or tuple of str, {type(filters)} given')
+        if not filters or '' in filters:
+            raise ValueError(f'{self.__class__.__name__}.{name} cannot be empty')
+        return tuple(filters)
 
     ##################################################
 
     def __iter__(self) -> Iterable:
         """Iterate through files"""
-        for file in self.files():
-            yield file
+        if self._folder is None:
+            raise ValueError(f"{self.__class__.__name__}.folder not found")
+        yield from self._entries()
 
     ##################################################
 
     def __len__(self) -> int:
         """Return file count"""
-        return len(self.files())
+        if self._folder is None:
+            raise ValueError(f"{self.__class__.__name__}.folder not found")
+        return sum(1 for _ in self._entries())
 
 
 ##################################################
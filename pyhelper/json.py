@@ -10,16 +10,24 @@
  with this source code in the file LICENSE.
 """
 
-from json import (load, dump)
+from json import (load, dump, loads, dumps)
 from os.path import isfile
-from typing import Union
+from typing import Iterable, Iterator, Optional, Union
+
+from pyhelper.compression import Compression
 
 
 class Json:
     """
     Read/write from/to json format
+    Read/write from/to newline-delimited json (JSON Lines) with constant memory
+    https://jsonlines.org
+    NOTE: compressed files (.gz, .bz2, .xz, .zst) are (de)compressed on the fly (see: Compression)
     """
 
+    # default I/O buffer size for JSON Lines streams and writes (bytes)
+    BUFFER_SIZE = 1024 * 1024
+
     ##################################################
 
     @staticmethod
@@ -33,34 +41,102 @@ class Json:
             raise ValueError('file_path cannot be empty')
         if not isfile(file_path):
             raise OSError('file doe not exist')
-        data = None
-        try:
-            with open(file_path, 'r', encoding='utf-8') as json_file:
-                data = load(json_file)
-        except Exception as e:
-            raise e
-        finally:
-            return data
+        with Compression.open(file_path) as json_file:
+            return load(json_file)
 
     ##################################################
 
     @staticmethod
-    def write(data: Union[list, dict], file_path: str) -> None:
+    def write(data: Union[list, dict], file_path: str, level: Optional[int] = None, threads: Optional[int] = None,
+              atomic: bool = False, buffer_size: int = BUFFER_SIZE) -> None:
         """
-        write
+        write: compressed by file extension with given codec level (and zstd threads)
+        NOTE: when atomic, data is written to a temporary file renamed over file_path once synced (see: Compression)
         """
         if not isinstance(data, list) and not isinstance(data, dict):
             raise TypeError('data must be set to a list or a dictionary')
         if not isinstance(file_path, str):
             raise TypeError('file_path must be set to a string')
+        if not isinstance(atomic, bool):
+            raise TypeError('atomic must be set to a boolean')
+        if isinstance(buffer_size, bool) or not isinstance(buffer_size, int):
+            raise TypeError('buffer_size must be set to an integer')
         if not file_path:
             raise ValueError('file_path cannot be empty')
+        if buffer_size < 1:
+            raise ValueError('buffer_size must be positive integer')
         try:
-            with open(file_path, 'w', encoding='utf-8') as json_file:
+            if atomic:
+                stream = Compression.atomic_open(file_path, level, threads, buffering=buffer_size)
+            else:
+                stream = Compression.open(file_path, 'w', level, threads, buffering=buffer_size)
+            with stream as json_file:
                 dump(data, json_file)
         except Exception as e:
             raise e
 
+    ##################################################
+
+    @staticmethod
+    def iter_lines(file_path: str, buffer_size: int = BUFFER_SIZE) -> Iterator:
+        """
+        iter_lines: lazily yield one decoded record per line (blank lines are skipped)
+        """
+        if not isinstance(file_path, str):
+            raise TypeError('file_path must be set to a string')
+        if isinstance(buffer_size, bool) or not isinstance(buffer_size, int):
+            raise TypeError('buffer_size must be set to an integer')
+        if not file_path:
+            raise ValueError('file_path cannot be empty')
+        if buffer_size < 1:
+            raise ValueError('buffer_size must be positive integer')
+        if not isfile(file_path):
+            raise OSError('file doe not exist')
+        return Json._lines(file_path, buffer_size)
+
+    ##################################################
+
+    @staticmethod
+    def _lines(file_path: str, buffer_size: int) -> Iterator:
+        """Yield decoded records from file"""
+        with Compression.open(file_path, buffering=buffer_size) as json_file:
+            for line in json_file:
+                if line.strip():
+                    yield loads(line)
+
+    ##################################################
+
+    @staticmethod
+    def write_lines(data: Iterable, file_path: str, append: bool = False, buffer_size: int = BUFFER_SIZE,
+                    level: Optional[int] = None, threads: Optional[int] = None) -> int:
+        """
+        write_lines: write one json record per line, return written record count
+        NOTE: appending to a compressed file adds a new compressed stream
+              (gzip, bz2, xz and zstd readers concatenate them)
+        """
+        if isinstance(data, (str, bytes, dict)) or not isinstance(data, Iterable):
+            raise TypeError('data must be set to an iterable')
+        if not isinstance(file_path, str):
+            raise TypeError('file_path must be set to a string')
+        if not isinstance(append, bool):
+            raise TypeError('append must be set to a boolean')
+        if isinstance(buffer_size, bool) or not isinstance(buffer_size, int):
+            raise TypeError('buffer_size must be set to an integer')
+        if not file_path:
+            raise ValueError('file_path cannot be empty')
+        if buffer_size < 1:
+            raise ValueError('buffer_size must be positive integer')
+        count = 0
+        try:
+            mode = 'a' if append else 'w'
+            with Compression.open(file_path, mode, level, threads, buffering=buffer_size) as json_file:
+                for record in data:
+                    json_file.write(dumps(record) + '\n')
+                    count += 1
+        except Exception as e:
+            raise e
+        return count
+
 
 ##################################################
 
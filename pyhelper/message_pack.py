@@ -0,0 +1,257 @@
+#!/bin/python3
+# -*- coding: utf-8 -*-
+
+"""
+ This file is part of the TangoMan PyHelper package.
+
+ (c) "Matthias Morin" <mat@tangoman.io>
+
+ This source file is subject to the MIT license that is bundled
+ with this source code in the file LICENSE.
+"""
+
+from struct import (pack, unpack_from)
+from typing import Any, Iterator, List, Tuple
+
+try:
+    import msgpack
+except ImportError:
+    # optional: C codec, pure python codec is used otherwise
+    msgpack = None
+
+
+class MessagePack:
+    """
+    Encode/decode values in MessagePack binary format
+    Supports None, bool, int (64 bits), float, str, bytes, list, tuple (decoded as list) and dict
+    NOTE: uses "msgpack" C codec when installed unless pure is True, both produce the same bytes
+    https://github.com/msgpack/msgpack/blob/master/spec.md
+    """
+
+    # struct format per type, and byte size per format
+    _FORMATS = {
+        0xc4: '>B', 0xc5: '>H', 0xc6: '>I',
+        0xca: '>f', 0xcb: '>d',
+        0xcc: '>B', 0xcd: '>H', 0xce: '>I', 0xcf: '>Q',
+        0xd0: '>b', 0xd1: '>h', 0xd2: '>i', 0xd3: '>q',
+        0xd9: '>B', 0xda: '>H', 0xdb: '>I',
+        0xdc: '>H', 0xdd: '>I',
+        0xde: '>H', 0xdf: '>I',
+    }
+
+    _SIZES = {'>B': 1, '>b': 1, '>H': 2, '>h': 2, '>I': 4, '>i': 4, '>f': 4, '>Q': 8, '>q': 8, '>d': 8}
+
+    ##################################################
+
+    @staticmethod
+    def pack(value: Any, pure: bool = False) -> bytes:
+        """
+        pack: return value encoded as bytes
+        """
+        if not isinstance(pure, bool):
+            raise TypeError('pure must be set to a boolean')
+        if msgpack is not None and not pure:
+            return msgpack.packb(value, use_bin_type=True)
+        chunks = []
+        MessagePack._pack(value, chunks)
+        return b''.join(chunks)
+
+    ##################################################
+
+    @staticmethod
+    def unpack(data: bytes, pure: bool = False) -> Any:
+        """
+        unpack: return value decoded from bytes (must contain exactly one value)
+        """
+        if not isinstance(data, (bytes, bytearray, memoryview)):
+            raise TypeError('data must be set to bytes')
+        if not isinstance(pure, bool):
+            raise TypeError('pure must be set to a boolean')
+        if not data:
+            raise ValueError('data cannot be empty')
+        if msgpack is not None and not pure:
+            return msgpack.unpackb(data, raw=False, strict_map_key=False)
+        value, offset = MessagePack._unpack(data, 0)
+        if offset != len(data):
+            raise ValueError('data contains extra bytes')
+        return value
+
+    ##################################################
+
+    @staticmethod
+    def iter_unpack(data: bytes, pure: bool = False) -> Iterator[Any]:
+        """
+        iter_unpack: lazily yield values from concatenated encoded values
+        """
+        if not isinstance(data, (bytes, bytearray, memoryview)):
+            raise TypeError('data must be set to bytes')
+        if not isinstance(pure, bool):
+            raise TypeError('pure must be set to a boolean')
+        if msgpack is not None and not pure:
+            unpacker = msgpack.Unpacker(raw=False, strict_map_key=False)
+            unpacker.feed(data)
+            return iter(unpacker)
+        return MessagePack._iter_unpack(data)
+
+    ##################################################
+
+    @staticmethod
+    def _iter_unpack(data: bytes) -> Iterator[Any]:
+        """Yield values until data is consumed"""
+        offset = 0
+        while offset < len(data):
+            value, offset = MessagePack._unpack(data, offset)
+            yield value
+
+    ##################################################
+
+    @staticmethod
+    def _pack(value: Any, chunks: List[bytes]) -> None:
+        """Append value encoding to chunks"""
+        if value is None:
+            chunks.append(b'\xc0')
+        elif value is True:
+            chunks.append(b'\xc3')
+        elif value is False:
+            chunks.append(b'\xc2')
+        elif isinstance(value, int):
+            chunks.append(MessagePack._pack_int(value))
+        elif isinstance(value, float):
+            chunks.append(pack('>Bd', 0xcb, value))
+        elif isinstance(value, str):
+            encoded = value.encode('utf-8')
+            chunks.append(MessagePack._header(len(encoded), 0xa0, 32, (0xd9, 0xda, 0xdb)))
+            chunks.append(encoded)
+        elif isinstance(value, (bytes, bytearray, memoryview)):
+            value = bytes(value)
+            chunks.append(MessagePack._header(len(value), None, 0, (0xc4, 0xc5, 0xc6)))
+            chunks.append(value)
+        elif isinstance(value, (list, tuple)):
+            chunks.append(MessagePack._header(len(value), 0x90, 16, (None, 0xdc, 0xdd)))
+            for item in value:
+                MessagePack._pack(item, chunks)
+        elif isinstance(value, dict):
+            chunks.append(MessagePack._header(len(value), 0x80, 16, (None, 0xde, 0xdf)))
+            for key, item in value.items():
+                MessagePack._pack(key, chunks)
+                MessagePack._pack(item, chunks)
+        else:
+            raise TypeError(f'cannot serialize {type(value).__name__} object')
+
+    ##################################################
+
+    @staticmethod
+    def _pack_int(value: int) -> bytes:
+        """Return smallest integer encoding"""
+        if 0 <= value < 0x80:
+            return pack('B', value)
+        if -32 <= value < 0:
+            return pack('b', value)
+        if value > 0:
+            for type_, format_, limit in ((0xcc, '>BB', 0xff), (0xcd, '>BH', 0xffff), (0xce, '>BI', 0xffffffff),
+                                          (0xcf, '>BQ', 0xffffffffffffffff)):
+                if value <= limit:
+                    return pack(format_, type_, value)
+        else:
+            for type_, format_, limit in ((0xd0, '>Bb', -0x80), (0xd1, '>Bh', -0x8000), (0xd2, '>Bi', -0x80000000),
+                                          (0xd3, '>Bq', -0x8000000000000000)):
+                if value >= limit:
+                    return pack(format_, type_, value)
+        raise OverflowError('integer must fit in 64 bits')
+
+    ##################################################
+
+    @staticmethod
+    def _header(size: int, fix: Any, fix_limit: int, types: Tuple) -> bytes:
+        """Return length header (fix type when size is below fix_limit, else 8, 16 or 32 bits type)"""
+        if fix is not None and size < fix_limit:
+            return pack('B', fix | size)
+        for type_, format_, limit in zip(types, ('>BB', '>BH', '>BI'), (0xff, 0xffff, 0xffffffff)):
+            if type_ is not None and size <= limit:
+                return pack(format_, type_, size)
+        raise ValueError('value is too large')
+
+    ##################################################
+
+    @staticmethod
+    def _unpack(data: bytes, offset: int) -> Tuple[Any, int]:
+        """Return decoded value and offset of next value"""
+        try:
+            type_ = data[offset]
+        except IndexError:
+            raise ValueError('data is truncated')
+        offset += 1
+        if type_ < 0x80:
+            return type_, offset
+        if type_ >= 0xe0:
+            return type_ - 0x100, offset
+        if 0xa0 <= type_ <= 0xbf:
+            return MessagePack._string(data, offset, type_ & 0x1f)
+        if 0x90 <= type_ <= 0x9f:
+            return MessagePack._array(data, offset, type_ & 0x0f)
+        if 0x80 <= type_ <= 0x8f:
+            return MessagePack._map(data, offset, type_ & 0x0f)
+        if type_ == 0xc0:
+            return None, offset
+        if type_ == 0xc2:
+            return False, offset
+        if type_ == 0xc3:
+            return True, offset
+        format_ = MessagePack._FORMATS.get(type_)
+        if format_ is None:
+            raise ValueError(f'unsupported type 0x{type_:02x}')
+        try:
+            value, = unpack_from(format_, data, offset)
+        except Exception:
+            raise ValueError('data is truncated')
+        offset += MessagePack._SIZES[format_]
+        if type_ in (0xc4, 0xc5, 0xc6):
+            return MessagePack._bytes(data, offset, value)
+        if type_ in (0xd9, 0xda, 0xdb):
+            return MessagePack._string(data, offset, value)
+        if type_ in (0xdc, 0xdd):
+            return MessagePack._array(data, offset, value)
+        if type_ in (0xde, 0xdf):
+            return MessagePack._map(data, offset, value)
+        return value, offset
+
+    ##################################################
+
+    @staticmethod
+    def _bytes(data: bytes, offset: int, size: int) -> Tuple[bytes, int]:
+        """Return size bytes from offset"""
+        end = offset + size
+        if end > len(data):
+            raise ValueError('data is truncated')
+        return bytes(data[offset:end]), end
+
+    @staticmethod
+    def _string(data: bytes, offset: int, size: int) -> Tuple[str, int]:
+        """Return utf-8 string of size bytes from offset"""
+        value, offset = MessagePack._bytes(data, offset, size)
+        return value.decode('utf-8'), offset
+
+    @staticmethod
+    def _array(data: bytes, offset: int, size: int) -> Tuple[list, int]:
+        """Return list of size values from offset"""
+        items = []
+        for _ in range(size):
+            item, offset = MessagePack._unpack(data, offset)
+            items.append(item)
+        return items, offset
+
+    @staticmethod
+    def _map(data: bytes, offset: int, size: int) -> Tuple[dict, int]:
+        """Return dictionary of size pairs from offset"""
+        items = {}
+        for _ in range(size):
+            key, offset = MessagePack._unpack(data, offset)
+            items[key], offset = MessagePack._unpack(data, offset)
+        return items, offset
+
+
+##################################################
+
+
+if __name__ == '__main__':
+    pass
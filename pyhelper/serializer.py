@@ -11,9 +11,12 @@
 """
 
 from json import (dumps, loads)
-from typing import Any
+from keyword import iskeyword
+from typing import Any, Iterable, Iterator, List, Optional, Union
+from weakref import WeakKeyDictionary
 
 from pyhelper.annotations import Annotations
+from pyhelper.message_pack import MessagePack
 
 
 class Serializer:
@@ -27,15 +30,46 @@ class Serializer:
     - Deserializer: Deserialize object: return object from json
     - Normalizer:   Normalize object: return object as dictionary
     - Denormalizer: Denormalize dictionary: Hydrate object from dictionary
+
+    Batch
+    -----
+    - serialize_many:   Serialize objects as one json array (or newline-delimited json)
+    - deserialize_many: Deserialize json array (or newline-delimited json) into new objects of given class
+    - normalize_many:   Lazily normalize objects
+    NOTE: field plan is compiled once per class from class members, public attributes set on instances
+          are looked up on every object
+
+    Compiled
+    --------
+    With "compiled=True", normalize and denormalize run python functions generated once per class,
+    reading and writing known fields directly (batch methods always use them)
+    ```
+    serializer = Serializer(foobar, compiled=True)
+    ```
+
+    Formats
+    -------
+    serialize/deserialize methods accept format="json" (text) or format="msgpack" (bytes, see: MessagePack)
     """
 
+    FORMATS = (
+        'json',
+        'msgpack'
+    )
+
+    # field plans per class: {type: {'fields': tuple, 'properties': frozenset, 'normalize': function, ...}}
+    _PLANS = WeakKeyDictionary()
+
     ##################################################
     # Constructor
     ##################################################
 
-    def __init__(self, object: Any) -> None:
+    def __init__(self, object: Any, compiled: bool = False) -> None:
+        if not isinstance(compiled, bool):
+            raise TypeError(f'{self.__class__.__name__}.__init__: compiled must be set to a boolean')
         self.object = object
         self.annotations = Annotations(object)
+        self.compiled = compiled
 
     ##################################################
     # Encoder
@@ -67,16 +101,26 @@ class Serializer:
     # Serializer
     ##################################################
 
-    def serialize(self) -> str:
-        """Serialize object: return serialized object as json"""
+    def serialize(self, format: str = 'json') -> Union[str, bytes]:
+        """Serialize object: return serialized object as json (or msgpack bytes)"""
+        self._format(format, 'serialize')
+        if format == 'msgpack':
+            return MessagePack.pack(self.normalize())
         return dumps(self.normalize())
 
     ##################################################
     # Deserializer
     ##################################################
 
-    def deserialize(self, string: str):
-        """Deserialize object: return object from json"""
+    def deserialize(self, string: Union[str, bytes], format: str = 'json'):
+        """Deserialize object: return object from json (or msgpack bytes)"""
+        self._format(format, 'deserialize')
+        if format == 'msgpack':
+            if not isinstance(string, bytes):
+                raise TypeError(f'{self.__class__.__name__}.deserialize: must be set to bytes')
+            if string == b'':
+                raise ValueError(f'{self.__class__.__name__}.deserialize: bytes cannot be empty')
+            return self.denormalize(MessagePack.unpack(string))
         if not isinstance(string, str):
             raise TypeError(f'{self.__class__.__name__}.deserialize: must be set to a string')
         if string == '':
@@ -89,6 +133,8 @@ class Serializer:
 
     def normalize(self) -> dict:
         """Normalize object: return object as dictionary"""
+        if self.compiled:
+            return self._plan(self.object)['normalize'](self.object)
         dictionary = {}
         for property_ in self.annotations.get_properties:
             dictionary[property_] = self.object.__getattribute__(property_)
@@ -106,15 +152,196 @@ class Serializer:
             raise TypeError(f'{self.__class__.__name__}.denormalize: must be set to a dictionary')
         if dictionary == {}:
             raise ValueError(f'{self.__class__.__name__}.denormalize: dictionary cannot be empty')
+        if self.compiled:
+            self._plan(self.object)['denormalize'](self.object, dictionary)
+            return self.object
         # dictionary keys must match object properties
+        properties = set(self.annotations.get_properties)
         for property_ in dictionary.keys():
-            if property_ not in self.annotations.get_properties:
+            if property_ not in properties:
                 raise AttributeError(f'{self.object.__class__.__name__} has no attribute {property_}')
         # setting given attributes from dictionary (using appropriate setters)
         for key_, value_ in dictionary.items():
             setattr(self.object, key_, value_)
         return self.object
 
+    ##################################################
+    # Batch
+    ##################################################
+
+    @classmethod
+    def serialize_many(cls, objects: Iterable, lines: bool = False, format: str = 'json') -> Union[str, bytes]:
+        """Serialize objects: return json array (or one json object per line when lines is True)
+        msgpack format returns one packed array (or concatenated packed maps when lines is True)
+        """
+        if isinstance(objects, (str, bytes, dict)) or not isinstance(objects, Iterable):
+            raise TypeError(f'{cls.__name__}.serialize_many: must be set to an iterable')
+        if not isinstance(lines, bool):
+            raise TypeError(f'{cls.__name__}.serialize_many: lines must be set to a boolean')
+        cls._format(format, 'serialize_many')
+        if format == 'msgpack':
+            if lines:
+                return b''.join(MessagePack.pack(dictionary) for dictionary in cls.normalize_many(objects))
+            return MessagePack.pack(list(cls.normalize_many(objects)))
+        if lines:
+            return ''.join(dumps(dictionary) + '\n' for dictionary in cls.normalize_many(objects))
+        return dumps(list(cls.normalize_many(objects)))
+
+    ##################################################
+
+    @classmethod
+    def deserialize_many(cls, string: Union[str, bytes], class_: type, lines: bool = False,
+                         format: str = 'json') -> List[Any]:
+        """Deserialize json array (or one json object per line when lines is True): return new objects
+        msgpack format expects bytes from "serialize_many" with same lines value
+        raises AttributeError when attempting to set unknown attribute
+        """
+        cls._format(format, 'deserialize_many')
+        if format == 'msgpack' and not isinstance(string, bytes):
+            raise TypeError(f'{cls.__name__}.deserialize_many: must be set to bytes')
+        if format == 'json' and not isinstance(string, str):
+            raise TypeError(f'{cls.__name__}.deserialize_many: must be set to a string')
+        if not isinstance(class_, type):
+            raise TypeError(f'{cls.__name__}.deserialize_many: class_ must be set to a class')
+        if not isinstance(lines, bool):
+            raise TypeError(f'{cls.__name__}.deserialize_many: lines must be set to a boolean')
+        if not string:
+            raise ValueError(f'{cls.__name__}.deserialize_many: string cannot be empty')
+        if format == 'msgpack':
+            dictionaries = list(MessagePack.iter_unpack(string)) if lines else MessagePack.unpack(string)
+        elif lines:
+            dictionaries = [loads(line) for line in string.splitlines() if line.strip()]
+        else:
+            dictionaries = loads(string)
+        if not isinstance(dictionaries, list):
+            raise TypeError(f'{cls.__name__}.deserialize_many: string must contain an array')
+        objects = []
+        denormalize = None
+        for dictionary in dictionaries:
+            if not isinstance(dictionary, dict):
+                raise TypeError(f'{cls.__name__}.deserialize_many: must contain dictionaries')
+            if dictionary == {}:
+                raise ValueError(f'{cls.__name__}.deserialize_many: dictionary cannot be empty')
+            object_ = class_()
+            if denormalize is None:
+                denormalize = cls._plan(object_)['denormalize']
+            denormalize(object_, dictionary)
+            objects.append(object_)
+        return objects
+
+    ##################################################
+
+    @classmethod
+    def normalize_many(cls, objects: Iterable) -> Iterator[dict]:
+        """Normalize objects: lazily yield objects as dictionaries"""
+        if isinstance(objects, (str, bytes, dict)) or not isinstance(objects, Iterable):
+            raise TypeError(f'{cls.__name__}.normalize_many: must be set to an iterable')
+        return cls._normalize_many(objects)
+
+    ##################################################
+
+    @classmethod
+    def _normalize_many(cls, objects: Iterable) -> Iterator[dict]:
+        """Yield objects as dictionaries, through each class compiled normalizer"""
+        class_ = None
+        for object_ in objects:
+            if type(object_) is not class_:
+                class_ = type(object_)
+                normalize = cls._plan(object_)['normalize']
+            yield normalize(object_)
+
+    ##################################################
+
+    @classmethod
+    def clear_cache(cls, class_: Optional[type] = None) -> None:
+        """
+        clear_cache: drop compiled field plans for given class (or every class)
+        NOTE: called by Annotations.clear_cache, so plans never outlive introspection tables
+        """
+        if class_ is None:
+            cls._PLANS.clear()
+        else:
+            cls._PLANS.pop(class_, None)
+
+    ##################################################
+
+    @classmethod
+    def _format(cls, format: str, method: str) -> None:
+        """Check format is supported"""
+        if format not in cls.FORMATS:
+            raise ValueError(f'{cls.__name__}.{method}: format must be one of {cls.FORMATS}')
+
+    ##################################################
+
+    @classmethod
+    def _plan(cls, object_: Any) -> dict:
+        """Return cached field plan of object class, compile it on first access"""
+        class_ = type(object_)
+        try:
+            return cls._PLANS[class_]
+        except KeyError:
+            pass
+        # class members only: public attributes set on instances are handled per object
+        fields = Annotations(object_)._table()['properties']
+        plan = {'fields': fields, 'properties': frozenset(fields)}
+        plan.update(cls._compile(class_.__name__, fields))
+        cls._PLANS[class_] = plan
+        return plan
+
+    ##################################################
+
+    @staticmethod
+    def _instance_members(object_: Any) -> list:
+        """Return public non callable attributes set on the instance itself (see: Annotations)"""
+        attributes = getattr(object_, '__dict__', None)
+        if not attributes:
+            return []
+        return [name for name, value in attributes.items() if not name.startswith('_') and not callable(value)]
+
+    ##################################################
+
+    @staticmethod
+    def _compile(name: str, fields: tuple) -> dict:
+        """Generate normalize(object_) and denormalize(object_, dictionary) functions for given fields
+        NOTE: fields which are not valid identifiers (e.g. set with setattr) are read and written with getattr/setattr,
+              known fields are set in sorted order
+        """
+        getters = {}
+        setters = {}
+        for field in fields:
+            if field.isidentifier() and not iskeyword(field):
+                getters[field] = f'object_.{field}'
+                setters[field] = f'object_.{field} = dictionary[{field!r}]'
+            else:
+                getters[field] = f'getattr(object_, {field!r})'
+                setters[field] = f'setattr(object_, {field!r}, dictionary[{field!r}])'
+        lines = [
+            'def normalize(object_):',
+            '    dictionary = {' + ', '.join(f'{field!r}: {getters[field]}' for field in fields) + '}',
+            '    extra = instance_members(object_)',
+            '    if extra:',
+            '        for property_ in extra:',
+            '            dictionary[property_] = getattr(object_, property_)',
+            '        return dict(sorted(dictionary.items()))',
+            '    return dictionary',
+            '',
+            'def denormalize(object_, dictionary):',
+            '    if not properties.issuperset(dictionary):',
+            '        extra = instance_members(object_)',
+            '        for property_ in dictionary:',
+            '            if property_ not in properties and property_ not in extra:',
+            '                raise AttributeError(f"{name} has no attribute {property_}")',
+            '        for property_, value_ in dictionary.items():',
+            '            if property_ not in properties:',
+            '                setattr(object_, property_, value_)',
+        ]
+        for field in fields:
+            lines.append(f'    if {field!r} in dictionary:')
+            lines.append(f'        {setters[field]}')
+        namespace = {'properties': frozenset(fields), 'name': name, 'instance_members': Serializer._instance_members}
+        exec(compile('\n'.join(lines) + '\n', f'<serializer {name}>', 'exec'), namespace)
+        return {'normalize': namespace['normalize'], 'denormalize': namespace['denormalize']}
+
 
 ##################################################
 
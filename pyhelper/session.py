@@ -10,14 +10,20 @@
  with this source code in the file LICENSE.
 """
 
+from collections import deque
+from concurrent.futures import (ThreadPoolExecutor, wait, FIRST_COMPLETED)
+from itertools import islice
 from random import choice
+from typing import Iterable, Iterator, Tuple
 
 from requests import session
+from requests.adapters import HTTPAdapter
 
 
 class Session:
     """
     Create a session and send requests spoofing UserAgent with optional Tor network
+    NOTE: connection pool is sized once with "pool_size", keep it at least equal to "send_requests" concurrency
     """
 
     USER_AGENTS = [
@@ -103,10 +109,18 @@ class Session:
     # Constructor
     ##################################################
 
-    def __init__(self, tor: bool = False):
+    def __init__(self, tor: bool = False, pool_size: int = 10):
         if not isinstance(tor, bool):
             raise TypeError('tor must be set to a boolean')
+        if isinstance(pool_size, bool) or not isinstance(pool_size, int):
+            raise TypeError('pool_size must be set to a integer')
+        if pool_size < 1:
+            raise ValueError('pool_size must be positive integer')
         self.session = session()
+        # size connection pool once so concurrent requests reuse connections instead of discarding them
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
         if tor:
             try:
                 self.session.proxies['http'] = 'socks5h://localhost:9050'
@@ -144,7 +158,7 @@ class Session:
             user_agents = self.USER_AGENTS
         if timeout < 0:
             raise ValueError('timeout must be positive integer')
-        headers = {'User-Agent': self.get_random_user_agent()}
+        headers = {'User-Agent': choice(user_agents)}
         response = None
         try:
             response = self.session.get(uri, headers=headers, timeout=timeout, allow_redirects=allow_redirects)
@@ -153,6 +167,61 @@ class Session:
         finally:
             return response
 
+    ##################################################
+
+    def send_requests(self, uris: Iterable[str], concurrency: int = 10, ordered: bool = False,
+                      user_agents: list = [], timeout: int = 5, allow_redirects: bool = True) -> Iterator[Tuple]:
+        """
+        send_requests: fan requests out over a bounded thread pool sharing current session connection pool,
+        yield (uri, response) tuples in completion order (or input order when ordered)
+        NOTE: at most "concurrency * 2" requests are queued at once so uris can be a lazy iterable
+        NOTE: session adapters are left untouched, connections above "pool_size" (see: __init__) are not kept
+        """
+        if isinstance(uris, (str, bytes)) or not isinstance(uris, Iterable):
+            raise TypeError('uris must be set to an iterable of strings')
+        if isinstance(concurrency, bool) or not isinstance(concurrency, int):
+            raise TypeError('concurrency must be set to a integer')
+        if not isinstance(ordered, bool):
+            raise TypeError('ordered must be set to a boolean')
+        if not isinstance(user_agents, list):
+            raise TypeError('user_agents must be set to a list')
+        if isinstance(timeout, bool) or not isinstance(timeout, int):
+            raise TypeError('timeout must be set to a integer')
+        if not isinstance(allow_redirects, bool):
+            raise TypeError('allow_redirects must be set to a boolean')
+        if concurrency < 1:
+            raise ValueError('concurrency must be positive integer')
+        if timeout < 0:
+            raise ValueError('timeout must be positive integer')
+        return self._send_requests(iter(uris), concurrency, ordered, user_agents, timeout, allow_redirects)
+
+    ##################################################
+
+    def _send_requests(self, uris: Iterator[str], concurrency: int, ordered: bool,
+                       user_agents: list, timeout: int, allow_redirects: bool) -> Iterator[Tuple]:
+        """Keep thread pool busy with a bounded number of pending requests"""
+        def submit(uri):
+            future = executor.submit(self.send_request, uri, user_agents, timeout, allow_redirects)
+            futures[future] = uri
+            return future
+
+        futures = {}
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            if ordered:
+                pending = deque(submit(uri) for uri in islice(uris, concurrency * 2))
+                while pending:
+                    future = pending.popleft()
+                    yield futures.pop(future), future.result()
+                    for uri in islice(uris, 1):
+                        pending.append(submit(uri))
+            else:
+                pending = set(submit(uri) for uri in islice(uris, concurrency * 2))
+                while pending:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        yield futures.pop(future), future.result()
+                    pending.update(submit(uri) for uri in islice(uris, len(done)))
+
 
 ##################################################
 
@@ -10,7 +10,11 @@
  with this source code in the file LICENSE.
 """
 
+from contextlib import contextmanager
+from functools import lru_cache
+from itertools import (chain, islice)
 from sqlite3 import (connect, OperationalError)
+from typing import Callable, Iterable, Iterator, Optional, Union
 
 
 class Sqlite:
@@ -33,39 +37,139 @@ class Sqlite:
         'UNIQUE'
     )
 
+    # tuning pragmas in application order ("page_size" must come before "journal_mode=wal" on new databases)
+    # https://sqlite.org/pragma.html
+    PRAGMAS = (
+        'page_size',
+        'journal_mode',
+        'synchronous',
+        'cache_size',
+        'mmap_size',
+        'temp_store'
+    )
+
+    PROFILES = {
+        # fastest writes, database may be corrupted on power loss
+        'bulk-load': {
+            'page_size': 65536,
+            'journal_mode': 'wal',
+            'synchronous': 'off',
+            'cache_size': -262144,
+            'mmap_size': 268435456,
+            'temp_store': 'memory',
+        },
+        # concurrent readers with a single writer, memory mapped reads
+        'read-heavy': {
+            'page_size': 4096,
+            'journal_mode': 'wal',
+            'synchronous': 'normal',
+            'cache_size': -65536,
+            'mmap_size': 1073741824,
+            'temp_store': 'memory',
+        },
+        # every committed transaction survives power loss
+        'durable': {
+            'page_size': 4096,
+            'journal_mode': 'wal',
+            'synchronous': 'full',
+            'cache_size': -16384,
+            'mmap_size': 0,
+            'temp_store': 'default',
+        },
+    }
+
+    SYNCHRONOUS = ('off', 'normal', 'full', 'extra')
+
+    TEMP_STORE = ('default', 'file', 'memory')
+
     ##################################################
     # Constructor
     ##################################################
 
-    def __init__(self, db_file: str = ':memory:', autocommit: bool = True, journal_mode: str = 'off'):
+    def __init__(self, db_file: str = ':memory:', autocommit: bool = True, journal_mode: Optional[str] = None,
+                 sql_cache_size: int = 256, check_same_thread: bool = True, profile: Optional[str] = None):
         """
         create_connection
         https://sqlite.org/pragma.html
+        NOTE: journal_mode defaults to "off" or to given profile one (see: PROFILES)
+        NOTE: generated sql strings are cached (LRU, "sql_cache_size" entries) and sqlite3 prepared statement cache
+        is sized accordingly so repeated calls only pay for "execute"
+        NOTE: set "check_same_thread" to False only when access is serialized by caller (see: SqlitePool)
         """
         if not isinstance(db_file, str):
             raise TypeError('db_file must be set to a string')
         if not isinstance(autocommit, bool):
             raise TypeError('autocommit must be set to a boolean')
-        if not isinstance(journal_mode, str):
+        if journal_mode is not None and not isinstance(journal_mode, str):
             raise TypeError('journal_mode must be set to a string')
+        if profile is not None and not isinstance(profile, str):
+            raise TypeError('profile must be set to a string')
+        if isinstance(sql_cache_size, bool) or not isinstance(sql_cache_size, int):
+            raise TypeError('sql_cache_size must be set to a integer')
+        if not isinstance(check_same_thread, bool):
+            raise TypeError('check_same_thread must be set to a boolean')
         if not db_file:
             raise ValueError('db_file cannot be empty')
+        if sql_cache_size < 0:
+            raise ValueError('sql_cache_size must be positive integer')
+        if profile is not None and profile not in self.PROFILES:
+            raise ValueError(f'profile must be one of {tuple(self.PROFILES)}')
         self.connection = None
         self.cursor = None
+        # per connection sql cache keyed by (operation, table, columns)
+        self._sql = lru_cache(maxsize=sql_cache_size)(self._build_sql)
         try:
             if autocommit:
                 # open database in autocommit mode by setting isolation_level to none
-                self.connection = connect(db_file, isolation_level=None)
+                self.connection = connect(db_file, isolation_level=None, cached_statements=sql_cache_size,
+                                          check_same_thread=check_same_thread)
+            else:
+                self.connection = connect(db_file, cached_statements=sql_cache_size,
+                                          check_same_thread=check_same_thread)
+            if profile is not None:
+                self.apply_profile(profile, journal_mode)
             else:
-                self.connection = connect(db_file)
-            # disable rollback journal (heavy disk usage)
-            self.connection.execute('pragma journal_mode=' + journal_mode)
+                # disable rollback journal (heavy disk usage)
+                self.connection.execute('pragma journal_mode=' + (journal_mode or 'off'))
             self.cursor = self.connection.cursor()
         except OperationalError as e:
             raise e
 
     ##################################################
 
+    def apply_profile(self, profile: str, journal_mode: Optional[str] = None) -> dict:
+        """
+        apply_profile: apply named tuning profile pragmas (journal_mode overrides profile one), return settings
+        """
+        if not isinstance(profile, str):
+            raise TypeError('profile must be set to a string')
+        if journal_mode is not None and not isinstance(journal_mode, str):
+            raise TypeError('journal_mode must be set to a string')
+        if profile not in self.PROFILES:
+            raise ValueError(f'profile must be one of {tuple(self.PROFILES)}')
+        pragmas = dict(self.PROFILES[profile])
+        if journal_mode is not None:
+            pragmas['journal_mode'] = journal_mode
+        for pragma in self.PRAGMAS:
+            if pragma in pragmas:
+                self.connection.execute('pragma ' + pragma + '=' + str(pragmas[pragma]))
+        return self.settings()
+
+    ##################################################
+
+    def settings(self) -> dict:
+        """
+        settings: return effective tuning pragmas values
+        """
+        settings = {}
+        for pragma in self.PRAGMAS:
+            settings[pragma] = self.connection.execute('pragma ' + pragma).fetchone()[0]
+        settings['synchronous'] = self.SYNCHRONOUS[settings['synchronous']]
+        settings['temp_store'] = self.TEMP_STORE[settings['temp_store']]
+        return settings
+
+    ##################################################
+
     def create(self, table: str, schema: dict):
         """
         create
@@ -99,11 +203,7 @@ class Sqlite:
             raise TypeError('item must be set to a dictionary')
         if len(item) == 0:
             raise ValueError('item cannot be empty')
-        table = self.sanitize(table)
-        # lambda: prefix colon to each key
-        sql = 'INSERT INTO "' + table + '" VALUES(' + ', '.join(list(map(
-            lambda key: ':' + self.sanitize(key), item.keys()
-        ))) + ');'
+        sql = self._sql('insert', table, tuple(item.keys()))
         try:
             self.cursor.execute(sql, item)
         except OperationalError as e:
@@ -113,28 +213,211 @@ class Sqlite:
 
     ##################################################
 
-    def find(self, table: str, item: dict) -> list:
+    def insert_many(self, table: str, items: Iterable[dict], batch_size: int = 1000) -> int:
+        """
+        insert_many: prepare statement once from first item keys, then insert each batch
+        with executemany inside its own transaction; items may be any iterable (consumed lazily)
+        NOTE: batch atomicity requires a journal: with journal_mode "off" ROLLBACK is undefined in sqlite,
+              so a failed batch may be left partially written
+        NOTE: inside an already open transaction, each batch runs in a savepoint and the transaction is left open
+        """
+        if not isinstance(table, str):
+            raise TypeError('table must be set to a string')
+        if isinstance(items, (str, bytes, dict)) or not isinstance(items, Iterable):
+            raise TypeError('items must be set to an iterable of dictionaries')
+        if isinstance(batch_size, bool) or not isinstance(batch_size, int):
+            raise TypeError('batch_size must be set to a integer')
+        if batch_size < 1:
+            raise ValueError('batch_size must be positive integer')
+        items = iter(items)
+        first = next(items, None)
+        if first is None:
+            raise ValueError('items cannot be empty')
+        if not isinstance(first, dict):
+            raise TypeError('items must contain dictionaries')
+        if len(first) == 0:
+            raise ValueError('items cannot contain empty dictionaries')
+        sql = self._sql('insert', table, tuple(first.keys()))
+        return self._executemany_batches(sql, chain([first], items), batch_size)
+
+    ##################################################
+
+    def upsert_many(self, table: str, items: Iterable[dict], conflict_columns: Union[str, list],
+                    batch_size: int = 1000) -> int:
+        """
+        upsert_many: insert items or update existing rows conflicting on "conflict_columns" (unique or primary key),
+        in one round trip per row and one transaction per batch; items may be any iterable (consumed lazily)
+        NOTE: same transaction rules as insert_many (atomicity requires a journal, savepoint inside open transaction)
+        https://sqlite.org/lang_upsert.html
+        """
+        if not isinstance(table, str):
+            raise TypeError('table must be set to a string')
+        if isinstance(items, (str, bytes, dict)) or not isinstance(items, Iterable):
+            raise TypeError('items must be set to an iterable of dictionaries')
+        if isinstance(conflict_columns, str):
+            conflict_columns = [conflict_columns]
+        if not isinstance(conflict_columns, (list, tuple)) or \
+                not all(isinstance(column, str) for column in conflict_columns):
+            raise TypeError('conflict_columns must be set to a string or a list of strings')
+        if isinstance(batch_size, bool) or not isinstance(batch_size, int):
+            raise TypeError('batch_size must be set to a integer')
+        if len(conflict_columns) == 0:
+            raise ValueError('conflict_columns cannot be empty')
+        if batch_size < 1:
+            raise ValueError('batch_size must be positive integer')
+        items = iter(items)
+        first = next(items, None)
+        if first is None:
+            raise ValueError('items cannot be empty')
+        if not isinstance(first, dict):
+            raise TypeError('items must contain dictionaries')
+        if len(first) == 0:
+            raise ValueError('items cannot contain empty dictionaries')
+        sql = self._sql('upsert', table, tuple(first.keys()), conflict=tuple(conflict_columns))
+        return self._executemany_batches(sql, chain([first], items), batch_size)
+
+    ##################################################
+
+    def _executemany_batches(self, sql: str, items: Iterable, batch_size: int) -> int:
+        """Execute statement with each batch of items inside its own transaction, return item count"""
+        count = 0
+        while True:
+            batch = list(islice(items, batch_size))
+            if not batch:
+                break
+            with self._transaction():
+                self.cursor.executemany(sql, batch)
+            count += len(batch)
+        return count
+
+    ##################################################
+
+    @contextmanager
+    def _transaction(self) -> Iterator[None]:
+        """Run block inside its own transaction, or inside a savepoint when caller transaction is already open
+        (caller transaction is then neither committed nor rolled back)
+        """
+        if self.connection.in_transaction:
+            self.cursor.execute('SAVEPOINT pyhelper_batch')
+            try:
+                yield
+            except BaseException:
+                self.cursor.execute('ROLLBACK TO pyhelper_batch')
+                self.cursor.execute('RELEASE pyhelper_batch')
+                raise
+            self.cursor.execute('RELEASE pyhelper_batch')
+            return
+        self.cursor.execute('BEGIN')
+        try:
+            yield
+        except BaseException:
+            self.connection.rollback()
+            raise
+        self.connection.commit()
+
+    ##################################################
+
+    def find(self, table: str, item: dict, order_by: Union[str, list, None] = None,
+             limit: Optional[int] = None) -> list:
+        """
+        find: return rows matching every item key (AND), optionally sorted by "order_by" columns
+        ("-" prefix for descending order) and limited to "limit" rows
+        """
+        self._execute_select(self.cursor, table, item, order_by, limit)
+        return self.cursor.fetchall()
+
+    ##################################################
+
+    def iter_find(self, table: str, item: dict, chunk_size: int = 1000, row_factory: Optional[Callable] = None,
+                  order_by: Union[str, list, None] = None, limit: Optional[int] = None) -> Iterator:
+        """
+        iter_find: lazily yield matching rows fetched by chunks, as dictionaries by default
+        or as "row_factory(cursor, row)" results (see: sqlite3.Connection.row_factory)
+        NOTE: query runs on its own cursor so other operations can run while iterating
+        """
+        if isinstance(chunk_size, bool) or not isinstance(chunk_size, int):
+            raise TypeError('chunk_size must be set to a integer')
+        if row_factory is not None and not callable(row_factory):
+            raise TypeError('row_factory must be callable')
+        if chunk_size < 1:
+            raise ValueError('chunk_size must be positive integer')
+        cursor = self.connection.cursor()
+        try:
+            self._execute_select(cursor, table, item, order_by, limit)
+        except Exception as e:
+            cursor.close()
+            raise e
+        return self._iter_cursor(cursor, chunk_size, row_factory)
+
+    ##################################################
+
+    @staticmethod
+    def _iter_cursor(cursor, chunk_size: int, row_factory: Optional[Callable]) -> Iterator:
+        """Yield rows from cursor with fetchmany, then close cursor"""
+        try:
+            if row_factory is None:
+                columns = [column[0] for column in cursor.description]
+            while True:
+                rows = cursor.fetchmany(chunk_size)
+                if not rows:
+                    break
+                if row_factory is None:
+                    for row in rows:
+                        yield dict(zip(columns, row))
+                else:
+                    for row in rows:
+                        yield row_factory(cursor, row)
+        finally:
+            cursor.close()
+
+    ##################################################
+
+    def explain(self, table: str, item: dict, order_by: Union[str, list, None] = None,
+                limit: Optional[int] = None) -> list:
         """
-        find
+        explain: return query plan details of matching "find" query (e.g. "SEARCH users USING INDEX ...")
+        https://sqlite.org/eqp.html
         """
+        cursor = self.connection.cursor()
+        try:
+            self._execute_select(cursor, table, item, order_by, limit, 'EXPLAIN QUERY PLAN ')
+            return [row[-1] for row in cursor.fetchall()]
+        finally:
+            cursor.close()
+
+    ##################################################
+
+    def _execute_select(self, cursor, table: str, item: dict, order_by: Union[str, list, None],
+                        limit: Optional[int], prefix: str = '') -> None:
+        """Validate find parameters and execute select query on given cursor"""
         if not isinstance(table, str):
             raise TypeError('table must be set to a string')
         if not isinstance(item, dict):
             raise TypeError('item must be set to a dictionary')
+        if isinstance(order_by, str):
+            order_by = [order_by]
+        if order_by is None:
+            order_by = []
+        if not isinstance(order_by, (list, tuple)) or not all(isinstance(column, str) for column in order_by):
+            raise TypeError('order_by must be set to a string or a list of strings')
+        if limit is not None and (isinstance(limit, bool) or not isinstance(limit, int)):
+            raise TypeError('limit must be set to a integer')
         if len(item) == 0:
             raise ValueError('item cannot be empty')
-        table = self.sanitize(table)
-        key = self.sanitize(str(list(item.keys())[0]))
-        value = str(list(item.values())[0])
-        sql = 'SELECT * FROM "' + table + '" WHERE ' + key + '=:' + key
-        self.cursor.execute(sql, {key: value})
-        return self.cursor.fetchall()
+        if limit is not None and limit < 0:
+            raise ValueError('limit must be positive integer')
+        # values are bound positionally with their native type so INTEGER indexes are used
+        parameters = list(item.values())
+        if limit is not None:
+            parameters.append(limit)
+        sql = self._sql('find', table, tuple(item.keys()), tuple(order_by), limit is not None)
+        cursor.execute(prefix + sql, parameters)
 
     ##################################################
 
     def delete(self, table: str, item: dict) -> None:
         """
-        delete
+        delete: delete rows matching every item key (AND)
         """
         if not isinstance(table, str):
             raise TypeError('table must be set to a string')
@@ -142,11 +425,120 @@ class Sqlite:
             raise TypeError('item must be set to a dictionary')
         if len(item) == 0:
             raise ValueError('item cannot be empty')
+        self.cursor.execute(self._sql('delete', table, tuple(item.keys())), list(item.values()))
+
+    ##################################################
+
+    def delete_many(self, table: str, key: str, values: Iterable, chunk_size: int = 500) -> int:
+        """
+        delete_many: delete rows where "key" is in values, by chunked "IN (...)" lists inside a single transaction,
+        return deleted row count; values may be any iterable (consumed lazily)
+        NOTE: chunk_size must stay below SQLITE_MAX_VARIABLE_NUMBER (999 before sqlite 3.32)
+        NOTE: atomicity requires a journal (see: insert_many), runs in a savepoint inside an open transaction
+        """
+        if not isinstance(table, str):
+            raise TypeError('table must be set to a string')
+        if not isinstance(key, str):
+            raise TypeError('key must be set to a string')
+        if isinstance(values, (str, bytes, dict)) or not isinstance(values, Iterable):
+            raise TypeError('values must be set to an iterable')
+        if isinstance(chunk_size, bool) or not isinstance(chunk_size, int):
+            raise TypeError('chunk_size must be set to a integer')
+        if not key:
+            raise ValueError('key cannot be empty')
+        if chunk_size < 1:
+            raise ValueError('chunk_size must be positive integer')
+        values = iter(values)
+        count = 0
+        with self._transaction():
+            while True:
+                chunk = list(islice(values, chunk_size))
+                if not chunk:
+                    break
+                self.cursor.execute(self._sql('delete_in', table, (key,), size=len(chunk)), chunk)
+                count += self.cursor.rowcount
+        return count
+
+    ##################################################
+
+    def create_index(self, table: str, columns: Union[str, list], unique: bool = False) -> str:
+        """
+        create_index: create index on given columns when missing, return index name
+        """
+        if not isinstance(table, str):
+            raise TypeError('table must be set to a string')
+        if isinstance(columns, str):
+            columns = [columns]
+        if not isinstance(columns, (list, tuple)) or not all(isinstance(column, str) for column in columns):
+            raise TypeError('columns must be set to a string or a list of strings')
+        if not isinstance(unique, bool):
+            raise TypeError('unique must be set to a boolean')
+        if len(columns) == 0:
+            raise ValueError('columns cannot be empty')
+        table = self.sanitize(table)
+        columns = [self.sanitize(column) for column in columns]
+        name = '_'.join([table] + columns) + ('_unique' if unique else '') + '_index'
+        sql = 'CREATE ' + ('UNIQUE ' if unique else '') + 'INDEX IF NOT EXISTS "' + name + '" ON "' + table + \
+              '" (' + ', '.join(columns) + ');'
+        try:
+            self.cursor.execute(sql)
+        except OperationalError as e:
+            raise e
+        return name
+
+    ##################################################
+
+    def sql_cache_info(self) -> dict:
+        """
+        sql_cache_info: return generated sql cache statistics
+        """
+        info = self._sql.cache_info()
+        return {'hits': info.hits, 'misses': info.misses, 'maxsize': info.maxsize, 'currsize': info.currsize}
+
+    ##################################################
+
+    def sql_cache_clear(self) -> None:
+        """
+        sql_cache_clear
+        """
+        self._sql.cache_clear()
+
+    ##################################################
+
+    def _build_sql(self, operation: str, table: str, columns: tuple, order_by: tuple = (),
+                   limit: bool = False, conflict: tuple = (), size: int = 0) -> str:
+        """Generate sql string for given operation, table and columns"""
         table = self.sanitize(table)
-        key = self.sanitize(str(list(item.keys())[0]))
-        value = str(list(item.values())[0])
-        sql = 'DELETE FROM "' + table + '" WHERE ' + key + '=:' + key
-        self.cursor.execute(sql, {key: value})
+        if operation == 'insert':
+            # lambda: prefix colon to each key
+            return 'INSERT INTO "' + table + '" VALUES(' + ', '.join(list(map(
+                lambda key: ':' + self.sanitize(key), columns
+            ))) + ');'
+        if operation == 'upsert':
+            keys = [self.sanitize(key) for key in columns]
+            conflict = [self.sanitize(column) for column in conflict]
+            updates = [key for key in keys if key not in conflict]
+            sql = 'INSERT INTO "' + table + '" (' + ', '.join(keys) + ') VALUES(' + ', '.join(
+                [':' + key for key in keys]) + ') ON CONFLICT (' + ', '.join(conflict) + ') DO '
+            if not updates:
+                return sql + 'NOTHING;'
+            return sql + 'UPDATE SET ' + ', '.join([key + '=excluded.' + key for key in updates]) + ';'
+        if operation == 'delete_in':
+            return 'DELETE FROM "' + table + '" WHERE ' + self.sanitize(columns[0]) + ' IN (' + ', '.join(
+                ['?'] * size) + ');'
+        where = ' AND '.join([self.sanitize(str(key)) + '=?' for key in columns])
+        if operation == 'find':
+            sql = 'SELECT * FROM "' + table + '" WHERE ' + where
+            if order_by:
+                sql += ' ORDER BY ' + ', '.join([
+                    self.sanitize(column) + (' DESC' if column.startswith('-') else ' ASC') for column in order_by
+                ])
+            if limit:
+                sql += ' LIMIT ?'
+            return sql
+        if operation == 'delete':
+            return 'DELETE FROM "' + table + '" WHERE ' + where
+        raise ValueError(f'unknown operation "{operation}"')
 
     ##################################################
 
@@ -0,0 +1,157 @@
+#!/bin/python3
+# -*- coding: utf-8 -*-
+
+"""
+ This file is part of the TangoMan PyHelper package.
+
+ (c) "Matthias Morin" <mat@tangoman.io>
+
+ This source file is subject to the MIT license that is bundled
+ with this source code in the file LICENSE.
+"""
+
+from contextlib import contextmanager
+from queue import (Empty, LifoQueue)
+from threading import Lock
+from typing import Iterator, Optional
+
+from pyhelper.sqlite import Sqlite
+
+
+class SqlitePool:
+    """
+    Share a sqlite database file across threads: a pool of read-only connections plus a single serialized writer.
+    Connections are opened lazily (up to "size" readers) and configured like "Sqlite" ones.
+    https://sqlite.org/wal.html
+    ```
+    pool = SqlitePool('database.db', size=8)
+    with pool.writer() as db:
+        db.insert_many('users', items)
+    with pool.reader() as db:
+        db.find('users', {'id': 1})
+    ```
+    """
+
+    ##################################################
+    # Constructor
+    ##################################################
+
+    def __init__(self, db_file: str, size: int = 4, autocommit: bool = True, journal_mode: str = 'wal',
+                 timeout: Optional[float] = None, profile: Optional[str] = None):
+        """
+        NOTE: readers only scale with "wal" journal_mode, other modes lock readers out while writing
+        NOTE: every connection is tuned with given profile (see: Sqlite.PROFILES)
+        """
+        if not isinstance(db_file, str):
+            raise TypeError('db_file must be set to a string')
+        if isinstance(size, bool) or not isinstance(size, int):
+            raise TypeError('size must be set to a integer')
+        if not isinstance(autocommit, bool):
+            raise TypeError('autocommit must be set to a boolean')
+        if not isinstance(journal_mode, str):
+            raise TypeError('journal_mode must be set to a string')
+        if timeout is not None and (isinstance(timeout, bool) or not isinstance(timeout, (int, float))):
+            raise TypeError('timeout must be set to a number')
+        if profile is not None and not isinstance(profile, str):
+            raise TypeError('profile must be set to a string')
+        if not db_file:
+            raise ValueError('db_file cannot be empty')
+        if db_file == ':memory:':
+            raise ValueError('db_file cannot be ":memory:" (every connection would open its own database)')
+        if size < 1:
+            raise ValueError('size must be positive integer')
+        if profile is not None and profile not in Sqlite.PROFILES:
+            raise ValueError(f'profile must be one of {tuple(Sqlite.PROFILES)}')
+        self.db_file = db_file
+        self.size = size
+        self.autocommit = autocommit
+        self.journal_mode = journal_mode
+        self.timeout = timeout
+        self.profile = profile
+        self._readers = LifoQueue()
+        self._opened = 0
+        self._lock = Lock()
+        self._writer_lock = Lock()
+        # writer opened first: sets journal mode for whole database
+        self._writer = self._connect()
+
+    ##################################################
+
+    def _connect(self) -> Sqlite:
+        """Open a connection shareable between threads"""
+        return Sqlite(self.db_file, autocommit=self.autocommit, journal_mode=self.journal_mode,
+                      check_same_thread=False, profile=self.profile)
+
+    ##################################################
+
+    @contextmanager
+    def reader(self) -> Iterator[Sqlite]:
+        """
+        reader: borrow a read-only connection (waits up to "timeout" seconds when every reader is busy)
+        """
+        db = None
+        try:
+            db = self._readers.get_nowait()
+        except Empty:
+            with self._lock:
+                if self._opened < self.size:
+                    self._opened += 1
+                    try:
+                        db = self._connect()
+                        db.connection.execute('pragma query_only=1')
+                    except Exception as e:
+                        self._opened -= 1
+                        raise e
+        if db is None:
+            try:
+                db = self._readers.get(timeout=self.timeout)
+            except Empty:
+                raise TimeoutError(f'{self.__class__.__name__}.reader no connection available')
+        try:
+            yield db
+        finally:
+            if db.connection.in_transaction:
+                db.connection.rollback()
+            self._readers.put(db)
+
+    ##################################################
+
+    @contextmanager
+    def writer(self) -> Iterator[Sqlite]:
+        """
+        writer: lock and borrow the single writer connection
+        NOTE: transaction left open when block exits (e.g. on error) is rolled back, commit before leaving block
+        """
+        if not self._writer_lock.acquire(timeout=-1 if self.timeout is None else self.timeout):
+            raise TimeoutError(f'{self.__class__.__name__}.writer connection not available')
+        try:
+            yield self._writer
+        finally:
+            try:
+                if self._writer.connection.in_transaction:
+                    self._writer.connection.rollback()
+            finally:
+                self._writer_lock.release()
+
+    ##################################################
+
+    def close(self) -> None:
+        """
+        close: close every idle connection and writer
+        """
+        with self._lock:
+            while True:
+                try:
+                    self._readers.get_nowait().close()
+                except Empty:
+                    break
+                self._opened -= 1
+        with self._writer_lock:
+            self._writer.close()
+
+
+##################################################
+
+
+if __name__ == '__main__':
+    pass
@@ -157,3 +157,75 @@ class AbstractCollectionTest(TestCase):
     def test_len(self):
         """==> len(object_) should return item count"""
         self.assertEqual(len(self.collection), 2)
+
+    ##################################################
+
+    def test_find(self):
+        """==> object_.find should return items matching every criteria"""
+        collection = AbstractCollection(self.fixtures, 'name', {'email': 'hash', 'id': 'sorted'})
+        self.assertEqual(collection.find(email='foobar@example.com'), [self.fixtures[1]])
+        self.assertEqual(collection.find(email='foobar@example.com', id=2), [self.fixtures[1]])
+        self.assertEqual(collection.find(email='foobar@example.com', id=1), [])
+        self.assertEqual(collection.find(name='tangoman', id=1), [self.fixtures[0]])
+        self.assertEqual(collection.find(email='ping@example.com'), [])
+
+    def test_find_without_index(self):
+        """==> object_.find should scan items when field is not indexed"""
+        self.assertEqual(self.collection.find(email='mat@tangoman.io'), [self.fixtures[0]])
+
+    def test_find_maintained_indexes(self):
+        """==> object_.add, update and remove should maintain secondary indexes"""
+        collection = AbstractCollection(self.fixtures, 'name', {'email': 'hash', 'id': 'sorted'})
+        pingpong = Dummy({'name': 'pingpong', 'id': 3, 'email': 'foobar@example.com'})
+        collection.add(pingpong)
+        self.assertEqual(len(collection.find(email='foobar@example.com')), 2)
+        collection.update(Dummy({'name': 'pingpong', 'email': 'ping@example.com'}))
+        self.assertEqual(collection.find(email='foobar@example.com'), [self.fixtures[1]])
+        self.assertEqual(collection.find(email='ping@example.com')[0].id, 3)
+        collection.remove(self.fixtures[1])
+        self.assertEqual(collection.find(email='foobar@example.com'), [])
+        self.assertEqual([item.id for item in collection.range('id')], [1, 3])
+
+    def test_find_mutated_then_updated(self):
+        """==> object_.update should reindex item modified in place"""
+        collection = AbstractCollection(self.fixtures, 'name', {'email': 'hash', 'id': 'sorted'})
+        item = collection.get(self.fixtures[0].name)
+        email = item.email
+        item.email = 'mutated@example.com'
+        item.id = 10
+        collection.update(item)
+        self.assertEqual(collection.find(email=email), [])
+        self.assertEqual(collection.find(email='mutated@example.com'), [item])
+        self.assertEqual(collection.find(email='mutated@example.com', id=1), [])
+        self.assertEqual([value.id for value in collection.range('id', 10)], [10])
+
+    def test_range(self):
+        """==> object_.range should return items between bounds ordered by value"""
+        collection = AbstractCollection(self.fixtures, 'name', {'id': 'sorted'})
+        collection.add(Dummy({'name': 'pingpong', 'id': 0}))
+        self.assertEqual([item.id for item in collection.range('id')], [0, 1, 2])
+        self.assertEqual([item.id for item in collection.range('id', 1)], [1, 2])
+        self.assertEqual([item.id for item in collection.range('id', 1, 1)], [1])
+        self.assertEqual([item.id for item in collection.range('id', hi=1)], [0, 1])
+
+    def test_range_maintained_sorted_index(self):
+        """==> object_.add and remove should keep sorted index sorted without rebuilding it"""
+        collection = AbstractCollection(self.fixtures, 'name', {'id': 'sorted'})
+        collection.range('id')
+        collection.add(Dummy({'name': 'pingpong', 'id': 0}))
+        self.assertEqual(collection._sorted['id'], [0, 1, 2])
+        collection.remove(self.fixtures[0])
+        self.assertEqual(collection._sorted['id'], [0, 2])
+        self.assertEqual([item.id for item in collection.range('id')], [0, 2])
+        collection.reindex()
+        self.assertIsNone(collection._sorted['id'])
+        self.assertEqual([item.id for item in collection.range('id', 1)], [2])
+
+    def test_range_without_index(self):
+        """==> object_.range should scan items when field has no sorted index"""
+        self.assertEqual([item.id for item in self.collection.range('id', 2)], [2])
+
+    def test_indexes_valueerror(self):
+        """==> invalid index type should raise ValueError"""
+        with self.assertRaises(ValueError):
+            AbstractCollection(self.fixtures, 'name', {'email': 'btree'})
@@ -13,7 +13,7 @@
 from typing import Optional
 from unittest import TestCase
 
-from pyhelper.abstract_dto import AbstractDTO
+from pyhelper.abstract_dto import AbstractDTO, DTOMeta
 
 
 class FooBar(AbstractDTO):
@@ -39,6 +39,33 @@ class FooBar(AbstractDTO):
         self._bar = bar_
 
 
+class SlottedFooBar(AbstractDTO, metaclass=DTOMeta):
+    __fields__ = ('foo', 'bar')
+
+    def __init__(self, dictionary=None):
+        self._foo = None
+        self._bar = None
+        super().__init__(dictionary)
+
+    @property
+    def foo(self) -> Optional[str]:
+        return self._foo
+
+    @foo.setter
+    def foo(self, foo_: str) -> None:
+        if foo_ is not None and not isinstance(foo_, str):
+            raise TypeError('foo must be set to a string')
+        self._foo = foo_
+
+    @property
+    def bar(self) -> Optional[str]:
+        return self._bar
+
+    @bar.setter
+    def bar(self, bar_: str) -> None:
+        self._bar = bar_
+
+
 class AbstractDTOTest(TestCase):
     """
     AbstractDTOTest
@@ -141,3 +168,65 @@ class AbstractDTOTest(TestCase):
         """==> str(object_) should return expected value"""
         self.assertIsInstance(str(self.dto), str)
         self.assertEqual(str(self.dto), self.STRING)
+
+
+class DTOMetaTest(TestCase):
+    """
+    DTOMetaTest
+    """
+
+    FIXTURES = {
+        'bar': 'bar',
+        'foo': 'foo'
+    }
+
+    ##################################################
+
+    def setUp(self):
+        self.dto = SlottedFooBar(self.FIXTURES)
+
+    ##################################################
+
+    def test_slots(self):
+        """==> compiled object_ should not have __dict__"""
+        self.assertEqual(SlottedFooBar.__slots__, ('_bar', '_foo'))
+        self.assertFalse(hasattr(self.dto, '__dict__'))
+        with self.assertRaises(AttributeError):
+            self.dto.ping = 'pong'
+
+    def test_properties(self):
+        """==> compiled object_.__properties__ should return sorted fields"""
+        self.assertEqual(self.dto.__properties__, ['bar', 'foo'])
+
+    def test_setter_validation(self):
+        """==> compiled object_ should keep setter validation"""
+        with self.assertRaises(TypeError):
+            SlottedFooBar({'foo': 1})
+        with self.assertRaises(AttributeError):
+            SlottedFooBar({'ping': 'pong'})
+
+    def test_dunders(self):
+        """==> compiled dunders should behave like AbstractDTO ones"""
+        reference = FooBar(self.FIXTURES)
+        self.assertEqual(dict(self.dto), dict(reference))
+        self.assertEqual(list(self.dto), list(reference))
+        self.assertEqual(len(self.dto), len(reference))
+        self.assertEqual(hash(self.dto), hash(reference))
+        self.assertEqual(str(self.dto), str(reference))
+        self.assertTrue(bool(self.dto))
+        self.assertFalse(bool(SlottedFooBar({'foo': 'foo'})))
+        self.assertEqual(self.dto, SlottedFooBar(self.FIXTURES))
+        self.assertNotEqual(self.dto, SlottedFooBar({'foo': 'pong'}))
+        self.assertNotEqual(self.dto, reference)
+
+    def test_attributeerror_field_property(self):
+        """==> declared fields must be properties"""
+        with self.assertRaises(AttributeError):
+            class Invalid(AbstractDTO, metaclass=DTOMeta):
+                __fields__ = ('foo',)
+
+    def test_typeerror_base_slots(self):
+        """==> every base class must declare __slots__"""
+        with self.assertRaises(TypeError):
+            class Invalid(FooBar, metaclass=DTOMeta):
+                __fields__ = ('foo',)
@@ -77,3 +77,26 @@ class TestAnnotations(TestCase):
                          },
                              'foobar': {'string': str, 'return': Union[str, None]}
                          })
+
+    ##################################################
+
+    def test_cache_shared_by_class(self):
+        """==> introspection table should be computed once per class"""
+        Annotations.clear_cache()
+        Annotations(FooBar()).get_properties
+        self.assertIn(FooBar, Annotations._CACHE)
+        table = Annotations._CACHE[FooBar]
+        self.assertEqual(Annotations(FooBar()).get_methods, ['foobar'])
+        self.assertIs(Annotations._CACHE[FooBar], table)
+
+    def test_clear_cache(self):
+        """==> clear_cache should drop class introspection table"""
+        self.annotations.get_properties
+        Annotations.clear_cache(FooBar)
+        self.assertNotIn(FooBar, Annotations._CACHE)
+
+    def test_get_properties_instance_attribute(self):
+        """==> public instance attributes should be listed as properties"""
+        self.foobar.name = 'foobar'
+        self.assertEqual(self.annotations.get_properties, ['id', 'name'])
+        self.assertEqual(Annotations(FooBar()).get_properties, ['id'])
@@ -0,0 +1,142 @@
+#!/bin/python3
+# -*- coding: utf-8 -*-
+
+"""
+ This file is part of the TangoMan PyHelper package.
+
+ (c) "Matthias Morin" <mat@tangoman.io>
+
+ This source file is subject to the MIT license that is bundled
+ with this source code in the file LICENSE.
+"""
+
+from asyncio import run
+from http.server import (BaseHTTPRequestHandler, ThreadingHTTPServer)
+from threading import Thread
+from time import sleep
+from unittest import TestCase
+
+from pyhelper import AsyncSession
+
+
+class EchoHandler(BaseHTTPRequestHandler):
+    """Reply with request path and user agent, waiting for "?delay=" seconds when given"""
+
+    def do_GET(self):
+        if '?delay=' in self.path:
+            sleep(float(self.path.split('?delay=')[1]))
+        body = (self.path + '|' + self.headers.get('User-Agent', '')).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class AsyncSessionTest(TestCase):
+    """
+    AsyncSessionTest
+    """
+
+    # fixtures for "_test_typeerror" method
+    BOOLEANS = (True, False)
+    DICTIONARIES = ({'dictionary': True}, {})
+    FLOATS = (-3.0, -2.0, -1.0, 0.0, 1.0, 2.0, 3.0, -3.1, -2.1, -1.1, 0.1, 1.1, 2.1, 3.1)
+    INTEGERS = (-3, -2, -1, 0, 1, 2, 3)
+    LISTS = (['list'], [])
+    NULL = (None,)
+    STRINGS = ('string', '')
+
+    TEST_BOOLEAN = DICTIONARIES + FLOATS + INTEGERS + LISTS + NULL + STRINGS
+    TEST_INTEGER = BOOLEANS + DICTIONARIES + FLOATS + LISTS + NULL + STRINGS
+    TEST_STRING = BOOLEANS + DICTIONARIES + FLOATS + INTEGERS + LISTS + NULL
+
+    ##################################################
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(('127.0.0.1', 0), EchoHandler)
+        cls.server.daemon_threads = True
+        cls.uri = 'http://127.0.0.1:%d' % cls.server.server_address[1]
+        Thread(target=cls.server.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    ##################################################
+
+    def test_init_tor(self):
+        """==> tor must be set to a boolean"""
+        for value in self.TEST_BOOLEAN:
+            with self.assertRaises(TypeError):
+                AsyncSession(value)
+
+    def test_init_concurrency(self):
+        """==> concurrency must be set to a positive integer"""
+        for value in self.TEST_INTEGER:
+            with self.assertRaises(TypeError):
+                AsyncSession(concurrency=value)
+        with self.assertRaises(ValueError):
+            AsyncSession(concurrency=0)
+
+    ##################################################
+
+    def test_send_request(self):
+        """==> send_request should return response with random user agent"""
+        async def main():
+            async with AsyncSession() as session:
+                response = await session.send_request(self.uri + '/foobar')
+                return response.status, await response.text()
+
+        status, text = run(main())
+        self.assertEqual(status, 200)
+        path, user_agent = text.split('|')
+        self.assertEqual(path, '/foobar')
+        self.assertIn(user_agent, AsyncSession.USER_AGENTS)
+
+    def test_send_request_unreachable(self):
+        """==> send_request should return None on network error"""
+        async def main():
+            async with AsyncSession() as session:
+                return await session.send_request('http://127.0.0.1:1', timeout=1)
+
+        self.assertIsNone(run(main()))
+
+    def test_raise_typeerror_send_request_uri_string(self):
+        """==> uri must be set to a string"""
+        async def main(value):
+            async with AsyncSession() as session:
+                await session.send_request(value)
+
+        for value in self.TEST_STRING:
+            with self.assertRaises(TypeError):
+                run(main(value))
+
+    ##################################################
+
+    def test_send_requests_ordered(self):
+        """==> send_requests with ordered should yield responses in input order"""
+        uris = [f'{self.uri}/{index}?delay={0.05 if index % 2 else 0}' for index in range(20)]
+
+        async def main():
+            async with AsyncSession(concurrency=4) as session:
+                return [item async for item in session.send_requests(iter(uris), ordered=True)]
+
+        responses = run(main())
+        self.assertEqual([uri for uri, response in responses], uris)
+        for uri, response in responses:
+            self.assertEqual(response.status, 200)
+
+    def test_send_requests_completion_order(self):
+        """==> send_requests should yield fastest responses first"""
+        uris = [f'{self.uri}/slow?delay=0.5', f'{self.uri}/fast']
+
+        async def main():
+            async with AsyncSession(concurrency=2) as session:
+                return [uri async for uri, response in session.send_requests(uris, user_agents=['pyhelper'])]
+
+        self.assertEqual(run(main()), uris[::-1])
@@ -0,0 +1,154 @@
+#!/bin/python3
+# -*- coding: utf-8 -*-
+
+"""
+ This file is part of the TangoMan PyHelper package.
+
+ (c) "Matthias Morin" <mat@tangoman.io>
+
+ This source file is subject to the MIT license that is bundled
+ with this source code in the file LICENSE.
+"""
+
+from os import (chmod, listdir, rename, stat, umask)
+from os.path import join
+from tempfile import TemporaryDirectory
+from unittest import TestCase, skipIf
+
+from pyhelper import Compression
+from pyhelper.compression import zstandard
+
+
+class CompressionTest(TestCase):
+    """
+    CompressionTest
+    """
+
+    # fixtures for "_test_typeerror" method
+    BOOLEANS = (True, False)
+    DICTIONARIES = ({'dictionary': True}, {})
+    FLOATS = (-3.0, -2.0, -1.0, 0.0, 1.0, 2.0, 3.0, -3.1, -2.1, -1.1, 0.1, 1.1, 2.1, 3.1)
+    INTEGERS = (-3, -2, -1, 0, 1, 2, 3)
+    LISTS = (['list'], [])
+    NULL = (None,)
+
+    TEST_STRING = BOOLEANS + DICTIONARIES + FLOATS + INTEGERS + LISTS + NULL
+
+    TEXT = 'id,name\ntangoman,foobar\n'
+
+    ##################################################
+
+    def setUp(self):
+        self.temp_dir = TemporaryDirectory()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    ##################################################
+
+    def _round_trip(self, extension):
+        file_path = join(self.temp_dir.name, 'rows.csv' + extension)
+        with Compression.open(file_path, 'w', level=1) as file:
+            file.write(self.TEXT)
+        # magic bytes take precedence over extension
+        renamed = join(self.temp_dir.name, 'renamed.csv')
+        rename(file_path, renamed)
+        self.assertEqual(Compression.detect(renamed), Compression.EXTENSIONS[extension])
+        with Compression.open(renamed) as file:
+            self.assertEqual(file.read(), self.TEXT)
+
+    def test_gzip(self):
+        """==> gzip files should round trip"""
+        self._round_trip('.gz')
+
+    def test_bz2(self):
+        """==> bz2 files should round trip"""
+        self._round_trip('.bz2')
+
+    def test_xz(self):
+        """==> xz files should round trip"""
+        self._round_trip('.xz')
+
+    @skipIf(zstandard is None, 'zstandard not installed')
+    def test_zstd(self):
+        """==> zstd files should round trip"""
+        self._round_trip('.zst')
+
+    def test_atomic_open(self):
+        """==> atomic_open should compress by extension and keep target permissions"""
+        file_path = join(self.temp_dir.name, 'rows.csv.gz')
+        with Compression.atomic_open(file_path, level=1, buffering=1024) as file:
+            file.write(self.TEXT)
+        self.assertEqual(Compression.detect(file_path), 'gzip')
+        chmod(file_path, 0o640)
+        with Compression.atomic_open(file_path) as file:
+            file.write(self.TEXT * 2)
+        self.assertEqual(stat(file_path).st_mode & 0o777, 0o640)
+        with Compression.open(file_path) as file:
+            self.assertEqual(file.read(), self.TEXT * 2)
+
+    def test_atomic_open_umask(self):
+        """==> atomic_open new files should get default permissions without changing process umask"""
+        mask = umask(0o027)
+        try:
+            file_path = join(self.temp_dir.name, 'rows.csv')
+            with Compression.atomic_open(file_path) as file:
+                file.write(self.TEXT)
+            self.assertEqual(stat(file_path).st_mode & 0o777, 0o640)
+            self.assertEqual(umask(0o027), 0o027)
+        finally:
+            umask(mask)
+
+    def test_atomic_open_error(self):
+        """==> atomic_open should leave target untouched and remove temporary file on error"""
+        file_path = join(self.temp_dir.name, 'rows.csv')
+        with Compression.atomic_open(file_path) as file:
+            file.write(self.TEXT)
+        with self.assertRaises(RuntimeError):
+            with Compression.atomic_open(file_path) as file:
+                file.write('partial')
+                raise RuntimeError('crash')
+        with Compression.open(file_path) as file:
+            self.assertEqual(file.read(), self.TEXT)
+        self.assertEqual(listdir(self.temp_dir.name), ['rows.csv'])
+
+    def test_detect(self):
+        """==> detect should use extension for missing files and return None for plain files"""
+        self.assertEqual(Compression.detect('missing.jsonl.xz'), 'xz')
+        self.assertIsNone(Compression.detect('missing.json'))
+        file_path = join(self.temp_dir.name, 'plain.csv.gz')
+        with open(file_path, 'w') as file:
+            file.write(self.TEXT)
+        self.assertIsNone(Compression.detect(file_path))
+        # printable bz2 signature alone is not enough
+        with open(file_path, 'w') as file:
+            file.write('BZh1,name\n1,foo\n')
+        self.assertIsNone(Compression.detect(file_path))
+        with Compression.open(file_path, 'w', codec='bz2') as file:
+            pass
+        self.assertEqual(Compression.detect(file_path), 'bz2')
+
+    ##################################################
+
+    def test_typeerror_detect_file_path_string(self):
+        """==> detect file_path must be set to a string"""
+        for value in self.TEST_STRING:
+            with self.assertRaises(TypeError):
+                Compression.detect(value)
+
+    def test_valueerror_open(self):
+        """==> open mode and codec must be valid"""
+        file_path = join(self.temp_dir.name, 'rows.csv')
+        with self.assertRaises(ValueError):
+            Compression.open(file_path, 'rb')
+        with self.assertRaises(ValueError):
+            Compression.open(file_path, 'w', codec='zip')
+        with self.assertRaises(TypeError):
+            Compression.open(file_path, 'w', level='9')
+
+
+##################################################
+
+
+if __name__ == '__main__':
+    pass
@@ -10,9 +10,12 @@
  with this source code in the file LICENSE.
 """
 
-from unittest import TestCase
+from os.path import join
+from tempfile import TemporaryDirectory
+from unittest import TestCase, skipIf
 
 from pyhelper import CSV
+from pyhelper.csv import numpy
 
 
 class CSVTest(TestCase):
@@ -32,10 +35,198 @@ class CSVTest(TestCase):
     TEST_LIST = BOOLEANS + DICTIONARIES + FLOATS + INTEGERS + NULL + STRINGS
     TEST_STRING = BOOLEANS + DICTIONARIES + FLOATS + INTEGERS + LISTS + NULL
 
+    ROWS = [
+        {'id': '1', 'name': 'tangoman'},
+        {'id': '2', 'name': 'foobar'},
+        {'id': '3', 'name': 'pingpong'},
+    ]
+
     ##################################################
 
     def setUp(self):
         self.csv = CSV()
+        self.temp_dir = TemporaryDirectory()
+        self.file_path = join(self.temp_dir.name, 'rows.csv')
+        self.csv.write(self.ROWS, self.file_path)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    ##################################################
+
+    def test_read(self):
+        """==> read should return expected list"""
+        self.assertEqual(self.csv.read(self.file_path), self.ROWS)
+
+    ##################################################
+
+    def test_iter_rows(self):
+        """==> iter_rows should yield expected rows"""
+        rows = self.csv.iter_rows(self.file_path)
+        self.assertNotIsInstance(rows, list)
+        self.assertEqual(list(rows), self.ROWS)
+
+    def test_iter_rows_chunksize(self):
+        """==> iter_rows with chunksize should yield lists of rows"""
+        chunks = list(self.csv.iter_rows(self.file_path, chunksize=2))
+        self.assertEqual(chunks, [self.ROWS[0:2], self.ROWS[2:3]])
+
+    def test_typeerror_iter_rows_file_path_string(self):
+        """==> iter_rows file_path must be set to a string"""
+        for value in self.TEST_STRING:
+            with self.assertRaises(TypeError):
+                self.csv.iter_rows(value)
+
+    def test_typeerror_iter_rows_chunksize_integer(self):
+        """==> iter_rows chunksize must be set to an integer"""
+        for value in (True, 1.0, '1', [1]):
+            with self.assertRaises(TypeError):
+                self.csv.iter_rows(self.file_path, chunksize=value)
+
+    def test_valueerror_iter_rows_chunksize_positive(self):
+        """==> iter_rows chunksize must be positive integer"""
+        for value in (0, -1):
+            with self.assertRaises(ValueError):
+                self.csv.iter_rows(self.file_path, chunksize=value)
+
+    def test_read_schema(self):
+        """==> read with schema should return typed values"""
+        rows = self.csv.read(self.file_path, {'id': 'INTEGER NOT NULL'})
+        self.assertEqual(rows[0], {'id': 1, 'name': 'tangoman'})
+        rows = list(self.csv.iter_rows(self.file_path, schema={'id': 'REAL'}))
+        self.assertEqual(rows[2], {'id': 3.0, 'name': 'pingpong'})
+
+    def test_read_schema_empty_fields(self):
+        """==> read with schema should return None for empty fields"""
+        self.csv.write([{'id': '1', 'price': ''}, {'id': '', 'price': '2.5'}], self.file_path)
+        rows = self.csv.read(self.file_path, {'id': 'INTEGER', 'price': 'REAL'})
+        self.assertEqual(rows, [{'id': 1, 'price': None}, {'id': None, 'price': 2.5}])
+
+    def test_valueerror_read_schema_conversion(self):
+        """==> read with schema should raise ValueError on non numeric INTEGER field"""
+        with open(self.file_path, 'w') as file:
+            file.write('id,name\n1,a\nx,b\n')
+        with self.assertRaises(ValueError):
+            self.csv.read(self.file_path, {'id': 'INTEGER'})
+        with self.assertRaises(ValueError):
+            list(self.csv.iter_rows(self.file_path, schema={'id': 'INTEGER'}))
+
+    def test_read_columns(self):
+        """==> read_columns should return column oriented data"""
+        columns = self.csv.read_columns(self.file_path, {'id': 'INTEGER'})
+        self.assertEqual(columns, {'id': [1, 2, 3], 'name': ['tangoman', 'foobar', 'pingpong']})
+
+    def test_read_columns_header_only(self):
+        """==> read_columns should return empty columns from header only file"""
+        with open(self.file_path, 'w') as file:
+            file.write('id,name\n')
+        self.assertEqual(self.csv.read_columns(self.file_path, {'id': 'INTEGER'}), {'id': [], 'name': []})
+        self.assertEqual(self.csv.read(self.file_path), [])
+        if numpy is not None:
+            columns = self.csv.read_columns(self.file_path, {'id': 'INTEGER'}, arrays=True)
+            self.assertEqual([(name, len(values)) for name, values in columns.items()], [('id', 0), ('name', 0)])
+
+    @skipIf(numpy is None, 'numpy not installed')
+    def test_read_columns_arrays(self):
+        """==> read_columns with arrays should return numpy arrays"""
+        columns = self.csv.read_columns(self.file_path, {'id': 'INTEGER'}, arrays=True)
+        self.assertEqual(columns['id'].dtype, numpy.int64)
+        self.assertEqual(columns['id'].sum(), 6)
+        self.assertEqual(list(columns['name']), ['tangoman', 'foobar', 'pingpong'])
+
+    def test_valueerror_read_schema_datatype(self):
+        """==> schema datatype must be a sqlite datatype"""
+        with self.assertRaises(ValueError):
+            self.csv.read(self.file_path, {'id': 'NUMBER'})
+        with self.assertRaises(TypeError):
+            self.csv.read_columns(self.file_path, ['id'])
+
+    def test_read_parallel(self):
+        """==> read_parallel should split ranges on record boundaries, even inside quoted fields"""
+        rows = [{'id': str(i), 'text': f'line "{i}"\nnext, line' if i % 3 else 'plain'} for i in range(200)]
+        self.csv.write(rows, self.file_path)
+        chunks = list(self.csv.read_parallel(self.file_path, workers=2, range_size=64))
+        self.assertGreater(len(chunks), 1)
+        self.assertEqual([row for chunk in chunks for row in chunk], rows)
+        chunks = self.csv.read_parallel(self.file_path, workers=2, ordered=False, range_size=64)
+        self.assertCountEqual([row for chunk in chunks for row in chunk], rows)
+
+    def test_read_parallel_schema(self):
+        """==> read_parallel with schema should return typed values"""
+        chunks = list(self.csv.read_parallel(self.file_path, workers=1, schema={'id': 'INTEGER'}, range_size=1))
+        self.assertEqual([row['id'] for chunk in chunks for row in chunk], [1, 2, 3])
+
+    def test_typeerror_read_parallel(self):
+        """==> read_parallel parameters must be set to expected types"""
+        for value in self.TEST_STRING:
+            with self.assertRaises(TypeError):
+                self.csv.read_parallel(value)
+        with self.assertRaises(TypeError):
+            self.csv.read_parallel(self.file_path, workers='2')
+        with self.assertRaises(TypeError):
+            self.csv.read_parallel(self.file_path, ordered=None)
+        with self.assertRaises(ValueError):
+            self.csv.read_parallel(self.file_path, range_size=0)
+
+    def test_scan(self):
+        """==> scan should yield every row"""
+        rows = self.csv.scan(self.file_path)
+        self.assertNotIsInstance(rows, list)
+        self.assertEqual(list(rows), self.ROWS)
+
+    def test_scan_columns_where(self):
+        """==> scan should project columns and filter rows, quoted fields included"""
+        rows = [{'id': '1', 'name': 'foo, "bar"\nbaz', 'country': 'FR'},
+                {'id': '2', 'name': 'tangoman', 'country': 'US'},
+                {'id': '3', 'name': 'pingpong', 'country': 'FR'}]
+        self.csv.write(rows, self.file_path)
+        self.assertEqual(list(self.csv.scan(self.file_path, columns=['name'], where={'country': 'FR'})),
+                         [{'name': 'foo, "bar"\nbaz'}, {'name': 'pingpong'}])
+        self.assertEqual(list(self.csv.scan(self.file_path, ['id'], {'name': 'tangoman'})), [{'id': '2'}])
+        with self.assertRaises(KeyError):
+            list(self.csv.scan(self.file_path, ['unknown']))
+
+    def test_scan_multiline_fields(self):
+        """==> scan should match read on fields spanning many lines"""
+        rows = [{'id': '1', 'text': '"quoted"\n' * 1000}, {'id': '2', 'text': 'plain'}]
+        self.csv.write(rows, self.file_path)
+        self.assertEqual(list(self.csv.scan(self.file_path)), self.csv.read(self.file_path))
+        scanner = self.csv.scan(self.file_path)
+        self.assertEqual(next(scanner)['id'], '1')
+        scanner.close()
+
+    def test_typeerror_scan(self):
+        """==> scan parameters must be set to expected types"""
+        for value in self.TEST_STRING:
+            with self.assertRaises(TypeError):
+                self.csv.scan(value)
+        with self.assertRaises(TypeError):
+            self.csv.scan(self.file_path, columns='id')
+        with self.assertRaises(TypeError):
+            self.csv.scan(self.file_path, where={'id': 1})
+        with self.assertRaises(ValueError):
+            self.csv.scan(self.file_path, columns=[])
+
+    def test_compressed(self):
+        """==> csv files should be (de)compressed by extension"""
+        file_path = self.file_path + '.xz'
+        self.csv.write(self.ROWS, file_path, level=1)
+        self.assertEqual(self.csv.read(file_path), self.ROWS)
+        self.assertEqual(self.csv.read_columns(file_path, {'id': 'INTEGER'})['id'], [1, 2, 3])
+        with self.assertRaises(ValueError):
+            self.csv.scan(file_path)
+
+    def test_write_atomic(self):
+        """==> atomic write should replace file with complete data"""
+        self.csv.write(self.ROWS[0:1], self.file_path, atomic=True, buffer_size=8)
+        self.assertEqual(self.csv.read(self.file_path), self.ROWS[0:1])
+        with self.assertRaises(ValueError):
+            self.csv.write(self.ROWS, self.file_path, buffer_size=0)
+
+    def test_oserror_iter_rows_file_path_exists(self):
+        """==> iter_rows file_path must be set to an existing path"""
+        with self.assertRaises(OSError):
+            self.csv.iter_rows('non_existant.csv')
 
     ##################################################
 
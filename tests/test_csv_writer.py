@@ -0,0 +1,129 @@
+#!/bin/python3
+# -*- coding: utf-8 -*-
+
+"""
+ This file is part of the TangoMan PyHelper package.
+
+ (c) "Matthias Morin" <mat@tangoman.io>
+
+ This source file is subject to the MIT license that is bundled
+ with this source code in the file LICENSE.
+"""
+
+from os.path import join
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from pyhelper import CSV, CSVWriter
+
+
+class CSVWriterTest(TestCase):
+    """
+    CSVWriterTest
+    """
+
+    # fixtures for "_test_typeerror" method
+    BOOLEANS = (True, False)
+    DICTIONARIES = ({'dictionary': True}, {})
+    FLOATS = (-3.0, -2.0, -1.0, 0.0, 1.0, 2.0, 3.0, -3.1, -2.1, -1.1, 0.1, 1.1, 2.1, 3.1)
+    INTEGERS = (-3, -2, -1, 0, 1, 2, 3)
+    LISTS = (['list'], [])
+    NULL = (None,)
+
+    TEST_STRING = BOOLEANS + DICTIONARIES + FLOATS + INTEGERS + LISTS + NULL
+
+    ROWS = [
+        {'id': '1', 'name': 'tangoman'},
+        {'id': '2', 'name': 'foobar'},
+        {'id': '3', 'name': 'pingpong'},
+    ]
+
+    ##################################################
+
+    def setUp(self):
+        self.temp_dir = TemporaryDirectory()
+        self.file_path = join(self.temp_dir.name, 'rows.csv')
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    ##################################################
+
+    def test_write(self):
+        """==> rows written one at a time or in batches should be read back"""
+        with CSVWriter(self.file_path, flush_interval=1) as writer:
+            writer.write(self.ROWS[0])
+            self.assertEqual(CSV.read(self.file_path), self.ROWS[0:1])
+            self.assertEqual(writer.write_many(iter(self.ROWS[1:])), 2)
+        self.assertEqual(writer.count, 3)
+        self.assertEqual(writer.fieldnames, ['id', 'name'])
+        self.assertEqual(CSV.read(self.file_path), self.ROWS)
+
+    def test_write_fieldnames(self):
+        """==> explicit fieldnames should set column order"""
+        with CSVWriter(self.file_path, ['name', 'id']) as writer:
+            writer.write_many(self.ROWS)
+        with open(self.file_path) as file:
+            self.assertEqual(file.readline().strip(), 'name,id')
+        with self.assertRaises(ValueError):
+            with CSVWriter(self.file_path, ['id']) as writer:
+                writer.write(self.ROWS[0])
+
+    def test_append(self):
+        """==> append should keep existing rows and header"""
+        with CSVWriter(self.file_path + '.gz') as writer:
+            writer.write(self.ROWS[0])
+        with CSVWriter(self.file_path + '.gz', append=True) as writer:
+            writer.write_many(self.ROWS[1:])
+        self.assertEqual(CSV.read(self.file_path + '.gz'), self.ROWS)
+        with self.assertRaises(ValueError):
+            with CSVWriter(self.file_path + '.gz', ['name'], append=True) as writer:
+                writer.write({'name': 'foo'})
+
+    def test_empty(self):
+        """==> writer without rows should not create file"""
+        with CSVWriter(self.file_path):
+            pass
+        with self.assertRaises(OSError):
+            CSV.read(self.file_path)
+
+    def test_write_after_close(self):
+        """==> writing after close should raise without truncating file"""
+        writer = CSVWriter(self.file_path)
+        writer.write({'id': '1'})
+        writer.close()
+        with self.assertRaises(ValueError):
+            writer.write({'id': '2'})
+        with self.assertRaises(ValueError):
+            writer.write_many([{'id': '2'}])
+        self.assertEqual(CSV.read(self.file_path), [{'id': '1'}])
+
+    ##################################################
+
+    def test_typeerror_file_path_string(self):
+        """==> file_path must be set to a string"""
+        for value in self.TEST_STRING:
+            with self.assertRaises(TypeError):
+                CSVWriter(value)
+
+    def test_typeerror_write_row_dictionary(self):
+        """==> row must be set to a dictionary"""
+        with CSVWriter(self.file_path) as writer:
+            with self.assertRaises(TypeError):
+                writer.write(['1', 'tangoman'])
+            with self.assertRaises(TypeError):
+                writer.write_many(self.ROWS[0])
+
+    def test_valueerror_flush_interval_positive(self):
+        """==> flush_interval must be positive integer"""
+        with self.assertRaises(ValueError):
+            CSVWriter(self.file_path, flush_interval=0)
+        with self.assertRaises(ValueError):
+            CSVWriter(self.file_path, fieldnames=[])
+
+
+##################################################
+
+
+if __name__ == '__main__':
+    pass
@@ -10,7 +10,9 @@
  with this source code in the file LICENSE.
 """
 
-from os.path import dirname, isfile
+from os import makedirs, symlink
+from os.path import dirname, isfile, join
+from tempfile import TemporaryDirectory
 from unittest import TestCase
 
 from pyhelper import FolderManager
@@ -95,3 +97,63 @@ class FolderManagerTest(TestCase):
         self.folder_manager.extension = '.md'
         for file in self.folder_manager:
             self.assertTrue(file.endswith('.md'))
+
+    ##################################################
+
+    def _load_tree_fixture(self) -> TemporaryDirectory:
+        temp_dir = TemporaryDirectory()
+        for path in ('foo.md', 'bar.txt', 'a/foo.md', 'a/b/bar.csv', 'a/b/c/foobar.md'):
+            makedirs(dirname(join(temp_dir.name, path)), exist_ok=True)
+            open(join(temp_dir.name, path), 'w').close()
+        return temp_dir
+
+    def test_walk(self):
+        """==> object_.walk should yield every file recursively"""
+        with self._load_tree_fixture() as temp_dir:
+            folder_manager = FolderManager(temp_dir)
+            walker = folder_manager.walk()
+            self.assertNotIsInstance(walker, list)
+            files = sorted(file[len(temp_dir) + 1:] for file in walker)
+            self.assertEqual(files, ['a/b/bar.csv', 'a/b/c/foobar.md', 'a/foo.md', 'bar.txt', 'foo.md'])
+
+    def test_walk_with_filters(self):
+        """==> object_.walk should filter by extensions and glob patterns"""
+        with self._load_tree_fixture() as temp_dir:
+            folder_manager = FolderManager(temp_dir)
+            self.assertEqual(len(list(folder_manager.walk(('.csv', '.txt')))), 2)
+            self.assertEqual(len(list(folder_manager.walk(pattern='foo*'))), 3)
+            self.assertEqual(len(list(folder_manager.walk('.md', pattern='foobar*'))), 1)
+
+    def test_walk_max_depth(self):
+        """==> object_.walk should not go deeper than max_depth"""
+        with self._load_tree_fixture() as temp_dir:
+            folder_manager = FolderManager(temp_dir)
+            self.assertEqual(len(list(folder_manager.walk(max_depth=0))), 2)
+            self.assertEqual(len(list(folder_manager.walk(max_depth=1))), 3)
+
+    def test_walk_follow_symlinks_loop(self):
+        """==> object_.walk following symlinks should visit each folder once"""
+        with self._load_tree_fixture() as temp_dir:
+            symlink(temp_dir, join(temp_dir, 'a', 'up'))
+            folder_manager = FolderManager(temp_dir)
+            files = sorted(file[len(temp_dir) + 1:] for file in folder_manager.walk(follow_symlinks=True))
+            self.assertEqual(files, ['a/b/bar.csv', 'a/b/c/foobar.md', 'a/foo.md', 'bar.txt', 'foo.md'])
+
+    def test_walk_typeerror(self):
+        """==> object_.walk should raise TypeError"""
+        with self.assertRaises(TypeError):
+            self.folder_manager.walk(extension=b'.md')
+        with self.assertRaises(TypeError):
+            self.folder_manager.walk(max_depth='1')
+
+    def test_walk_valueerror(self):
+        """==> object_.walk should raise ValueError"""
+        with self.assertRaises(ValueError):
+            self.folder_manager.walk(pattern=())
+        with self.assertRaises(ValueError):
+            self.folder_manager.walk(max_depth=-1)
+
+    def test_files_getter_recursive(self):
+        """==> object_.files with recursive should return expected list"""
+        with self._load_tree_fixture() as temp_dir:
+            self.assertEqual(len(FolderManager(temp_dir).files('.md', recursive=True)), 3)
@@ -10,6 +10,9 @@
  with this source code in the file LICENSE.
 """
 
+from os import listdir
+from os.path import join
+from tempfile import TemporaryDirectory
 from unittest import TestCase
 
 from pyhelper import Json
@@ -34,8 +37,111 @@ class JsonTest(TestCase):
 
     ##################################################
 
+    RECORDS = [
+        {'id': 1, 'name': 'tangoman'},
+        {'id': 2, 'name': 'foobar'},
+        ['pingpong', None],
+    ]
+
+    ##################################################
+
     def setUp(self):
         self.json = Json()
+        self.temp_dir = TemporaryDirectory()
+        self.file_path = join(self.temp_dir.name, 'records.jsonl')
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    ##################################################
+
+    def test_write_read(self):
+        """==> read should return written data"""
+        self.json.write(self.RECORDS, self.file_path)
+        self.assertEqual(self.json.read(self.file_path), self.RECORDS)
+
+    ##################################################
+
+    def test_write_lines_iter_lines(self):
+        """==> iter_lines should yield records written by write_lines"""
+        count = self.json.write_lines(iter(self.RECORDS), self.file_path)
+        self.assertEqual(count, 3)
+        with open(self.file_path) as file:
+            self.assertEqual(len(file.readlines()), 3)
+        lines = self.json.iter_lines(self.file_path)
+        self.assertNotIsInstance(lines, list)
+        self.assertEqual(list(lines), self.RECORDS)
+
+    def test_write_lines_append(self):
+        """==> write_lines with append should keep existing records"""
+        self.json.write_lines(self.RECORDS[0:1], self.file_path)
+        self.json.write_lines(self.RECORDS[1:], self.file_path, append=True)
+        self.assertEqual(list(self.json.iter_lines(self.file_path, buffer_size=16)), self.RECORDS)
+
+    def test_compressed(self):
+        """==> read, write and JSON Lines streams should (de)compress by extension"""
+        file_path = self.file_path + '.gz'
+        self.json.write(self.RECORDS, file_path, level=1)
+        self.assertEqual(self.json.read(file_path), self.RECORDS)
+        self.json.write_lines(self.RECORDS[0:1], file_path)
+        self.json.write_lines(self.RECORDS[1:], file_path, append=True)
+        self.assertEqual(list(self.json.iter_lines(file_path)), self.RECORDS)
+
+    def test_read_truncated(self):
+        """==> read should raise codec errors from truncated files"""
+        file_path = self.file_path + '.gz'
+        self.json.write(self.RECORDS, file_path, level=1)
+        with open(file_path, 'rb') as file:
+            data = file.read()
+        with open(file_path, 'wb') as file:
+            file.write(data[:len(data) // 2])
+        with self.assertRaises(EOFError):
+            self.json.read(file_path)
+
+    def test_write_atomic(self):
+        """==> atomic write should replace file only when complete"""
+        file_path = join(self.temp_dir.name, 'records.json')
+        self.json.write(self.RECORDS, file_path, atomic=True, buffer_size=16)
+        self.assertEqual(self.json.read(file_path), self.RECORDS)
+        with self.assertRaises(TypeError):
+            self.json.write([{'id': 3}, {'id': object()}], file_path, atomic=True)
+        self.assertEqual(self.json.read(file_path), self.RECORDS)
+        self.assertEqual(listdir(self.temp_dir.name), ['records.json'])
+
+    def test_valueerror_write_buffer_size(self):
+        """==> write buffer_size must be positive integer"""
+        with self.assertRaises(ValueError):
+            self.json.write(self.RECORDS, self.file_path, buffer_size=0)
+        with self.assertRaises(TypeError):
+            self.json.write(self.RECORDS, self.file_path, atomic=1)
+
+    def test_iter_lines_skip_blank_lines(self):
+        """==> iter_lines should skip blank lines"""
+        with open(self.file_path, 'w') as file:
+            file.write('{"id": 1}\n\n{"id": 2}\n')
+        self.assertEqual(list(self.json.iter_lines(self.file_path)), [{'id': 1}, {'id': 2}])
+
+    def test_typeerror_iter_lines_file_path_string(self):
+        """==> iter_lines file_path must be set to a string"""
+        for value in self.TEST_STRING:
+            with self.assertRaises(TypeError):
+                self.json.iter_lines(value)
+
+    def test_oserror_iter_lines_file_path_exists(self):
+        """==> iter_lines file_path must be set to an existing path"""
+        with self.assertRaises(OSError):
+            self.json.iter_lines('non_existant.jsonl')
+
+    def test_typeerror_write_lines_data_iterable(self):
+        """==> write_lines data must be set to an iterable"""
+        for value in self.BOOLEANS + self.DICTIONARIES + self.FLOATS + self.INTEGERS + self.NULL + self.STRINGS:
+            with self.assertRaises(TypeError):
+                self.json.write_lines(value, self.file_path)
+
+    def test_valueerror_write_lines_buffer_size(self):
+        """==> write_lines buffer_size must be positive integer"""
+        with self.assertRaises(ValueError):
+            self.json.write_lines(self.RECORDS, self.file_path, buffer_size=0)
 
     ##################################################
 
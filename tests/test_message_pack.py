@@ -0,0 +1,85 @@
+#!/bin/python3
+# -*- coding: utf-8 -*-
+
+"""
+ This file is part of the TangoMan PyHelper package.
+
+ (c) "Matthias Morin" <mat@tangoman.io>
+
+ This source file is subject to the MIT license that is bundled
+ with this source code in the file LICENSE.
+"""
+
+from unittest import TestCase, skipIf
+
+from pyhelper import MessagePack
+from pyhelper.message_pack import msgpack
+
+
+class MessagePackTest(TestCase):
+    """
+    MessagePackTest
+    """
+
+    VALUES = (
+        None, True, False,
+        0, 127, 128, 255, 256, 65535, 65536, 2 ** 32, 2 ** 64 - 1,
+        -1, -32, -33, -128, -129, -2 ** 31 - 1, -2 ** 63,
+        1.5, -0.25,
+        '', 'tangoman', 'a' * 32, 'é' * 200, 'x' * 70000,
+        b'', b'\x00' * 300,
+        [], [1] * 15, [1] * 16, list(range(70000)),
+        {}, {str(key): key for key in range(16)}, {'foo': {'bar': [1, {'ping': None}]}},
+    )
+
+    ##################################################
+
+    def test_pack_unpack(self):
+        """==> pure python codec should round trip values"""
+        for value in self.VALUES:
+            self.assertEqual(MessagePack.unpack(MessagePack.pack(value, pure=True), pure=True), value)
+        self.assertEqual(MessagePack.unpack(MessagePack.pack((1, 2), pure=True), pure=True), [1, 2])
+
+    def test_pack_smallest_encoding(self):
+        """==> pack should use smallest encoding"""
+        self.assertEqual(MessagePack.pack(1, pure=True), b'\x01')
+        self.assertEqual(MessagePack.pack(-1, pure=True), b'\xff')
+        self.assertEqual(MessagePack.pack(256, pure=True), b'\xcd\x01\x00')
+        self.assertEqual(MessagePack.pack({'a': None}, pure=True), b'\x81\xa1a\xc0')
+
+    @skipIf(msgpack is None, 'msgpack not installed')
+    def test_pack_native(self):
+        """==> pure python codec should match msgpack C codec"""
+        for value in self.VALUES:
+            self.assertEqual(MessagePack.pack(value, pure=True), MessagePack.pack(value))
+            self.assertEqual(MessagePack.unpack(MessagePack.pack(value)), value)
+
+    def test_iter_unpack(self):
+        """==> iter_unpack should yield concatenated values"""
+        data = b''.join(MessagePack.pack(value, pure=True) for value in self.VALUES)
+        self.assertEqual(list(MessagePack.iter_unpack(data, pure=True)), list(self.VALUES))
+
+    ##################################################
+
+    def test_typeerror_pack(self):
+        """==> pack should raise TypeError on unsupported types"""
+        for value in ({1, 2}, object()):
+            with self.assertRaises(TypeError):
+                MessagePack.pack(value, pure=True)
+        with self.assertRaises(OverflowError):
+            MessagePack.pack(2 ** 64, pure=True)
+
+    def test_valueerror_unpack(self):
+        """==> unpack should raise ValueError on invalid data"""
+        for value in (b'', b'\xcd\x01', b'\x01\x02', b'\xc1'):
+            with self.assertRaises(ValueError):
+                MessagePack.unpack(value, pure=True)
+        with self.assertRaises(TypeError):
+            MessagePack.unpack('data')
+
+
+##################################################
+
+
+if __name__ == '__main__':
+    pass
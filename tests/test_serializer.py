@@ -13,6 +13,7 @@
 from typing import Optional
 from unittest import TestCase
 
+from pyhelper.annotations import Annotations
 from pyhelper.serializer import Serializer
 
 
@@ -146,3 +147,114 @@ class SerializerTest(TestCase):
         """==> object_.denormalize should raise ValueError"""
         with self.assertRaises(ValueError):
             self.serializer.denormalize({})
+
+    ##################################################
+    # Test Compiled
+    ##################################################
+
+    def test_compiled(self):
+        """==> compiled serializer should behave as default serializer"""
+        serializer = Serializer(self.serializer.object, compiled=True)
+        self.assertEqual(serializer.normalize(), self.FIXTURES)
+        self.assertEqual(serializer.serialize(), self.STRING)
+        self.assertEqual(serializer.denormalize({'foo': 'ping'}).foo, 'ping')
+        self.assertEqual(serializer.normalize(), {'bar': 'bar', 'foo': 'ping'})
+        with self.assertRaises(AttributeError):
+            serializer.denormalize({'foo': 'foo', 'ping': 'pong'})
+        self.assertEqual(serializer.object.foo, 'ping')
+        with self.assertRaises(TypeError):
+            Serializer(self.serializer.object, compiled=1)
+
+    def test_compiled_field_names(self):
+        """==> compiled serializer should handle fields which are not valid identifiers"""
+        class Ping(FooBar):
+            pass
+        for field in ('ping-pong', 'class'):
+            setattr(Ping, field, property(lambda self, field=field: self.__dict__.get('_' + field),
+                                          lambda self, value, field=field: self.__dict__.update({'_' + field: value})))
+        serializer = Serializer(Ping(), compiled=True)
+        serializer.denormalize({'ping-pong': 'ping', 'class': 'pong'})
+        self.assertEqual(serializer.normalize(), {'bar': None, 'class': 'pong', 'foo': None, 'ping-pong': 'ping'})
+
+    def test_compiled_clear_cache(self):
+        """==> Annotations.clear_cache should drop compiled plans built on introspection tables"""
+        class Ping(FooBar):
+            pass
+        object_ = Ping()
+        self.assertEqual(Serializer(object_, compiled=True).normalize(), {'bar': None, 'foo': None})
+        Ping.ping = property(lambda self: 'pong')
+        Annotations.clear_cache(Ping)
+        self.assertEqual(Serializer(object_, compiled=True).normalize(), {'bar': None, 'foo': None, 'ping': 'pong'})
+        Ping.pong = property(lambda self: 'ping')
+        Serializer.clear_cache()
+        Annotations.clear_cache()
+        self.assertEqual(Serializer(object_, compiled=True).normalize()['pong'], 'ping')
+
+    ##################################################
+    # Test Batch
+    ##################################################
+
+    def test_serialize_many(self):
+        """==> Serializer.serialize_many should return json array or newline-delimited json"""
+        objects = [self.serializer.object, Serializer(FooBar()).denormalize({'foo': 'ping'})]
+        self.assertEqual(Serializer.serialize_many(objects), f'[{self.STRING}, {{"bar": null, "foo": "ping"}}]')
+        self.assertEqual(Serializer.serialize_many(iter(objects), lines=True),
+                         f'{self.STRING}\n{{"bar": null, "foo": "ping"}}\n')
+        self.assertEqual(Serializer.serialize_many([]), '[]')
+
+    def test_serialize_many_instance_attributes(self):
+        """==> Serializer batch and compiled methods should handle attributes set on some instances only"""
+        first = Serializer(FooBar()).denormalize({'foo': 'ping'})
+        first.extra = 'pong'
+        second = self.serializer.object
+        expected = [{'bar': None, 'extra': 'pong', 'foo': 'ping'}, self.FIXTURES]
+        self.assertEqual(list(Serializer.normalize_many([first, second])), expected)
+        self.assertEqual(list(Serializer.normalize_many([second, first])), expected[::-1])
+        self.assertEqual(Serializer(second, compiled=True).normalize(), self.FIXTURES)
+        self.assertEqual(Serializer(first, compiled=True).denormalize({'extra': 'pang'}).extra, 'pang')
+        with self.assertRaises(AttributeError):
+            Serializer(second, compiled=True).denormalize({'extra': 'pang'})
+
+    def test_deserialize_many(self):
+        """==> Serializer.deserialize_many should return new objects"""
+        objects = Serializer.deserialize_many(f'[{self.STRING}, {{"foo": "ping"}}]', FooBar)
+        self.assertEqual([type(object_) for object_ in objects], [FooBar, FooBar])
+        self.assertEqual(Serializer(objects[1]).normalize(), {'bar': None, 'foo': 'ping'})
+        objects = Serializer.deserialize_many(f'{self.STRING}\n\n{self.STRING}\n', FooBar, lines=True)
+        self.assertEqual([Serializer(object_).normalize() for object_ in objects], [self.FIXTURES] * 2)
+
+    def test_deserialize_many_errors(self):
+        """==> Serializer.deserialize_many should raise expected errors"""
+        with self.assertRaises(AttributeError):
+            Serializer.deserialize_many('[{"ping": "pong"}]', FooBar)
+        with self.assertRaises(TypeError):
+            Serializer.deserialize_many(self.STRING, FooBar)
+        with self.assertRaises(TypeError):
+            Serializer.deserialize_many('[]', 'FooBar')
+        with self.assertRaises(ValueError):
+            Serializer.deserialize_many('', FooBar)
+        with self.assertRaises(TypeError):
+            Serializer.serialize_many(self.serializer.object)
+
+    ##################################################
+    # Test MessagePack format
+    ##################################################
+
+    def test_serialize_msgpack(self):
+        """==> msgpack format should round trip normalized dictionaries"""
+        data = self.serializer.serialize(format='msgpack')
+        self.assertIsInstance(data, bytes)
+        self.assertLess(len(data), len(self.STRING))
+        self.assertEqual(Serializer(FooBar()).deserialize(data, format='msgpack').foo, 'foo')
+        with self.assertRaises(TypeError):
+            self.serializer.deserialize(self.STRING, format='msgpack')
+        with self.assertRaises(ValueError):
+            self.serializer.serialize(format='xml')
+
+    def test_serialize_many_msgpack(self):
+        """==> msgpack format should round trip object lists"""
+        objects = [self.serializer.object] * 3
+        for lines in (False, True):
+            data = Serializer.serialize_many(objects, lines=lines, format='msgpack')
+            objects_ = Serializer.deserialize_many(data, FooBar, lines=lines, format='msgpack')
+            self.assertEqual([Serializer(object_).normalize() for object_ in objects_], [self.FIXTURES] * 3)
@@ -10,11 +10,30 @@
  with this source code in the file LICENSE.
 """
 
+from http.server import (BaseHTTPRequestHandler, ThreadingHTTPServer)
+from threading import Thread
+from time import sleep
 from unittest import TestCase
 
 from pyhelper import Session
 
 
+class EchoHandler(BaseHTTPRequestHandler):
+    """Reply with request path and user agent, waiting for "?delay=" seconds when given"""
+
+    def do_GET(self):
+        if '?delay=' in self.path:
+            sleep(float(self.path.split('?delay=')[1]))
+        body = (self.path + '|' + self.headers.get('User-Agent', '')).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
 class SessionTest(TestCase):
     """
     SessionTest
@@ -49,6 +68,20 @@ class SessionTest(TestCase):
 
     ##################################################
 
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(('127.0.0.1', 0), EchoHandler)
+        cls.server.daemon_threads = True
+        cls.uri = 'http://127.0.0.1:%d' % cls.server.server_address[1]
+        Thread(target=cls.server.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    ##################################################
+
     def setUp(self):
         self.session = Session()
 
@@ -114,3 +147,49 @@ class SessionTest(TestCase):
         for value in self.TEST_BOOLEAN:
             with self.assertRaises(TypeError):
                 self.session.send_request('string', allow_redirects=value)
+
+    ##################################################
+
+    def test_send_requests_ordered(self):
+        """==> send_requests with ordered should yield responses in input order"""
+        uris = [f'{self.uri}/{index}?delay={0.05 if index % 2 else 0}' for index in range(10)]
+        responses = list(self.session.send_requests(iter(uris), concurrency=4, ordered=True))
+        self.assertEqual([uri for uri, response in responses], uris)
+        for uri, response in responses:
+            self.assertEqual(response.status_code, 200)
+            path, user_agent = response.text.split('|')
+            self.assertTrue(uri.endswith(path))
+            self.assertIn(user_agent, Session.USER_AGENTS)
+
+    def test_send_requests_completion_order(self):
+        """==> send_requests should yield fastest responses first"""
+        uris = [f'{self.uri}/slow?delay=0.5', f'{self.uri}/fast']
+        responses = list(self.session.send_requests(uris, concurrency=2))
+        self.assertEqual([uri for uri, response in responses], uris[::-1])
+
+    def test_send_requests_user_agents(self):
+        """==> send_requests should use given user_agents"""
+        responses = self.session.send_requests([self.uri] * 3, user_agents=['pyhelper'])
+        for uri, response in responses:
+            self.assertEqual(response.text.split('|')[1], 'pyhelper')
+
+    def test_send_requests_keeps_adapters(self):
+        """==> send_requests should not replace session adapters"""
+        session = Session(pool_size=4)
+        adapter = session.session.get_adapter(self.uri)
+        self.assertEqual(adapter._pool_maxsize, 4)
+        list(session.send_requests([self.uri] * 3, concurrency=2))
+        self.assertIs(session.session.get_adapter(self.uri), adapter)
+        with self.assertRaises(ValueError):
+            Session(pool_size=0)
+
+    def test_raise_typeerror_send_requests_uris_iterable(self):
+        """==> uris must be set to an iterable"""
+        for value in self.BOOLEANS + self.FLOATS + self.INTEGERS + self.NULL + self.STRINGS:
+            with self.assertRaises(TypeError):
+                self.session.send_requests(value)
+
+    def test_raise_valueerror_send_requests_concurrency_positive_integer(self):
+        """==> concurrency must be positive integer"""
+        with self.assertRaises(ValueError):
+            self.session.send_requests([self.uri], concurrency=0)
@@ -10,8 +10,10 @@
  with this source code in the file LICENSE.
 """
 
+from os.path import join
 from sqlite3 import IntegrityError
 from sqlite3 import OperationalError
+from tempfile import TemporaryDirectory
 from unittest import TestCase
 
 from pyhelper import Sqlite
@@ -86,6 +88,83 @@ class SqliteTest(TestCase):
 
     ##################################################
 
+    def test_insert_many(self):
+        """==> Insert many returns inserted row count"""
+        items = ({'id': None, 'email': f'user{index}@example.com'} for index in range(25))
+        count = self.db.insert_many('users', items, batch_size=10)
+        self.assertEqual(count, 25)
+        self.assertEqual(self.db.find('users', {'id': 25}), [(25, 'user24@example.com')])
+
+    def test_insert_many_rollback_failed_batch(self):
+        """==> Insert many rolls back the failing batch only (rollback requires a journal)"""
+        self.db.close()
+        self.db = Sqlite(journal_mode='memory')
+        self.db.create('users', self.MOCK_SCHEMA)
+        items = [{'id': 1, 'email': 'foo@example.com'}, {'id': 2, 'email': 'bar@example.com'},
+                 {'id': 3, 'email': 'baz@example.com'}, {'id': 3, 'email': 'baz@example.com'}]
+        with self.assertRaises(IntegrityError):
+            self.db.insert_many('users', items, batch_size=2)
+        self.assertEqual(self.db.find('users', {'id': 2}), [(2, 'bar@example.com')])
+        self.assertEqual(self.db.find('users', {'id': 3}), [])
+
+
+    def test_insert_many_keeps_caller_transaction(self):
+        """==> Insert many inside open transaction rolls back failing batch only, leaving transaction open"""
+        self.db.close()
+        self.db = Sqlite(autocommit=False, journal_mode='memory')
+        self.db.create('users', self.MOCK_SCHEMA)
+        self.db.insert('users', {'id': 1, 'email': 'foo@example.com'})
+        with self.assertRaises(IntegrityError):
+            self.db.insert_many('users', [{'id': 2, 'email': 'bar@example.com'}, {'id': 2, 'email': 'bar@example.com'}])
+        self.assertTrue(self.db.connection.in_transaction)
+        self.assertEqual(self.db.find('users', {'id': 1}), [(1, 'foo@example.com')])
+        self.assertEqual(self.db.find('users', {'id': 2}), [])
+        self.assertEqual(self.db.delete_many('users', 'id', [1]), 1)
+        self.assertTrue(self.db.connection.in_transaction)
+        self.db.connection.rollback()
+        self.assertEqual(self.db.find('users', {'id': 1}), [])
+
+    ##################################################
+
+    def test_upsert_many(self):
+        """==> Upsert many inserts new rows and updates conflicting ones"""
+        self.db.insert_many('users', [{'id': 1, 'email': 'foo@example.com'}, {'id': 2, 'email': 'bar@example.com'}])
+        items = [{'id': 2, 'email': 'pong@example.com'}, {'id': 3, 'email': 'ping@example.com'}]
+        self.assertEqual(self.db.upsert_many('users', iter(items), 'id', batch_size=1), 2)
+        self.assertEqual(self.db.find('users', {'id': 2}), [(2, 'pong@example.com')])
+        self.assertEqual(self.db.find('users', {'id': 3}), [(3, 'ping@example.com')])
+        self.assertEqual(self.db.find('users', {'id': 1}), [(1, 'foo@example.com')])
+
+    def test_upsert_many_do_nothing(self):
+        """==> Upsert many ignores conflicts when every column is a conflict column"""
+        self.db.create('tags', {'name': 'TEXT PRIMARY KEY'})
+        self.db.upsert_many('tags', [{'name': 'foo'}, {'name': 'foo'}, {'name': 'bar'}], ['name'])
+        self.assertEqual(len(self.db.find('tags', {'name': 'foo'})), 1)
+
+    def test_typeerror_upsert_many_conflict_columns(self):
+        """==> upsert_many conflict_columns must be set to a string or a list of strings"""
+        for value in self.BOOLEANS + self.DICTIONARIES + self.FLOATS + self.INTEGERS + self.NULL:
+            with self.assertRaises(TypeError):
+                self.db.upsert_many('users', [{'id': 1, 'email': 'foo@example.com'}], value)
+
+    ##################################################
+
+    def test_delete_many(self):
+        """==> Delete many returns deleted row count"""
+        self.db.insert_many('users', ({'id': None, 'email': f'user{index}@example.com'} for index in range(10)))
+        count = self.db.delete_many('users', 'id', (index for index in range(1, 8)), chunk_size=3)
+        self.assertEqual(count, 7)
+        self.assertEqual(self.db.find('users', {'id': 7}), [])
+        self.assertEqual(self.db.find('users', {'id': 8}), [(8, 'user7@example.com')])
+
+    def test_typeerror_delete_many_values_iterable(self):
+        """==> delete_many values must be set to an iterable"""
+        for value in self.BOOLEANS + self.DICTIONARIES + self.FLOATS + self.INTEGERS + self.NULL + self.STRINGS:
+            with self.assertRaises(TypeError):
+                self.db.delete_many('users', 'id', value)
+
+    ##################################################
+
     def test_find(self):
         """==> Find returns correct item"""
         lastrowid = self.db.insert('users', {'id': None, 'email': 'foobar@example.com'})
@@ -99,6 +178,93 @@ class SqliteTest(TestCase):
         item = self.db.find('users', {'id': 666})
         self.assertEqual(item, [])
 
+    def test_find_native_type(self):
+        """==> Find binds value with its native type"""
+        self.db.create('foobar', {'id': 'INTEGER', 'foo': 'TEXT'})
+        self.db.connection.execute('CREATE INDEX foobar_id ON foobar (id)')
+        self.db.insert('foobar', {'id': 1, 'foo': 'foo'})
+        self.assertEqual(self.db.find('foobar', {'id': 1}), [(1, 'foo')])
+        plan = self.db.connection.execute('EXPLAIN QUERY PLAN SELECT * FROM foobar WHERE id=?', (1,)).fetchall()
+        self.assertIn('USING INDEX foobar_id', plan[0][-1])
+
+    ##################################################
+
+    def test_find_multiple_keys(self):
+        """==> Find matches every given key"""
+        self.db.create('foobar', self.DUMMY_SCHEMA)
+        self.db.insert_many('foobar', [{'id': None, 'foo': 'foo', 'bar': 'bar'},
+                                       {'id': None, 'foo': 'foo', 'bar': 'pong'},
+                                       {'id': None, 'foo': 'ping', 'bar': 'bar'}])
+        self.assertEqual(self.db.find('foobar', {'foo': 'foo', 'bar': 'bar'}), [(1, 'foo', 'bar')])
+
+    def test_find_order_by_limit(self):
+        """==> Find sorts and limits rows"""
+        self.db.insert_many('users', ({'id': None, 'email': 'foobar@example.com'} for _ in range(5)))
+        rows = self.db.find('users', {'email': 'foobar@example.com'}, order_by='-id', limit=2)
+        self.assertEqual(rows, [(5, 'foobar@example.com'), (4, 'foobar@example.com')])
+        rows = self.db.find('users', {'email': 'foobar@example.com'}, order_by=['email', 'id'], limit=1)
+        self.assertEqual(rows, [(1, 'foobar@example.com')])
+
+    def test_create_index_explain(self):
+        """==> Find should use created index"""
+        self.assertNotIn('INDEX', ' '.join(self.db.explain('users', {'email': 'foobar@example.com'})))
+        name = self.db.create_index('users', 'email')
+        self.assertEqual(name, 'users_email_index')
+        plan = self.db.explain('users', {'email': 'foobar@example.com'})
+        self.assertIn('INDEX users_email_index', plan[0])
+
+    def test_create_index_unique(self):
+        """==> Unique index should raise IntegrityError on duplicates"""
+        self.db.create_index('users', ['email'], unique=True)
+        self.db.insert('users', {'id': None, 'email': 'foobar@example.com'})
+        with self.assertRaises(IntegrityError):
+            self.db.insert('users', {'id': None, 'email': 'foobar@example.com'})
+
+    def test_typeerror_find_limit_integer(self):
+        """==> find limit must be set to an integer"""
+        for value in self.TEST_NULLABLE_INTEGER:
+            with self.assertRaises(TypeError):
+                self.db.find('users', {'id': 1}, limit=value)
+
+    def test_typeerror_create_index_columns(self):
+        """==> create_index columns must be set to a string or a list of strings"""
+        for value in self.BOOLEANS + self.DICTIONARIES + self.FLOATS + self.INTEGERS + self.NULL:
+            with self.assertRaises(TypeError):
+                self.db.create_index('users', value)
+
+    ##################################################
+
+    def test_iter_find(self):
+        """==> iter_find yields matching rows as dictionaries"""
+        self.db.insert_many('users', ({'id': None, 'email': 'foobar@example.com'} for _ in range(25)))
+        self.db.insert('users', {'id': None, 'email': 'pingpong@example.com'})
+        rows = self.db.iter_find('users', {'email': 'foobar@example.com'}, chunk_size=10)
+        self.assertNotIsInstance(rows, list)
+        rows = list(rows)
+        self.assertEqual(len(rows), 25)
+        self.assertEqual(rows[0], {'id': 1, 'email': 'foobar@example.com'})
+
+    def test_iter_find_row_factory(self):
+        """==> iter_find yields row_factory results"""
+        self.db.insert('users', {'id': None, 'email': 'foobar@example.com'})
+        rows = self.db.iter_find('users', {'id': 1}, row_factory=lambda cursor, row: row[1])
+        self.assertEqual(list(rows), ['foobar@example.com'])
+
+    def test_iter_find_interleaved(self):
+        """==> iter_find should not be reset by other operations"""
+        self.db.insert_many('users', ({'id': None, 'email': 'foobar@example.com'} for _ in range(5)))
+        count = 0
+        for row in self.db.iter_find('users', {'email': 'foobar@example.com'}, chunk_size=2):
+            self.db.find('users', {'id': row['id']})
+            count += 1
+        self.assertEqual(count, 5)
+
+    def test_typeerror_iter_find_chunk_size_integer(self):
+        """==> iter_find chunk_size must be set to an integer"""
+        for value in self.TEST_INTEGER:
+            with self.assertRaises(TypeError):
+                self.db.iter_find('users', {'id': 1}, chunk_size=value)
+
     ##################################################
 
     def test_insert_into_multiple_tables(self):
@@ -129,12 +295,88 @@ class SqliteTest(TestCase):
 
     ##################################################
 
+    def test_delete_multiple_keys(self):
+        """==> Delete matches every given key"""
+        self.db.insert('users', {'id': 1, 'email': 'foobar@example.com'})
+        self.db.insert('users', {'id': 2, 'email': 'foobar@example.com'})
+        self.db.delete('users', {'id': 1, 'email': 'foobar@example.com'})
+        self.assertEqual(self.db.find('users', {'email': 'foobar@example.com'}), [(2, 'foobar@example.com')])
+
+    ##################################################
+
     def test_delete_nonexistant(self):
         """==> delete nonexistent doesnot raise error"""
         self.db.delete('users', {'id': 666})
 
     ##################################################
 
+    def test_sql_cache(self):
+        """==> Generated sql is built once per operation, table and columns"""
+        self.db.sql_cache_clear()
+        for index in range(10):
+            self.db.insert('users', {'id': None, 'email': f'user{index}@example.com'})
+            self.db.find('users', {'id': index})
+        info = self.db.sql_cache_info()
+        self.assertEqual(info['misses'], 2)
+        self.assertEqual(info['hits'], 18)
+        self.assertEqual(info['currsize'], 2)
+
+    def test_sql_cache_size(self):
+        """==> Generated sql cache is bounded"""
+        db = Sqlite(sql_cache_size=1)
+        db.create('users', self.MOCK_SCHEMA)
+        db.insert('users', {'id': None, 'email': 'foobar@example.com'})
+        self.assertEqual(db.find('users', {'id': 1}), [(1, 'foobar@example.com')])
+        self.assertEqual(db.sql_cache_info()['currsize'], 1)
+        db.close()
+
+    def test_init_sql_cache_size(self):
+        """==> sql_cache_size must be set to a positive integer"""
+        for value in self.TEST_INTEGER:
+            with self.assertRaises(TypeError):
+                Sqlite(sql_cache_size=value)
+        with self.assertRaises(ValueError):
+            Sqlite(sql_cache_size=-1)
+
+    ##################################################
+
+    def test_journal_mode_default(self):
+        """==> journal_mode should default to off"""
+        with TemporaryDirectory() as temp_dir:
+            db = Sqlite(join(temp_dir, 'default.db'))
+            self.assertEqual(db.settings()['journal_mode'], 'off')
+            db.close()
+
+    def test_profile(self):
+        """==> profile should apply every pragma"""
+        with TemporaryDirectory() as temp_dir:
+            for profile, pragmas in Sqlite.PROFILES.items():
+                db = Sqlite(join(temp_dir, profile + '.db'), profile=profile)
+                settings = db.settings()
+                for pragma, value in pragmas.items():
+                    if pragma == 'mmap_size' and settings[pragma] != value:
+                        # mmap_size is capped by SQLITE_MAX_MMAP_SIZE compile time option
+                        continue
+                    self.assertEqual(settings[pragma], value)
+                db.close()
+
+    def test_profile_journal_mode_override(self):
+        """==> journal_mode should override profile one"""
+        with TemporaryDirectory() as temp_dir:
+            db = Sqlite(join(temp_dir, 'durable.db'), journal_mode='delete', profile='durable')
+            self.assertEqual(db.settings()['journal_mode'], 'delete')
+            self.assertEqual(db.settings()['synchronous'], 'full')
+            db.close()
+
+    def test_profile_valueerror(self):
+        """==> unknown profile should raise ValueError"""
+        with self.assertRaises(ValueError):
+            Sqlite(profile='foobar')
+        with self.assertRaises(ValueError):
+            self.db.apply_profile('foobar')
+
+    ##################################################
+
     def test_sanitize(self):
         """==> sanitize method returns expected string"""
         self.assertEqual(self.db.sanitize('!"#$%\'()*+,-/:;=@[\\]`{|}~'), '')
@@ -171,6 +413,27 @@ class SqliteTest(TestCase):
 
     ##################################################
 
+    def test_valueerror_insert_many_empty_items(self):
+        """==> insert_many items cannot be empty"""
+        for value in ([], [{}]):
+            with self.assertRaises(ValueError):
+                self.db.insert_many('users', value)
+
+    def test_typeerror_insert_many_items_iterable(self):
+        """==> insert_many items must be set to an iterable of dictionaries"""
+        for value in self.BOOLEANS + self.DICTIONARIES + self.FLOATS + self.INTEGERS + self.NULL + self.STRINGS:
+            with self.assertRaises(TypeError):
+                self.db.insert_many('users', value)
+
+    def test_typeerror_insert_many_batch_size_integer(self):
+        """==> insert_many batch_size must be set to an integer"""
+        item = {'id': None, 'email': 'foobar@example.com'}
+        for value in self.TEST_INTEGER:
+            with self.assertRaises(TypeError):
+                self.db.insert_many('users', [item], batch_size=value)
+
+    ##################################################
+
     def test_valueerror_find_empty_data(self):
         """==> find data cannot be empty"""
         with self.assertRaises(ValueError):
@@ -0,0 +1,111 @@
+#!/bin/python3
+# -*- coding: utf-8 -*-
+
+"""
+ This file is part of the TangoMan PyHelper package.
+
+ (c) "Matthias Morin" <mat@tangoman.io>
+
+ This source file is subject to the MIT license that is bundled
+ with this source code in the file LICENSE.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from os.path import join
+from sqlite3 import OperationalError
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from pyhelper import SqlitePool
+
+
+class SqlitePoolTest(TestCase):
+    """
+    SqlitePoolTest
+    """
+
+    MOCK_SCHEMA = {
+        'id': 'INTEGER NOT NULL PRIMARY KEY AUTOINCREMENT UNIQUE',
+        'email': 'TEXT NOT NULL'
+    }
+
+    ##################################################
+
+    def setUp(self):
+        self.temp_dir = TemporaryDirectory()
+        self.pool = SqlitePool(join(self.temp_dir.name, 'pool.db'), size=2, timeout=1)
+        with self.pool.writer() as db:
+            db.create('users', self.MOCK_SCHEMA)
+            db.insert_many('users', ({'id': None, 'email': f'user{index}@example.com'} for index in range(100)))
+
+    def tearDown(self):
+        self.pool.close()
+        self.temp_dir.cleanup()
+
+    ##################################################
+
+    def test_journal_mode(self):
+        """==> pool should open database in wal mode"""
+        with self.pool.reader() as db:
+            self.assertEqual(db.connection.execute('pragma journal_mode').fetchone(), ('wal',))
+
+    def test_reader_from_threads(self):
+        """==> readers should be usable from other threads"""
+        def find(index):
+            with self.pool.reader() as db:
+                return db.find('users', {'id': index})
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(find, range(1, 101)))
+        self.assertEqual(results[41], [(42, 'user41@example.com')])
+        self.assertLessEqual(self.pool._opened, 2)
+
+    def test_reader_query_only(self):
+        """==> readers should not write"""
+        with self.pool.reader() as db:
+            with self.assertRaises(OperationalError):
+                db.insert('users', {'id': None, 'email': 'foobar@example.com'})
+
+    def test_reader_timeout(self):
+        """==> busy pool should raise TimeoutError"""
+        pool = SqlitePool(join(self.temp_dir.name, 'pool.db'), size=1, timeout=0.01)
+        with pool.reader():
+            with self.assertRaises(TimeoutError):
+                with pool.reader():
+                    pass
+        pool.close()
+
+    def test_writer_serialized(self):
+        """==> writes from many threads should be serialized"""
+        def insert(index):
+            with self.pool.writer() as db:
+                return db.insert('users', {'id': None, 'email': f'thread{index}@example.com'})
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            ids = list(executor.map(insert, range(50)))
+        self.assertEqual(sorted(ids), list(range(101, 151)))
+
+    ##################################################
+
+    def test_writer_rollback_on_error(self):
+        """==> writer should roll back transaction left open by a failing borrower"""
+        pool = SqlitePool(join(self.temp_dir.name, 'pool.db'), autocommit=False, timeout=1)
+        with self.assertRaises(RuntimeError):
+            with pool.writer() as db:
+                db.insert('users', {'id': None, 'email': 'partial@example.com'})
+                raise RuntimeError('crash')
+        with pool.writer() as db:
+            self.assertFalse(db.connection.in_transaction)
+            self.assertEqual(db.find('users', {'email': 'partial@example.com'}), [])
+        pool.close()
+
+    def test_valueerror_memory_database(self):
+        """==> db_file cannot be ":memory:" """
+        with self.assertRaises(ValueError):
+            SqlitePool(':memory:')
+
+    def test_typeerror_size_integer(self):
+        """==> size must be set to an integer"""
+        for value in (True, 1.0, '1', None):
+            with self.assertRaises(TypeError):
+                SqlitePool(join(self.temp_dir.name, 'pool.db'), size=value)